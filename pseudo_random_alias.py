@@ -0,0 +1,498 @@
+##  program name:
+##  "pseudo_random_alias.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Weighted choice: loaded dice,
+##  weighted decks, and lists of
+##  millions of outcomes each with
+##  its own chance.
+##
+##  Walking down the list adding up
+##  weights until a random number
+##  is passed takes k steps for k
+##  outcomes. Walker's ALIAS METHOD
+##  (as laid out by Vose) does the
+##  work once, up front, and then
+##  every draw takes the same two
+##  small steps however long the
+##  list is.
+##
+##  Think of k columns, all of the
+##  same height (the average
+##  weight). Each outcome starts in
+##  its own column; outcomes taller
+##  than the average pour their
+##  extra into the gaps on top of
+##  the short ones, so that every
+##  column ends up full and holds
+##  at most TWO outcomes: its own,
+##  up to height prob[i], and one
+##  other, its "alias", above that.
+##  A draw is then
+##
+##    i = a column, every one
+##        equally likely
+##    u = a float in [0,1)
+##    the answer is i if u is below
+##    prob[i], otherwise alias[i]
+##
+##  The columns are filled in one
+##  go, not round by round. Line
+##  the gaps of the
+##  short columns up end to end,
+##  and the extras of the tall ones
+##  up end to end beside them (both
+##  add up to the same total). Each
+##  gap is filled from the tall
+##  column its start lines up with.
+##  The last gap charged to a tall
+##  column can run past the end of
+##  that column's extra; the tall
+##  column then has a gap of its
+##  own, just that big, which is
+##  filled from the NEXT tall
+##  column. Two running sums and
+##  two sorted searches: the same
+##  few passes over the columns
+##  whatever the weights.
+##  NumPy does it a whole array at
+##  a time; without NumPy the same
+##  steps on lists give the same
+##  table.
+####################################
+##  A FEW WEIGHTS CHANGE
+##
+##  "update()" does not build the
+##  table again. An outcome whose
+##  weight went DOWN keeps its place
+##  in the table, but a draw that
+##  lands on it is only kept with
+##  chance new / old (otherwise the
+##  whole draw starts over). The
+##  extra of an outcome whose weight
+##  went UP goes in a small second
+##  table of its own, drawn from in
+##  proportion to its total. The
+##  answers come out with exactly
+##  the new weights.
+##
+##  Once the thrown-back share gets
+##  big, or the second table gets
+##  long, the whole table is built
+##  again (which pays for itself
+##  over the updates before it).
+####################################
+
+import math
+import time
+from itertools import accumulate
+from bisect import bisect_left
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; without it the table is
+    np = None        ##  kept in lists and draws come one at a time.
+
+from pseudo_random_generator import LfsrGenerator
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Build the whole table again once this share of it is thrown
+##  back by "update()" ...
+flt_ALIAS_MAX_WASTE = 0.25
+
+##  ... or once the table of raised weights holds more than
+##  this many outcomes plus the square root of k.
+int_ALIAS_MIN_OVERFLOW = 64
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_check_weights(lst_weights):
+    ##  Float copy of the weights (NumPy array or list) and their
+    ##  total. Raises ValueError unless they are all finite, none
+    ##  is below 0 and they are not all 0.
+
+    if np is not None:
+        arr_weights = np.array(lst_weights,dtype=np.float64).ravel()
+        if not np.all(np.isfinite(arr_weights)) or np.any(arr_weights < 0):
+            raise ValueError("weights must be finite and 0 or more")
+        flt_total = math.fsum(arr_weights.tolist())
+    else:
+        arr_weights = [float(flt_weight) for flt_weight in lst_weights]
+        if not all(0.0 <= flt_weight < math.inf
+                   for flt_weight in arr_weights):
+            raise ValueError("weights must be finite and 0 or more")
+        flt_total = math.fsum(arr_weights)
+
+    if not flt_total > 0.0:
+        raise ValueError("weights must not all be 0")
+    if math.isinf(flt_total):
+        raise ValueError("weights add up to more than a float can hold")
+
+    return (arr_weights,flt_total)
+
+######################################################
+######################################################
+
+def fnc_alias_build(arr_weights,flt_total):
+    ##  (prob, alias) for the weights, as NumPy float64 and int64
+    ##  arrays (lists without NumPy), filled in one pass as
+    ##  described at the top.
+
+    int_k = len(arr_weights)
+    flt_scale = int_k / flt_total
+    if np is not None:
+        arr_height = arr_weights * flt_scale
+        arr_prob = np.ones(int_k)
+        arr_alias = np.arange(int_k,dtype=np.int64)
+        arr_short = np.flatnonzero(arr_height < 1.0)
+        arr_tall = np.flatnonzero(~(arr_height < 1.0))
+        if len(arr_short) == 0 or len(arr_tall) == 0:
+            return (arr_prob,arr_alias)
+
+        arr_gap_end = np.cumsum(1.0 - arr_height[arr_short])
+        arr_gap_start = np.concatenate(([0.0],arr_gap_end[:-1]))
+        arr_extra_end = np.cumsum(arr_height[arr_tall] - 1.0)
+
+        ##  Short columns: filled from the tall column their start
+        ##  lines up with (the last one for rounding left-overs)
+        arr_from = np.searchsorted(arr_extra_end,arr_gap_start,
+                                   side="right").clip(0,len(arr_tall) - 1)
+        arr_prob[arr_short] = arr_height[arr_short]
+        arr_alias[arr_short] = arr_tall[arr_from]
+
+        ##  Tall columns: the last gap charged to one can run past
+        ##  the end of its extra; the overrun comes out of its own
+        ##  column, which the next tall column fills
+        arr_charged = np.searchsorted(arr_gap_start,arr_extra_end[:-1],
+                                      side="left")
+        arr_reach = np.where(arr_charged > 0,
+                             arr_gap_end[np.maximum(arr_charged - 1,0)],0.0)
+        arr_over = np.flatnonzero(arr_reach > arr_extra_end[:-1])
+        arr_prob[arr_tall[arr_over]] = 1.0 - (arr_reach[arr_over]
+                                              - arr_extra_end[arr_over])
+        arr_alias[arr_tall[arr_over]] = arr_tall[arr_over + 1]
+        return (arr_prob,arr_alias)
+
+    lst_height = [flt_weight * flt_scale for flt_weight in arr_weights]
+    lst_prob = [1.0] * int_k
+    lst_alias = list(range(int_k))
+    lst_short = [int_i for int_i in range(int_k) if lst_height[int_i] < 1.0]
+    lst_tall = [int_i for int_i in range(int_k)
+                if not lst_height[int_i] < 1.0]
+    if not lst_short or not lst_tall:
+        return (lst_prob,lst_alias)
+
+    lst_gap_end = list(accumulate(1.0 - lst_height[int_i]
+                                  for int_i in lst_short))
+    lst_gap_start = [0.0] + lst_gap_end[:-1]
+    lst_extra_end = list(accumulate(lst_height[int_i] - 1.0
+                                    for int_i in lst_tall))
+    for int_s,int_i in enumerate(lst_short):
+        int_from = min(bisect_right(lst_extra_end,lst_gap_start[int_s]),
+                       len(lst_tall) - 1)
+        lst_prob[int_i] = lst_height[int_i]
+        lst_alias[int_i] = lst_tall[int_from]
+    for int_t in range(len(lst_tall) - 1):
+        int_charged = bisect_left(lst_gap_start,lst_extra_end[int_t])
+        flt_reach = lst_gap_end[int_charged - 1] if int_charged else 0.0
+        if flt_reach > lst_extra_end[int_t]:
+            lst_prob[lst_tall[int_t]] = 1.0 - (flt_reach
+                                               - lst_extra_end[int_t])
+            lst_alias[lst_tall[int_t]] = lst_tall[int_t + 1]
+
+    return (lst_prob,lst_alias)
+
+######################################################
+######################################################
+
+def fnc_uniform_columns(obj_random,int_k,int_count):
+    ##  NumPy int64 array of "int_count" draws 0 through int_k-1,
+    ##  every one equally likely: just enough bits for int_k-1 and
+    ##  the ones that come out too big are drawn again.
+
+    int_width = (int_k - 1).bit_length()
+    arr_columns = obj_random.getbits_array(int_width,int_count) \
+        .astype(np.int64)
+    arr_again = np.flatnonzero(arr_columns >= int_k)
+    while len(arr_again):
+        arr_columns[arr_again] = obj_random.getbits_array(int_width,
+                                                          len(arr_again))
+        arr_again = arr_again[arr_columns[arr_again] >= int_k]
+
+    return arr_columns
+
+######################################################
+######################################################
+##                                                  ##
+##                  C L A S S E S                   ##
+##                                                  ##
+######################################################
+######################################################
+
+class AliasTable:
+    ##  Draws 0 .. k-1 with chances in proportion to "weights".
+    ##
+    ##  int_k          - number of outcomes
+    ##  weights        - current weights (NumPy array or list)
+    ##  flt_total      - their total
+    ##  prob, alias    - the table (see the notes at the top)
+    ##  flt_table_total - total of the weights the table was
+    ##                   built from
+    ##  flt_kept       - how much of that is still kept after
+    ##                   "update()" lowered some weights
+    ##  accept         - per outcome, the chance a draw landing on
+    ##                   it is kept (None until "update()")
+    ##  dict_built     - outcome -> weight when the table was built,
+    ##                   for the outcomes changed since
+    ##  dict_extra     - outcome -> weight above that, for the
+    ##                   outcomes raised since
+    ##  obj_overflow   - AliasTable of dict_extra (None if empty),
+    ##                   lst_overflow its outcomes in order
+
+    def __init__(self,weights):
+
+        self.weights,self.flt_total = fnc_check_weights(weights)
+        self.int_k = len(self.weights)
+        self.rebuild()
+
+    ##################################################
+
+    def __len__(self):
+        return self.int_k
+
+    ##################################################
+
+    def rebuild(self):
+        ##  Build the table from the current weights, dropping
+        ##  everything "update()" had layered on top.
+
+        self.flt_total = math.fsum(self.weights.tolist() if np is not None
+                                   else self.weights)
+        self.prob,self.alias = fnc_alias_build(self.weights,self.flt_total)
+        self.flt_table_total = self.flt_total
+        self.flt_kept = self.flt_total
+        self.accept = None
+        self.dict_built = {}
+        self.dict_extra = {}
+        self.flt_extra_total = 0.0
+        self.obj_overflow = None
+        self.lst_overflow = []
+
+    ##################################################
+
+    def probability(self,int_i):
+        ##  Chance of outcome int_i with the current weights.
+
+        return float(self.weights[int_i]) / self.flt_total
+
+    ##################################################
+
+    def update(self,dict_weights):
+        ##  Give the outcomes in {outcome: new weight} their new
+        ##  weights without building the whole table again (unless
+        ##  too much has changed since it was last built).
+
+        for int_i,flt_weight in dict_weights.items():
+            if not 0 <= int_i < self.int_k:
+                raise ValueError("outcome must be 0 through "
+                                 + str(self.int_k - 1))
+            if not 0.0 <= flt_weight < math.inf:
+                raise ValueError("weights must be finite and 0 or more")
+
+        ##  Check the new total before any weight is changed, so an
+        ##  update that is turned down leaves the table as it was.
+        ##  Only an update that takes away over half the weight and
+        ##  adds none can leave them all 0; that case is checked on a
+        ##  copy of the weights.
+        flt_old = sum(float(self.weights[int_i]) for int_i in dict_weights)
+        flt_new = sum(float(flt_weight)
+                      for flt_weight in dict_weights.values())
+        if math.isinf(self.flt_total - flt_old + flt_new):
+            raise ValueError("weights add up to more than a float can hold")
+        if not flt_new > 0.0 \
+                and not self.flt_total - flt_old > 0.5 * self.flt_total:
+            lst_weights = self.weights.copy() if np is not None \
+                else list(self.weights)
+            for int_i,flt_weight in dict_weights.items():
+                lst_weights[int_i] = float(flt_weight)
+            fnc_check_weights(lst_weights)
+
+        if self.accept is None:
+            self.accept = np.ones(self.int_k) if np is not None \
+                else [1.0] * self.int_k
+
+        for int_i,flt_weight in dict_weights.items():
+            flt_weight = float(flt_weight)
+            flt_built = self.dict_built.setdefault(int_i,
+                                                   float(self.weights[int_i]))
+            self.weights[int_i] = flt_weight
+            self.flt_kept -= flt_built * self.accept[int_i]
+            if flt_weight <= flt_built:
+                self.accept[int_i] = flt_weight / flt_built \
+                    if flt_built > 0.0 else 1.0
+                self.dict_extra.pop(int_i,None)
+            else:
+                self.accept[int_i] = 1.0
+                self.dict_extra[int_i] = flt_weight - flt_built
+            self.flt_kept += flt_built * self.accept[int_i]
+
+        self.flt_extra_total = math.fsum(self.dict_extra.values())
+        self.flt_total = self.flt_kept + self.flt_extra_total
+        if self.flt_kept < (1.0 - flt_ALIAS_MAX_WASTE) * self.flt_table_total \
+                or len(self.dict_extra) > int_ALIAS_MIN_OVERFLOW \
+                + math.isqrt(self.int_k):
+            self.weights = fnc_check_weights(self.weights)[0]
+            self.rebuild()
+        elif self.dict_extra:
+            self.lst_overflow = sorted(self.dict_extra)
+            self.obj_overflow = AliasTable([self.dict_extra[int_i]
+                                            for int_i in self.lst_overflow])
+        else:
+            self.lst_overflow = []
+            self.obj_overflow = None
+
+    ##################################################
+
+    def draw(self,obj_random):
+        ##  One outcome, drawn with an "LfsrGenerator".
+
+        flt_table_total = self.flt_table_total
+        while True:
+            if self.obj_overflow is not None and obj_random.random() \
+                    * (flt_table_total + self.flt_extra_total) \
+                    >= flt_table_total:
+                return self.lst_overflow[self.obj_overflow.draw(obj_random)]
+            int_i = obj_random.randbelow_bits(self.int_k)
+            if obj_random.random() >= self.prob[int_i]:
+                int_i = int(self.alias[int_i])
+            if self.accept is None or self.accept[int_i] >= 1.0 \
+                    or obj_random.random() < self.accept[int_i]:
+                return int_i
+
+    ##################################################
+
+    def draw_array(self,obj_random,int_count):
+        ##  NumPy int64 array of "int_count" outcomes. A draw thrown
+        ##  back by "update()" is drawn again at the end of the batch,
+        ##  so this is not the same as "draw()" called over and over.
+
+        if np is None:
+            raise ImportError("draw_array() needs NumPy")
+
+        arr_out = np.empty(int_count,dtype=np.int64)
+        arr_pending = np.arange(int_count)
+        flt_table_total = self.flt_table_total
+        while len(arr_pending):
+            if self.obj_overflow is not None:
+                arr_over = obj_random.random_array(len(arr_pending)) \
+                    * (flt_table_total + self.flt_extra_total) \
+                    >= flt_table_total
+                arr_out[arr_pending[arr_over]] = \
+                    np.array(self.lst_overflow)[
+                        self.obj_overflow.draw_array(obj_random,
+                                                     int(arr_over.sum()))]
+                arr_pending = arr_pending[~arr_over]
+            int_pending = len(arr_pending)
+            arr_columns = fnc_uniform_columns(obj_random,self.int_k,
+                                              int_pending)
+            arr_u = obj_random.random_array(int_pending)
+            arr_draws = np.where(arr_u < self.prob[arr_columns],arr_columns,
+                                 self.alias[arr_columns])
+            if self.accept is None:
+                arr_out[arr_pending] = arr_draws
+                break
+            arr_accept = self.accept[arr_draws]
+            arr_kept = arr_accept >= 1.0
+            arr_check = np.flatnonzero(~arr_kept)
+            arr_kept[arr_check] = obj_random.random_array(len(arr_check)) \
+                < arr_accept[arr_check]
+            arr_out[arr_pending[arr_kept]] = arr_draws[arr_kept]
+            arr_pending = arr_pending[~arr_kept]
+
+        return arr_out
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  A loaded die, then a million outcomes: build, draw and
+    ##  change a few weights.
+
+    obj_random = LfsrGenerator(61,None,2026)
+
+    print("*******************************************************")
+    print("A die loaded towards six (weights 1,1,1,1,1,3):")
+    obj_die = AliasTable([1,1,1,1,1,3])
+    lst_counts = [0] * 6
+    for int_i in range(80000):
+        lst_counts[obj_die.draw(obj_random)] += 1
+    for int_face in range(6):
+        print("  face %d: %6d  expected %6.0f"
+              % (int_face + 1,lst_counts[int_face],
+                 80000 * obj_die.probability(int_face)))
+
+    int_k = 1000000
+    lst_weights = [1.0 + (int_i * 7919) % 1000 for int_i in range(int_k)]
+    print("*******************************************************")
+    flt_start = time.perf_counter()
+    obj_table = AliasTable(lst_weights)
+    print("%d outcomes: table built in %.2f s"
+          % (int_k,time.perf_counter() - flt_start))
+
+    for str_name,lst_shape in (("one 0, rest 1",[0.0] + [1.0] * (int_k - 1)),
+                               ("all equal",[1.0] * int_k)):
+        flt_start = time.perf_counter()
+        AliasTable(lst_shape)
+        print("%d outcomes, %s: table built in %.2f s"
+              % (int_k,str_name,time.perf_counter() - flt_start))
+
+    flt_start = time.perf_counter()
+    for int_i in range(100000):
+        obj_table.draw(obj_random)
+    print("draw():       %12.0f draws/s"
+          % (100000 / (time.perf_counter() - flt_start)))
+    if np is not None:
+        flt_start = time.perf_counter()
+        obj_table.draw_array(obj_random,10000000)
+        print("draw_array(): %12.0f draws/s"
+              % (10000000 / (time.perf_counter() - flt_start)))
+
+    flt_start = time.perf_counter()
+    for int_i in range(200):
+        obj_table.update({(int_i * 104729) % int_k: 0.5 + int_i % 3 * 800.0})
+    print("200 updates:  %.4f s" % (time.perf_counter() - flt_start))
+    obj_table.update({17: 5000000.0})
+    int_hits = sum(obj_table.draw(obj_random) == 17 for int_i in range(200000))
+    print("outcome 17 after update: %d of 200000, expected %.0f"
+          % (int_hits,200000 * obj_table.probability(17)))
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
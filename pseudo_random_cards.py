@@ -0,0 +1,217 @@
+##  program name:
+##  "pseudo_random_cards.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Playing cards as small integers.
+##
+##  "fnc_get_card_deck" in the
+##  examples builds 52 strings with
+##  if/elif chains every time it is
+##  called, and "fnc_shuffle" then
+##  moves those strings about
+##  between two "dummy" bookends.
+##  Here a card is ONE BYTE:
+##
+##    card = 13 * suit + (value-1)
+##
+##    suit  0 Spades    1 Clubs
+##          2 Diamonds  3 Hearts
+##    value 1 (Ace) .. 13 (King)
+##
+##  the same order "fnc_get_card_deck"
+##  puts them in, so card c here is
+##  item c+1 of that list. A deck is
+##  a "bytearray" (or a NumPy uint8
+##  array) of 52 of these, a shoe of
+##  6 or 8 decks is 312 or 416 bytes,
+##  and names are only looked up (in
+##  tpl_CARD_NAMES, built once) when
+##  cards are shown to someone.
+##
+##  The deck and shoe templates are
+##  built once. A fresh deck is ONE
+##  buffer copy of the template, and
+##  shuffling moves bytes in place
+##  ("LfsrGenerator.shuffle()").
+##  "fnc_shuffled_shoes_array()"
+##  shuffles a whole batch of shoes
+##  at once, one row each.
+####################################
+
+import time
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; the "_array" functions
+    np = None        ##  need it.
+
+from pseudo_random_generator import LfsrGenerator
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+int_CARDS_PER_SUIT = 13
+int_CARDS_PER_DECK = 52
+
+##  Names as "fnc_get_card_deck" spells them: " A Spades",
+##  "10 Hearts", ...
+tpl_SUIT_NAMES = (" Spades"," Clubs"," Diamonds"," Hearts")
+tpl_VALUE_NAMES = (" A"," 2"," 3"," 4"," 5"," 6"," 7"," 8"," 9","10",
+                   " J"," Q"," K")
+tpl_CARD_NAMES = tuple(str_value + str_suit for str_suit in tpl_SUIT_NAMES
+                       for str_value in tpl_VALUE_NAMES)
+
+##  One deck in order, and shoes of several decks built from it
+##  (by number of decks) the first time they are asked for.
+bytes_DECK_TEMPLATE = bytes(range(int_CARDS_PER_DECK))
+dict_SHOE_TEMPLATES = {1: bytes_DECK_TEMPLATE}
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_card_suit(int_card):
+    ##  0 Spades, 1 Clubs, 2 Diamonds, 3 Hearts.
+
+    return int_card // int_CARDS_PER_SUIT
+
+######################################################
+######################################################
+
+def fnc_card_value(int_card):
+    ##  1 (Ace) through 13 (King).
+
+    return 1 + int_card % int_CARDS_PER_SUIT
+
+######################################################
+######################################################
+
+def fnc_card_names(cards):
+    ##  List of names for a bytearray, bytes, list or NumPy array of
+    ##  cards.
+
+    if np is not None and isinstance(cards,np.ndarray):
+        cards = cards.tolist()
+
+    return [tpl_CARD_NAMES[int_card] for int_card in cards]
+
+######################################################
+######################################################
+
+def fnc_shoe_template(int_decks=1):
+    ##  "int_decks" decks in order, one after the other, as bytes.
+
+    if int_decks < 1:
+        raise ValueError("a shoe needs at least one deck")
+    if int_decks not in dict_SHOE_TEMPLATES:
+        dict_SHOE_TEMPLATES[int_decks] = bytes_DECK_TEMPLATE * int_decks
+
+    return dict_SHOE_TEMPLATES[int_decks]
+
+######################################################
+######################################################
+
+def fnc_new_shoe(int_decks=1):
+    ##  A fresh, unshuffled deck (or shoe) as a bytearray: one
+    ##  copy of the template.
+
+    return bytearray(fnc_shoe_template(int_decks))
+
+######################################################
+######################################################
+
+def fnc_new_shoe_array(int_decks=1):
+    ##  A fresh, unshuffled deck (or shoe) as a NumPy uint8 array.
+
+    if np is None:
+        raise ImportError("fnc_new_shoe_array() needs NumPy")
+
+    return np.frombuffer(fnc_shoe_template(int_decks),dtype=np.uint8).copy()
+
+######################################################
+######################################################
+
+def fnc_shuffled_shoe(obj_random,int_decks=1):
+    ##  A fresh deck (or shoe) as a bytearray, shuffled in place.
+
+    arr_shoe = fnc_new_shoe(int_decks)
+    obj_random.shuffle(arr_shoe)
+
+    return arr_shoe
+
+######################################################
+######################################################
+
+def fnc_shuffled_shoes_array(obj_random,int_count,int_decks=1):
+    ##  NumPy uint8 array of shape (int_count, 52*int_decks): a
+    ##  separately shuffled shoe in every row.
+
+    if np is None:
+        raise ImportError("fnc_shuffled_shoes_array() needs NumPy")
+
+    arr_template = np.frombuffer(fnc_shoe_template(int_decks),dtype=np.uint8)
+    int_cards = len(arr_template)
+    arr_order = obj_random.sample_array(int_cards,int_cards,int_count)
+
+    return arr_template[arr_order.astype(np.intp)]
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  A poker hand off the top of a shuffled deck, and how fast
+    ##  decks and 8 deck shoes come out.
+
+    obj_random = LfsrGenerator(61,None,2026)
+
+    print("*******************************************************")
+    arr_deck = fnc_shuffled_shoe(obj_random)
+    print("Five cards off the top of a shuffled deck:")
+    for str_name in fnc_card_names(arr_deck[:5]):
+        print("  " + str_name)
+
+    print("*******************************************************")
+    int_count = 20000
+    flt_start = time.perf_counter()
+    for int_i in range(int_count):
+        fnc_new_shoe()
+    print("fresh decks:             %10.0f/s"
+          % (int_count / (time.perf_counter() - flt_start)))
+    for int_decks in (1,8):
+        flt_start = time.perf_counter()
+        for int_i in range(int_count // int_decks):
+            fnc_shuffled_shoe(obj_random,int_decks)
+        print("shuffled %d deck shoes:   %10.0f/s"
+              % (int_decks,int_count // int_decks
+                 / (time.perf_counter() - flt_start)))
+        if np is not None:
+            flt_start = time.perf_counter()
+            fnc_shuffled_shoes_array(obj_random,int_count,int_decks)
+            print("  as one NumPy batch:    %10.0f/s"
+                  % (int_count / (time.perf_counter() - flt_start)))
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
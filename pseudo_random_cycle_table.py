@@ -0,0 +1,366 @@
+##  program name:
+##  "pseudo_random_cycle_table.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Whole-cycle lookup tables for
+##  the small LFSR generators.
+##
+##  A 16 or 17 bit register only
+##  has 65,535 or 131,071 states.
+##  Rather than stepping it at all,
+##  the whole cycle can be written
+##  out once and read back from disk:
+##
+##    CYCLE FILE    - entry i is the
+##                    state i steps
+##                    after state 1
+##    POSITION FILE - entry v is the
+##                    position of
+##                    state v in the
+##                    cycle file
+##
+##  Both are packed 32 bit unsigned
+##  integers (4 bytes per entry in
+##  the byte order of the machine
+##  that built them). A 28 bit
+##  register needs two 1 GB files,
+##  which is about as far as this
+##  is worth taking.
+##
+##  "CycleTable" opens both files
+##  with "mmap", so nothing is read
+##  until it is used and opening a
+##  table costs nothing. Then
+##
+##    next()       one lookup
+##    jump(n)      one lookup
+##    position(x)  one lookup
+##
+##  whatever the width.
+##
+##  A tap set that is NOT maximal
+##  (the 16 bit simple program's
+##  taps 0, 1, 3, 8 only reach 8,001
+##  states from seed 1) still works:
+##  the cycle file then holds only
+##  the states reachable from state
+##  1 and every other state is
+##  marked as missing in the
+##  position file.
+####################################
+
+import mmap
+import os
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; tables are built with
+    np = None        ##  array('I') without it (much more slowly).
+
+from pseudo_random_lfsr_engine import LfsrEngine
+from pseudo_random_lfsr_engine import dict_SIMPLE_PROGRAM_TAPS
+from pseudo_random_lfsr_engine import fnc_compile_taps
+from pseudo_random_lfsr_engine import fnc_convert_binary_string_to_integer
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Widest register a table may be built for. Each file is
+##  4 * 2**n bytes.
+int_MAX_TABLE_BITS = 28
+
+##  Position-file entry for a state that is not on the cycle
+##  (always the case for state 0).
+int_NOT_ON_CYCLE = 0xFFFFFFFF
+
+##  States generated and written per block while building.
+int_BUILD_BLOCK = 1 << 20
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_cycle_table_paths(int_bits,tpl_taps=None,str_directory="."):
+    ##  (cycle file, position file) for this width and tap set.
+    ##  The taps are part of the file name, so tables for different
+    ##  tap sets of the same width never get mixed up.
+
+    tpl_taps = fnc_compile_taps(int_bits,tpl_taps)[0]
+    str_name = "pseudo_random_" + str(int_bits) + "_taps_" \
+        + "_".join(str(int_tap) for int_tap in tpl_taps)
+
+    return (os.path.join(str_directory,str_name + "_cycle.u32"),
+            os.path.join(str_directory,str_name + "_position.u32"))
+
+######################################################
+######################################################
+
+def fnc_build_cycle_table(int_bits,tpl_taps=None,str_directory="."):
+    ##  Walk the register from state 1 until it comes back to 1,
+    ##  write the cycle and position files and return the cycle
+    ##  length. Files are written under a temporary name and only
+    ##  renamed into place once they are complete.
+
+    if int_bits > int_MAX_TABLE_BITS:
+        raise ValueError("cycle tables stop at " + str(int_MAX_TABLE_BITS)
+                         + " bits; a " + str(int_bits)
+                         + " bit table would need "
+                         + str(4 << int_bits) + " bytes per file")
+
+    str_cycle_path,str_position_path = \
+        fnc_cycle_table_paths(int_bits,tpl_taps,str_directory)
+    obj_engine = LfsrEngine(int_bits,tpl_taps,1,False)
+    int_states = 1 << int_bits
+
+    ##  Position file starts out as "not on cycle" everywhere and
+    ##  is filled in through a writable map of itself.
+    with open(str_position_path + ".tmp","wb") as obj_file:
+        bytes_missing = b"\xff" * (4 * min(int_states,int_BUILD_BLOCK))
+        int_left = int_states
+        while int_left > 0:
+            int_block = min(int_left,int_BUILD_BLOCK)
+            obj_file.write(bytes_missing[:4 * int_block])
+            int_left -= int_block
+
+    with open(str_position_path + ".tmp","r+b") as obj_position_file, \
+         open(str_cycle_path + ".tmp","wb") as obj_cycle_file:
+        obj_map = mmap.mmap(obj_position_file.fileno(),0)
+        try:
+            if np is not None:
+                arr_positions = np.frombuffer(obj_map,dtype=np.uint32)
+            else:
+                arr_positions = memoryview(obj_map).cast("I")
+
+            ##  State 1 sits at position 0, then one block at a time
+            ##  until state 1 comes round again.
+            obj_cycle_file.write(array("I",[1]).tobytes())
+            arr_positions[1] = 0
+            int_length = 1
+            bool_closed = False
+            while not bool_closed:
+                int_block = min(int_BUILD_BLOCK,int_states - int_length)
+                arr_block = obj_engine.generate(int_block)
+                if np is not None:
+                    arr_block = arr_block.astype(np.uint32)
+                    arr_back = np.flatnonzero(arr_block == 1)
+                    if len(arr_back):
+                        arr_block = arr_block[:arr_back[0]]
+                        bool_closed = True
+                    arr_positions[arr_block] = np.arange(
+                        int_length,int_length + len(arr_block),
+                        dtype=np.uint32)
+                else:
+                    arr_block = array("I",arr_block)
+                    if 1 in arr_block:
+                        arr_block = arr_block[:arr_block.index(1)]
+                        bool_closed = True
+                    for int_i,int_state in enumerate(arr_block):
+                        arr_positions[int_state] = int_length + int_i
+                obj_cycle_file.write(arr_block.tobytes())
+                int_length += len(arr_block)
+
+            del arr_positions
+            obj_map.flush()
+        finally:
+            obj_map.close()
+
+    os.replace(str_cycle_path + ".tmp",str_cycle_path)
+    os.replace(str_position_path + ".tmp",str_position_path)
+
+    return int_length
+
+######################################################
+######################################################
+
+def fnc_cycle_table(int_bits,seed=1,tpl_taps=None,str_directory="."):
+    ##  Open the tables for this width, building them first if
+    ##  they are not on disk yet.
+
+    str_cycle_path,str_position_path = \
+        fnc_cycle_table_paths(int_bits,tpl_taps,str_directory)
+    if not (os.path.exists(str_cycle_path)
+            and os.path.exists(str_position_path)):
+        fnc_build_cycle_table(int_bits,tpl_taps,str_directory)
+
+    return CycleTable(int_bits,tpl_taps,seed,str_directory)
+
+######################################################
+######################################################
+##                                                  ##
+##                  C L A S S E S                   ##
+##                                                  ##
+######################################################
+######################################################
+
+class CycleTable:
+    ##  An LFSR read straight out of its memory-mapped cycle and
+    ##  position files. Same states in the same order as
+    ##  "LfsrEngine" with the same width, taps and seed.
+    ##
+    ##  int_position  - where the register is now (state
+    ##                  "state_at(int_position)")
+    ##  int_length    - number of states on the cycle
+
+    def __init__(self,int_bits,tpl_taps=None,seed=1,str_directory="."):
+
+        self.int_bits = int_bits
+        str_cycle_path,str_position_path = \
+            fnc_cycle_table_paths(int_bits,tpl_taps,str_directory)
+
+        lst_maps = []
+        for str_path in (str_cycle_path,str_position_path):
+            with open(str_path,"rb") as obj_file:
+                lst_maps.append(mmap.mmap(obj_file.fileno(),0,
+                                          access=mmap.ACCESS_READ))
+        self.obj_cycle_map,self.obj_position_map = lst_maps
+        self.arr_cycle = memoryview(self.obj_cycle_map).cast("I")
+        self.arr_positions = memoryview(self.obj_position_map).cast("I")
+
+        if len(self.arr_positions) != 1 << int_bits:
+            self.close()
+            raise ValueError(str_position_path + " is not a "
+                             + str(int_bits) + " bit position file")
+
+        self.int_length = len(self.arr_cycle)
+        self.int_position = 0
+        self.seed(seed)
+
+    ##################################################
+
+    def seed(self,seed):
+        ##  Move to the position of "seed" (an integer or a string
+        ##  of zeros and ones).
+
+        if isinstance(seed,str):
+            seed = fnc_convert_binary_string_to_integer(seed)
+        self.int_position = self.position(seed)
+
+    ##################################################
+
+    def position(self,int_state):
+        ##  Position of "int_state" on the cycle: the number of steps
+        ##  from state 1 to it.
+
+        if int_state <= 0 or int_state >= len(self.arr_positions):
+            raise ValueError("state must be 1 through "
+                             + str(len(self.arr_positions) - 1))
+
+        int_position = self.arr_positions[int_state]
+        if int_position == int_NOT_ON_CYCLE:
+            raise ValueError("state " + str(int_state)
+                             + " is not on the cycle through state 1")
+
+        return int_position
+
+    ##################################################
+
+    def distance(self,int_from,int_to):
+        ##  Steps "next()" takes to get from one state to the other.
+
+        return (self.position(int_to) - self.position(int_from)) \
+            % self.int_length
+
+    ##################################################
+
+    def state_at(self,int_position):
+        ##  State "int_position" steps after state 1.
+
+        return self.arr_cycle[int_position % self.int_length]
+
+    ##################################################
+
+    def state(self):
+        ##  Current state.
+
+        return self.arr_cycle[self.int_position]
+
+    ##################################################
+
+    def next(self):
+        ##  Step once and return the new state.
+
+        int_position = self.int_position + 1
+        if int_position == self.int_length:
+            int_position = 0
+        self.int_position = int_position
+
+        return self.arr_cycle[int_position]
+
+    ##################################################
+
+    def jump(self,int_n):
+        ##  Advance "int_n" steps and return the new state.
+
+        if int_n < 0:
+            raise ValueError("can only jump forward")
+
+        self.int_position = (self.int_position + int_n) % self.int_length
+        return self.arr_cycle[self.int_position]
+
+    ##################################################
+
+    def close(self):
+        ##  Release both maps. The table cannot be used afterwards.
+
+        self.arr_cycle.release()
+        self.arr_positions.release()
+        self.obj_cycle_map.close()
+        self.obj_position_map.close()
+
+    ##################################################
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  Build (or reuse) the tables for the 16 and 17 bit simple
+    ##  programs in the current directory and show them off.
+
+    for int_bits in (16,17):
+        tpl_taps = dict_SIMPLE_PROGRAM_TAPS[int_bits]
+        flt_start = time.perf_counter()
+        obj_table = fnc_cycle_table(int_bits,1,tpl_taps)
+        flt_seconds = time.perf_counter() - flt_start
+
+        print("*******************************************************")
+        print("%d bit table: %d states on the cycle through 1 (%.3f s)"
+              % (int_bits,obj_table.int_length,flt_seconds))
+        print("first values:",[obj_table.next() for int_i in range(5)])
+        int_state = obj_table.jump(1000)
+        print("after 1000 more steps:",int_state,
+              " position:",obj_table.position(int_state))
+        obj_table.close()
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
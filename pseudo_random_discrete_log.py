@@ -0,0 +1,554 @@
+##  program name:
+##  "pseudo_random_discrete_log.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  POSITION LOOKUP for LFSR states
+##
+##  "At which step did this state
+##  show up after seed S?" Walking
+##  the register to find out can
+##  take up to (2**n)-1 steps -- for
+##  the 61 bit register that is more
+##  than two quintillion calls.
+##
+##  The Galois form of the register
+##  (see "pseudo_random_lfsr_engine")
+##  turns the question into algebra.
+##  Its state after N steps is
+##
+##    x**N * g   modulo P(x)
+##
+##  where P(x) is the feedback
+##  polynomial. When P(x) is
+##  maximal-length (primitive) this
+##  is arithmetic in the field
+##  GF(2**n) and N is the "discrete
+##  logarithm" of g_X / g_S to the
+##  base x.
+##
+##  The group has (2**n)-1 elements.
+##  POHLIG-HELLMAN splits the
+##  problem into one small problem
+##  per prime factor of (2**n)-1 and
+##  glues the answers together with
+##  the Chinese Remainder Theorem:
+##
+##    2**33-1 = 7 * 23 * 89 * 599479
+##    2**37-1 = 223 * 616318177
+##
+##  Each small problem is solved by
+##  BABY-STEP/GIANT-STEP in about
+##  sqrt(q) multiplications.
+##
+##  2**61-1 is itself PRIME so that
+##  trick gets no grip there and
+##  baby-step/giant-step would need
+##  over a billion steps. For such
+##  large prime factors we use
+##  INDEX CALCULUS instead: collect
+##  powers of x that split into
+##  small irreducible polynomials,
+##  solve for the logarithms of
+##  those small polynomials once
+##  (they are cached), then split
+##  the target the same way.
+##
+##  Registers whose taps are not
+##  maximal-length (like the ones
+##  the 16 and 33 bit "simple"
+##  programs really use) are handled
+##  by a plain baby-step/giant-step
+##  walk of the register as long as
+##  they are 44 bits or less.
+##
+##  Every distance found, by either
+##  route, is checked with "jump()"
+##  before it is returned.
+####################################
+
+import math
+
+from pseudo_random_gf2 import fnc_gf2_mod
+from pseudo_random_gf2 import fnc_gf2_multiply_mod
+from pseudo_random_gf2 import fnc_gf2_power_mod
+from pseudo_random_gf2 import fnc_gf2_square
+from pseudo_random_gf2 import fnc_x_to_the_n_mod
+from pseudo_random_lfsr_engine import GaloisLfsrEngine
+from pseudo_random_lfsr_engine import LfsrEngine
+from pseudo_random_lfsr_engine import fnc_compile_taps
+from pseudo_random_lfsr_engine import fnc_fibonacci_to_galois
+from pseudo_random_primitive import fnc_period_factorization
+from pseudo_random_primitive import fnc_x_is_generator
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Prime factors up to this size are done by baby-step/giant-step
+##  (about 2**18 steps at most); bigger ones by index calculus.
+int_BSGS_LIMIT = 1 << 36
+
+##  The generic walk for non-maximal registers stores
+##  sqrt(2**n) states, which is only sensible up to this width.
+int_GENERIC_WALK_BITS = 44
+
+##  (polynomial, prime) -> (baby steps, giant step) for BSGS
+dict_BSGS_TABLES = {}
+
+##  (polynomial, prime) -> (factor base, top degree,
+##                         {small irreducible: log mod prime})
+dict_INDEX_CALCULUS_LOGS = {}
+
+##  Mask of the odd coefficients of a polynomial (used for the
+##  derivative over GF(2)).
+int_ODD_COEFFICIENTS = int("10" * 64,2)
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_gf2_inverse_mod(int_a,int_poly):
+    ##  1/int_a modulo an irreducible polynomial (a**(2**n - 2)).
+
+    int_bits = int_poly.bit_length() - 1
+    return fnc_gf2_power_mod(int_a,(1 << int_bits) - 2,int_poly)
+
+######################################################
+######################################################
+
+def fnc_bsgs_in_subgroup(int_gamma,int_y,int_q,int_poly):
+    ##  Baby-step/giant-step: find d with gamma**d == y where gamma
+    ##  has prime order q. Tables are cached per (polynomial, q)
+    ##  so repeated lookups only pay for the giant steps.
+
+    tpl_key = (int_poly,int_q)
+    if tpl_key not in dict_BSGS_TABLES:
+        int_m = math.isqrt(int_q) + 1
+        dict_baby = {}
+        int_element = 1
+        for int_j in range(int_m):
+            dict_baby.setdefault(int_element,int_j)
+            int_element = fnc_gf2_multiply_mod(int_element,int_gamma,
+                                               int_poly)
+        int_giant = fnc_gf2_power_mod(int_gamma,(int_q - int_m) % int_q,
+                                      int_poly)
+        dict_BSGS_TABLES[tpl_key] = (dict_baby,int_giant,int_m)
+
+    dict_baby,int_giant,int_m = dict_BSGS_TABLES[tpl_key]
+
+    int_element = int_y
+    for int_i in range(int_m + 1):
+        int_j = dict_baby.get(int_element)
+        if int_j is not None:
+            return (int_i * int_m + int_j) % int_q
+        int_element = fnc_gf2_multiply_mod(int_element,int_giant,int_poly)
+
+    raise ValueError("element is not a power of the generator")
+
+######################################################
+######################################################
+
+def fnc_irreducible_polynomials(int_max_degree):
+    ##  Every irreducible binary polynomial of degree 1 through
+    ##  int_max_degree, smallest first (a "sieve" like the one for
+    ##  prime numbers).
+
+    lst_irreducible = []
+    for int_f in range(2,1 << (int_max_degree + 1)):
+        int_half = (int_f.bit_length() - 1) // 2
+        for int_g in lst_irreducible:
+            if int_g.bit_length() - 1 > int_half:
+                lst_irreducible.append(int_f)
+                break
+            if fnc_gf2_mod(int_f,int_g) == 0:
+                break
+        else:
+            lst_irreducible.append(int_f)
+
+    return lst_irreducible
+
+######################################################
+######################################################
+
+def fnc_is_smooth(int_f,int_max_degree):
+    ##  Quick test whether every irreducible factor of f has degree
+    ##  int_max_degree or less: f must divide
+    ##      f' * PRODUCT of (x**(2**i) + x) for i = b/2 ... b
+    ##  because x**(2**i) + x is the product of all irreducibles
+    ##  whose degree divides i. (A square f passes by accident, so
+    ##  callers still factor what passes.)
+
+    int_degree = int_f.bit_length() - 1
+    if int_degree <= int_max_degree:
+        return int_f != 0
+
+    int_product = ((int_f & int_ODD_COEFFICIENTS) >> 1)  ##  f'
+    int_product = fnc_gf2_mod(int_product,int_f)
+    int_w = 2                                            ##  x
+    int_i = 0
+    while int_i < (int_max_degree + 1) // 2:
+        int_w = fnc_gf2_mod(fnc_gf2_square(int_w),int_f)
+        int_i += 1
+    while int_i <= int_max_degree and int_product:
+        int_product = fnc_gf2_multiply_mod(int_product,int_w ^ 2,int_f)
+        int_w = fnc_gf2_mod(fnc_gf2_square(int_w),int_f)
+        int_i += 1
+
+    return int_product == 0
+
+######################################################
+######################################################
+
+def fnc_factor_over_base(int_f,lst_base):
+    ##  Split f into the small irreducibles of "lst_base" as
+    ##  {irreducible: exponent}, or None if something is left over.
+
+    dict_exponents = {}
+    for int_p in lst_base:
+        if int_f == 1:
+            break
+        if int_p.bit_length() > int_f.bit_length():
+            break
+        while fnc_gf2_mod(int_f,int_p) == 0:
+            int_f = fnc_gf2_divide_exact(int_f,int_p)
+            dict_exponents[int_p] = dict_exponents.get(int_p,0) + 1
+
+    if int_f != 1:
+        return None
+    return dict_exponents
+
+######################################################
+######################################################
+
+def fnc_gf2_divide_exact(int_a,int_b):
+    ##  Quotient of int_a / int_b when int_b divides int_a.
+
+    int_quotient = 0
+    int_degree = int_b.bit_length()
+    while int_a.bit_length() >= int_degree:
+        int_shift = int_a.bit_length() - int_degree
+        int_quotient |= 1 << int_shift
+        int_a ^= int_b << int_shift
+
+    return int_quotient
+
+######################################################
+######################################################
+
+def fnc_rational_reconstruction(int_r,int_poly):
+    ##  Write r = a / b modulo P(x) with a and b both of about half
+    ##  the degree of P(x), by running Euclid's algorithm halfway.
+    ##  Two half-size polynomials are far more likely to split into
+    ##  small factors than one full-size polynomial.
+
+    int_half = (int_poly.bit_length() - 1) // 2
+    int_r0,int_r1 = int_poly,int_r
+    int_t0,int_t1 = 0,1
+    while int_r1.bit_length() - 1 >= int_half:
+        int_degree = int_r1.bit_length()
+        while int_r0.bit_length() >= int_degree:
+            int_shift = int_r0.bit_length() - int_degree
+            int_r0 ^= int_r1 << int_shift
+            int_t0 ^= int_t1 << int_shift
+        int_r0,int_r1 = int_r1,int_r0
+        int_t0,int_t1 = int_t1,int_t0
+
+    return int_r1,int_t1
+
+######################################################
+######################################################
+
+def fnc_split_element(int_r,int_poly,lst_base,int_max_degree):
+    ##  Try to write r = a / b with a and b both smooth; return the
+    ##  combined exponents (negative for b) or None.
+
+    int_a,int_b = fnc_rational_reconstruction(int_r,int_poly)
+    if int_a == 0 or not fnc_is_smooth(int_a,int_max_degree) \
+            or not fnc_is_smooth(int_b,int_max_degree):
+        return None
+
+    dict_a = fnc_factor_over_base(int_a,lst_base)
+    dict_b = fnc_factor_over_base(int_b,lst_base)
+    if dict_a is None or dict_b is None:
+        return None
+
+    for int_p,int_e in dict_b.items():
+        dict_a[int_p] = dict_a.get(int_p,0) - int_e
+    return dict_a
+
+######################################################
+######################################################
+
+def fnc_add_relation(dict_pivots,dict_row,int_rhs,int_q,dict_rank):
+    ##  Fold one relation  SUM of coefficient * log(column) = rhs
+    ##  (modulo the prime q) into a sparse echelon form.
+    ##
+    ##  "dict_pivots" maps a column to its pivot row, scaled so the
+    ##  pivot is 1 and holding only columns of higher "dict_rank".
+    ##  Rarely seen columns (big irreducibles) get the low ranks so
+    ##  they are eliminated first and rows stay sparse; the handful
+    ##  of small irreducibles that show up everywhere come last.
+    ##  Returns True if the relation told us something new.
+
+    dict_row = {int_c: int_v % int_q for int_c,int_v in dict_row.items()
+                if int_v % int_q}
+    int_rhs %= int_q
+    while dict_row:
+        int_c = min(dict_row,key=dict_rank.__getitem__)
+        if int_c not in dict_pivots:
+            int_inverse = pow(dict_row[int_c],int_q - 2,int_q)
+            dict_pivots[int_c] = ({int_k: int_v * int_inverse % int_q
+                                   for int_k,int_v in dict_row.items()},
+                                  int_rhs * int_inverse % int_q)
+            return True
+
+        dict_pivot,int_pivot_rhs = dict_pivots[int_c]
+        int_factor = dict_row[int_c]
+        for int_k,int_v in dict_pivot.items():
+            int_new = (dict_row.get(int_k,0) - int_factor * int_v) % int_q
+            if int_new:
+                dict_row[int_k] = int_new
+            else:
+                del dict_row[int_k]
+        int_rhs = (int_rhs - int_factor * int_pivot_rhs) % int_q
+
+    return False
+
+######################################################
+######################################################
+
+def fnc_back_substitute(dict_pivots,int_q,dict_rank):
+    ##  Solve the echelon form from the last column back to the
+    ##  first. Returns {column: value} for every column whose row
+    ##  only depends on columns that are known.
+
+    dict_solution = {}
+    for int_c in sorted(dict_pivots,key=dict_rank.__getitem__,reverse=True):
+        dict_pivot,int_value = dict_pivots[int_c]
+        for int_k,int_v in dict_pivot.items():
+            if int_k == int_c:
+                continue
+            if int_k not in dict_solution:
+                break
+            int_value -= int_v * dict_solution[int_k]
+        else:
+            dict_solution[int_c] = int_value % int_q
+
+    return dict_solution
+
+######################################################
+######################################################
+
+def fnc_index_calculus_base(int_poly,int_q):
+    ##  Logarithms (base x, modulo the prime q) of the small
+    ##  irreducible polynomials, computed once per polynomial and q.
+    ##  Returns (factor base, its top degree, {irreducible: log}).
+
+    tpl_key = (int_poly,int_q)
+    if tpl_key in dict_INDEX_CALCULUS_LOGS:
+        return dict_INDEX_CALCULUS_LOGS[tpl_key]
+
+    int_bits = int_poly.bit_length() - 1
+    int_period = (1 << int_bits) - 1
+    int_max_degree = max(4,min(12,(int_bits + 4) // 6))
+    lst_base = fnc_irreducible_polynomials(int_max_degree)
+    dict_rank = {int_p: -int_c for int_c,int_p in enumerate(lst_base)}
+
+    ##  log x = 1 by definition.
+    dict_pivots = {}
+    fnc_add_relation(dict_pivots,{2: 1},1,int_q,dict_rank)
+    set_seen = {2}
+
+    ##  Walk x**k with a big fixed stride so neighbouring elements
+    ##  have nothing to do with each other. Stop once every
+    ##  irreducible seen so far is pinned down and most of the base
+    ##  has turned up.
+    int_stride = (0x9E3779B97F4A7C15 % int_period) | 1
+    int_z = fnc_x_to_the_n_mod(int_stride,int_poly)
+    int_k = 0
+    int_r = 1
+    int_enough = (3 * len(lst_base)) // 4
+    while len(dict_pivots) < len(set_seen) or len(set_seen) < int_enough:
+        int_r = fnc_gf2_multiply_mod(int_r,int_z,int_poly)
+        int_k = (int_k + int_stride) % int_period
+        dict_split = fnc_split_element(int_r,int_poly,lst_base,int_max_degree)
+        if dict_split is None:
+            continue
+        set_seen.update(dict_split)
+        fnc_add_relation(dict_pivots,dict_split,int_k,int_q,dict_rank)
+
+    dict_logs = fnc_back_substitute(dict_pivots,int_q,dict_rank)
+    dict_INDEX_CALCULUS_LOGS[tpl_key] = (lst_base,int_max_degree,dict_logs)
+
+    return dict_INDEX_CALCULUS_LOGS[tpl_key]
+
+######################################################
+######################################################
+
+def fnc_index_calculus_log(int_h,int_poly,int_q):
+    ##  log base x of h, modulo the prime q, by splitting
+    ##  h * x**j into small irreducibles with known logs.
+
+    lst_base,int_max_degree,dict_logs = fnc_index_calculus_base(int_poly,
+                                                                int_q)
+    int_bits = int_poly.bit_length() - 1
+    int_period = (1 << int_bits) - 1
+    int_stride = (0x2545F4914F6CDD1D % int_period) | 1
+    int_z = fnc_x_to_the_n_mod(int_stride,int_poly)
+
+    int_j = 0
+    int_r = int_h
+    while True:
+        dict_split = fnc_split_element(int_r,int_poly,lst_base,
+                                       int_max_degree)
+        if dict_split is not None and all(int_p in dict_logs
+                                          for int_p in dict_split):
+            int_log = -int_j
+            for int_p,int_e in dict_split.items():
+                int_log += int_e * dict_logs[int_p]
+            return int_log % int_q
+        int_r = fnc_gf2_multiply_mod(int_r,int_z,int_poly)
+        int_j += int_stride
+
+######################################################
+######################################################
+
+def fnc_discrete_log_of_x(int_h,int_poly):
+    ##  Smallest N >= 0 with x**N == h modulo a primitive P(x),
+    ##  by Pohlig-Hellman over the factors of (2**n)-1.
+    ##  Raises ValueError when h is not a power of x.
+
+    int_bits = int_poly.bit_length() - 1
+    int_period = (1 << int_bits) - 1
+
+    int_modulus = 1
+    int_result = 0
+    for int_q,int_e in fnc_period_factorization(int_bits).items():
+        int_q_power = int_q ** int_e
+
+        if int_q > int_BSGS_LIMIT:
+            if int_e != 1:
+                raise ValueError("large repeated factor is not supported")
+            int_digits = fnc_index_calculus_log(int_h,int_poly,int_q)
+        else:
+            ##  One base-q digit of the logarithm at a time.
+            int_gamma = fnc_x_to_the_n_mod(int_period // int_q,int_poly)
+            int_digits = 0
+            int_k = 0
+            while int_k < int_e:
+                int_undo = fnc_x_to_the_n_mod((int_period - int_digits)
+                                              % int_period,int_poly)
+                int_y = fnc_gf2_power_mod(
+                    fnc_gf2_multiply_mod(int_h,int_undo,int_poly),
+                    int_period // int_q ** (int_k + 1),int_poly)
+                int_digits += fnc_bsgs_in_subgroup(int_gamma,int_y,int_q,
+                                                   int_poly) * int_q ** int_k
+                int_k += 1
+
+        ##  Chinese Remainder Theorem: fold this factor in.
+        int_result += int_modulus * ((int_digits - int_result)
+                                     * pow(int_modulus,-1,int_q_power)
+                                     % int_q_power)
+        int_modulus *= int_q_power
+
+    return int_result % int_period
+
+######################################################
+######################################################
+
+def fnc_generic_walk_distance(obj_galois,int_target):
+    ##  Baby-step/giant-step straight on the register, for tap sets
+    ##  that are not maximal-length. Returns the smallest N with
+    ##  the state N steps ahead equal to int_target, or None.
+
+    int_bits = obj_galois.int_bits
+    if int_bits > int_GENERIC_WALK_BITS:
+        raise ValueError("taps are not maximal-length and the register "
+                         "is too wide for a generic search")
+
+    int_m = math.isqrt(1 << int_bits) + 1
+    obj_walk = GaloisLfsrEngine(int_bits,obj_galois.tpl_taps,int_target,
+                                False)
+    dict_baby = {int_target: 0}
+    for int_j,int_state in enumerate(obj_walk.next_n(int_m - 1),1):
+        dict_baby[int_state] = int_j      ##  Keep the largest j
+
+    obj_walk = GaloisLfsrEngine(int_bits,obj_galois.tpl_taps,
+                                obj_galois.int_state,False)
+    for int_i in range(1,int_m + 2):
+        int_j = dict_baby.get(obj_walk.jump(int_m))
+        if int_j is not None:
+            return int_i * int_m - int_j
+
+    return None
+
+######################################################
+######################################################
+
+def fnc_lfsr_distance(int_from_state,int_to_state,int_bits,tpl_taps=None):
+    ##  Number of steps N (0 through period-1) that take a Fibonacci
+    ##  ("simple" program) register from int_from_state to
+    ##  int_to_state -- or None if int_to_state is never reached.
+
+    if int_from_state <= 0 or int_to_state <= 0:
+        raise ValueError("LFSR states are never zero")
+
+    tpl_compiled = fnc_compile_taps(int_bits,tpl_taps)
+    tpl_taps = tpl_compiled[0]
+    int_mask = tpl_compiled[1]
+    int_poly = tpl_compiled[7]
+    if int_from_state > int_mask or int_to_state > int_mask:
+        raise ValueError("state does not fit in " + str(int_bits) + " bits")
+    if int_from_state == int_to_state:
+        return 0
+
+    int_g_from = fnc_fibonacci_to_galois(int_from_state,int_bits,tpl_taps)
+    int_g_to = fnc_fibonacci_to_galois(int_to_state,int_bits,tpl_taps)
+
+    if fnc_x_is_generator(int_poly):
+        int_h = fnc_gf2_multiply_mod(int_g_to,
+                                     fnc_gf2_inverse_mod(int_g_from,int_poly),
+                                     int_poly)
+        int_distance = fnc_discrete_log_of_x(int_h,int_poly)
+
+        obj_check = LfsrEngine(int_bits,tpl_taps,int_from_state)
+        if obj_check.jump(int_distance) != int_to_state:
+            raise AssertionError("position lookup failed its own check")
+        return int_distance
+
+    obj_galois = GaloisLfsrEngine(int_bits,tpl_taps,int_g_from,False)
+    int_distance = fnc_generic_walk_distance(obj_galois,int_g_to)
+
+    if int_distance is not None:
+        obj_check = LfsrEngine(int_bits,tpl_taps,int_from_state,False)
+        if obj_check.jump(int_distance) != int_to_state:
+            raise AssertionError("position lookup failed its own check")
+    return int_distance
+
+######################################################
+######################################################
+
+def fnc_lfsr_position(int_state,seed,int_bits,tpl_taps=None):
+    ##  At which step index did "int_state" appear after "seed"?
+    ##  (Step 0 is the seed itself.) "seed" may be an integer or a
+    ##  string of zeros and ones like the "simple" programs use.
+
+    int_seed = LfsrEngine(int_bits,tpl_taps,seed,False).int_state
+    return fnc_lfsr_distance(int_seed,int_state,int_bits,tpl_taps)
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
@@ -0,0 +1,686 @@
+##  program name:
+##  "pseudo_random_distributions.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Bell curves, waiting times and
+##  counts from the LFSR stream:
+##
+##    normal       (Gaussian)
+##    exponential
+##    Poisson
+##    binomial
+##
+##  Every function takes an
+##  "LfsrGenerator", so the same
+##  seed always gives the same
+##  values, and comes in two forms:
+##  one value at a time, and a whole
+##  NumPy array at once ("_array").
+##  The arrays use the same bits in
+##  the same way, but a value that
+##  is thrown back is drawn again at
+##  the end of the batch, so an
+##  array is not the same numbers as
+##  the one-at-a-time function
+##  called over and over.
+####################################
+##  NORMAL AND EXPONENTIAL: THE
+##  ZIGGURAT
+##
+##  The area under the curve is cut
+##  into layers (128 for the normal,
+##  256 for the exponential) that
+##  all have the same area. One
+##  61 bit draw picks a layer, a
+##  sign (normal only) and a point
+##  across the layer. Nearly always
+##  (about 99% of the time) that
+##  point is inside the curve and is
+##  the answer: a table lookup, a
+##  multiply and a compare. Only a
+##  point in the thin sliver between
+##  the layer and the curve needs an
+##  "exp()", and only the bottom
+##  layer's tail needs "log()".
+##
+##  The layer tables are built the
+##  first time they are needed and
+##  kept in dict_ZIGGURAT_TABLES.
+####################################
+##  POISSON AND BINOMIAL
+##
+##  Small means use INVERSION: walk
+##  up the cumulative probabilities
+##  until they pass one uniform
+##  draw. That takes about "mean"
+##  steps, so it is only used up to
+##  a mean of 10 (for the binomial,
+##  n * min(p, 1-p) up to 10).
+##
+##  Bigger means use Hormann's
+##  transformed rejection with
+##  squeeze (PTRS for Poisson, BTRS
+##  for binomial): two uniform draws
+##  make a candidate from a shape
+##  close to the bell of the
+##  distribution; most are accepted
+##  at once by a cheap test and the
+##  rest are checked against the
+##  exact probability with
+##  log-factorials. The cost stays
+##  the same however big the mean.
+####################################
+
+import math
+import time
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; the "_array" functions
+    np = None        ##  need it.
+
+from pseudo_random_generator import LfsrGenerator
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Ziggurat layout: (layers, right edge r of the base layer,
+##  area v of every layer) from Marsaglia and Tsang.
+tpl_NORMAL_ZIGGURAT = (128,3.442619855899,9.91256303526217e-3)
+tpl_EXPONENTIAL_ZIGGURAT = (256,7.697117470131487,3.949659822581572e-3)
+
+##  Ziggurat tables, built on first use: name -> (x, x[i+1]/x[i],
+##  f(x)) as lists, plus the same as NumPy arrays.
+dict_ZIGGURAT_TABLES = {}
+
+##  Means from which PTRS / BTRS take over from inversion.
+flt_POISSON_INVERSION_LIMIT = 10.0
+flt_BINOMIAL_INVERSION_LIMIT = 10.0
+
+##  log(k!) for small k, built on first use.
+lst_LOG_FACTORIALS = []
+int_LOG_FACTORIAL_TABLE = 256
+
+int_MANTISSA_BITS = 53
+flt_MANTISSA_SCALE = 2.0 ** -53
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_ziggurat_tables(str_name):
+    ##  (x list, ratio list, f list, x array, ratio array, f array)
+    ##  for the "normal" (f = exp(-x*x/2)) or "exponential"
+    ##  (f = exp(-x)) ziggurat:
+    ##
+    ##    x[0] = v / f(r)   (the base layer is as wide as its area
+    ##                       over its height, tail included)
+    ##    x[1] = r
+    ##    x[i+1] = f^-1(v / x[i] + f(x[i]))   ...   x[layers] = 0
+
+    if str_name in dict_ZIGGURAT_TABLES:
+        return dict_ZIGGURAT_TABLES[str_name]
+
+    if str_name == "normal":
+        int_layers,flt_r,flt_v = tpl_NORMAL_ZIGGURAT
+        fnc_f = lambda flt_x: math.exp(-0.5 * flt_x * flt_x)
+        fnc_f_inverse = lambda flt_y: math.sqrt(-2.0 * math.log(flt_y))
+    elif str_name == "exponential":
+        int_layers,flt_r,flt_v = tpl_EXPONENTIAL_ZIGGURAT
+        fnc_f = lambda flt_x: math.exp(-flt_x)
+        fnc_f_inverse = lambda flt_y: -math.log(flt_y)
+    else:
+        raise ValueError("no ziggurat for " + str_name)
+
+    lst_x = [flt_v / fnc_f(flt_r),flt_r]
+    for int_i in range(1,int_layers - 1):
+        lst_x.append(fnc_f_inverse(flt_v / lst_x[int_i]
+                                   + fnc_f(lst_x[int_i])))
+    lst_x.append(0.0)
+    lst_ratio = [lst_x[int_i + 1] / lst_x[int_i]
+                 for int_i in range(int_layers)]
+    lst_f = [fnc_f(flt_x) for flt_x in lst_x]
+
+    tpl_tables = (lst_x,lst_ratio,lst_f)
+    if np is not None:
+        tpl_tables += tuple(np.array(lst_table) for lst_table in tpl_tables)
+    else:
+        tpl_tables += (None,None,None)
+    dict_ZIGGURAT_TABLES[str_name] = tpl_tables
+
+    return tpl_tables
+
+######################################################
+######################################################
+
+def fnc_open_uniform(obj_random):
+    ##  A uniform float in (0,1], safe to take the log of.
+
+    return 1.0 - obj_random.random()
+
+######################################################
+######################################################
+
+def fnc_normal_tail(obj_random,flt_r):
+    ##  Marsaglia's tail method: a normal value beyond flt_r.
+
+    while True:
+        flt_x = -math.log(fnc_open_uniform(obj_random)) / flt_r
+        flt_y = -math.log(fnc_open_uniform(obj_random))
+        if 2.0 * flt_y >= flt_x * flt_x:
+            return flt_r + flt_x
+
+######################################################
+######################################################
+
+def fnc_normal(obj_random,flt_mu=0.0,flt_sigma=1.0):
+    ##  One normal value with mean flt_mu and standard deviation
+    ##  flt_sigma. 61 bits per try: 7 for the layer, 1 for the sign
+    ##  and 53 across the layer.
+
+    lst_x,lst_ratio,lst_f = fnc_ziggurat_tables("normal")[:3]
+    while True:
+        int_bits = obj_random.getbits(61)
+        int_layer = int_bits >> 54
+        flt_u = (int_bits & ((1 << 53) - 1)) * flt_MANTISSA_SCALE
+        flt_x = flt_u * lst_x[int_layer]
+        if flt_u < lst_ratio[int_layer]:
+            break
+        if int_layer == 0:
+            flt_x = fnc_normal_tail(obj_random,lst_x[1])
+            break
+        ##  In the sliver between layer and curve?
+        if lst_f[int_layer] + obj_random.random() \
+                * (lst_f[int_layer + 1] - lst_f[int_layer]) \
+                < math.exp(-0.5 * flt_x * flt_x):
+            break
+
+    if (int_bits >> 53) & 1:
+        flt_x = -flt_x
+
+    return flt_mu + flt_sigma * flt_x
+
+######################################################
+######################################################
+
+def fnc_exponential(obj_random,flt_scale=1.0):
+    ##  One exponential value with mean flt_scale. 61 bits per try:
+    ##  8 for the layer and 53 across it.
+
+    lst_x,lst_ratio,lst_f = fnc_ziggurat_tables("exponential")[:3]
+    while True:
+        int_bits = obj_random.getbits(61)
+        int_layer = int_bits >> 53
+        flt_u = (int_bits & ((1 << 53) - 1)) * flt_MANTISSA_SCALE
+        flt_x = flt_u * lst_x[int_layer]
+        if flt_u < lst_ratio[int_layer]:
+            break
+        if int_layer == 0:
+            ##  The tail beyond r is r plus a fresh exponential
+            flt_x = lst_x[1] - math.log(fnc_open_uniform(obj_random))
+            break
+        if lst_f[int_layer] + obj_random.random() \
+                * (lst_f[int_layer + 1] - lst_f[int_layer]) \
+                < math.exp(-flt_x):
+            break
+
+    return flt_scale * flt_x
+
+######################################################
+######################################################
+
+def fnc_ziggurat_array(obj_random,str_name,int_count):
+    ##  NumPy array of "int_count" standard normal or exponential
+    ##  values: every value tries the fast path first, and only
+    ##  the ones that miss it are worked on again.
+
+    tpl_tables = fnc_ziggurat_tables(str_name)
+    arr_x,arr_ratio,arr_f = tpl_tables[3:]
+    bool_normal = str_name == "normal"
+    int_layer_shift = 54 if bool_normal else 53
+
+    arr_out = np.empty(int_count)
+    arr_pending = np.arange(int_count)
+    while len(arr_pending):
+        int_pending = len(arr_pending)
+        arr_bits = obj_random.getbits_array(61,int_pending)
+        arr_layer = (arr_bits >> np.uint64(int_layer_shift)).astype(np.intp)
+        arr_u = (arr_bits & np.uint64((1 << 53) - 1)) * flt_MANTISSA_SCALE
+        arr_value = arr_u * arr_x[arr_layer]
+        arr_done = arr_u < arr_ratio[arr_layer]
+
+        ##  Bottom layer: the tail
+        arr_tail = np.flatnonzero(~arr_done & (arr_layer == 0))
+        if len(arr_tail):
+            arr_value[arr_tail] = fnc_tail_array(obj_random,bool_normal,
+                                                 tpl_tables[0][1],
+                                                 len(arr_tail))
+            arr_done[arr_tail] = True
+
+        ##  The slivers between layers and curve
+        arr_wedge = np.flatnonzero(~arr_done)
+        if len(arr_wedge):
+            arr_layer_w = arr_layer[arr_wedge]
+            arr_y = arr_f[arr_layer_w] \
+                + obj_random.random_array(len(arr_wedge)) \
+                * (arr_f[arr_layer_w + 1] - arr_f[arr_layer_w])
+            arr_v = arr_value[arr_wedge]
+            arr_curve = np.exp(-0.5 * arr_v * arr_v) if bool_normal \
+                else np.exp(-arr_v)
+            arr_done[arr_wedge] = arr_y < arr_curve
+
+        if bool_normal:
+            arr_sign = ((arr_bits >> np.uint64(53)) & np.uint64(1)) \
+                .astype(bool)
+            arr_value[arr_sign] = -arr_value[arr_sign]
+        arr_out[arr_pending[arr_done]] = arr_value[arr_done]
+        arr_pending = arr_pending[~arr_done]
+
+    return arr_out
+
+######################################################
+######################################################
+
+def fnc_tail_array(obj_random,bool_normal,flt_r,int_count):
+    ##  NumPy array of tail values beyond flt_r (normal by
+    ##  Marsaglia's method, or exponential).
+
+    if not bool_normal:
+        return flt_r - np.log(1.0 - obj_random.random_array(int_count))
+
+    arr_tail = np.empty(int_count)
+    arr_pending = np.arange(int_count)
+    while len(arr_pending):
+        arr_x = -np.log(1.0 - obj_random.random_array(len(arr_pending))) \
+            / flt_r
+        arr_y = -np.log(1.0 - obj_random.random_array(len(arr_pending)))
+        arr_done = 2.0 * arr_y >= arr_x * arr_x
+        arr_tail[arr_pending[arr_done]] = flt_r + arr_x[arr_done]
+        arr_pending = arr_pending[~arr_done]
+
+    return arr_tail
+
+######################################################
+######################################################
+
+def fnc_normal_array(obj_random,int_count,flt_mu=0.0,flt_sigma=1.0):
+    ##  NumPy array of "int_count" normal values.
+
+    if np is None:
+        raise ImportError("fnc_normal_array() needs NumPy")
+
+    return flt_mu + flt_sigma * fnc_ziggurat_array(obj_random,"normal",
+                                                   int_count)
+
+######################################################
+######################################################
+
+def fnc_exponential_array(obj_random,int_count,flt_scale=1.0):
+    ##  NumPy array of "int_count" exponential values.
+
+    if np is None:
+        raise ImportError("fnc_exponential_array() needs NumPy")
+
+    return flt_scale * fnc_ziggurat_array(obj_random,"exponential",
+                                          int_count)
+
+######################################################
+######################################################
+
+def fnc_log_factorial(int_k):
+    ##  log(k!), from a table for small k.
+
+    if not lst_LOG_FACTORIALS:
+        lst_LOG_FACTORIALS.extend(math.lgamma(int_i + 1.0)
+                                  for int_i in range(int_LOG_FACTORIAL_TABLE))
+    if int_k < int_LOG_FACTORIAL_TABLE:
+        return lst_LOG_FACTORIALS[int_k]
+
+    return math.lgamma(int_k + 1.0)
+
+######################################################
+######################################################
+
+def fnc_log_factorial_array(arr_k):
+    ##  log(k!) for a NumPy array of k >= 0: the table below
+    ##  int_LOG_FACTORIAL_TABLE, Stirling's series above it (good
+    ##  to the last few bits of a double there).
+
+    fnc_log_factorial(0)                  ##  Make sure the table is built
+    arr_table = np.array(lst_LOG_FACTORIALS)
+    arr_small = arr_k < int_LOG_FACTORIAL_TABLE
+    arr_n = np.maximum(arr_k,int_LOG_FACTORIAL_TABLE).astype(float) + 1.0
+    arr_inverse = 1.0 / arr_n
+    arr_inverse_2 = arr_inverse * arr_inverse
+    arr_big = (arr_n - 0.5) * np.log(arr_n) - arr_n \
+        + 0.5 * math.log(2.0 * math.pi) \
+        + arr_inverse * (1.0 / 12.0 - arr_inverse_2
+                         * (1.0 / 360.0 - arr_inverse_2 / 1260.0))
+
+    return np.where(arr_small,
+                    arr_table[np.minimum(arr_k,
+                                         int_LOG_FACTORIAL_TABLE - 1)
+                              .astype(np.intp)],
+                    arr_big)
+
+######################################################
+######################################################
+
+def fnc_check_poisson(flt_lambda):
+
+    if not flt_lambda >= 0.0 or math.isinf(flt_lambda):
+        raise ValueError("Poisson mean must be 0 or more")
+
+######################################################
+######################################################
+
+def fnc_ptrs_constants(flt_lambda):
+    ##  (sqrt, log, b, a, 1/alpha, v_r) for PTRS at this mean.
+
+    flt_b = 0.931 + 2.53 * math.sqrt(flt_lambda)
+    return (math.log(flt_lambda),flt_b,-0.059 + 0.02483 * flt_b,
+            1.1239 + 1.1328 / (flt_b - 3.4),0.9277 - 3.6224 / (flt_b - 2.0))
+
+######################################################
+######################################################
+
+def fnc_poisson(obj_random,flt_lambda):
+    ##  One Poisson count with mean flt_lambda.
+
+    fnc_check_poisson(flt_lambda)
+    if flt_lambda == 0.0:
+        return 0
+
+    if flt_lambda < flt_POISSON_INVERSION_LIMIT:
+        flt_u = obj_random.random()
+        flt_p = math.exp(-flt_lambda)
+        flt_sum = flt_p
+        int_k = 0
+        while flt_u >= flt_sum and flt_p > 0.0:
+            int_k += 1
+            flt_p *= flt_lambda / int_k
+            flt_sum += flt_p
+        return int_k
+
+    flt_log_lambda,flt_b,flt_a,flt_inverse_alpha,flt_vr = \
+        fnc_ptrs_constants(flt_lambda)
+    while True:
+        flt_u = obj_random.random() - 0.5
+        flt_v = fnc_open_uniform(obj_random)
+        flt_us = 0.5 - abs(flt_u)
+        int_k = math.floor((2.0 * flt_a / flt_us + flt_b) * flt_u
+                           + flt_lambda + 0.43)
+        if flt_us >= 0.07 and flt_v <= flt_vr:
+            return int_k
+        if int_k < 0 or (flt_us < 0.013 and flt_v > flt_us):
+            continue
+        if math.log(flt_v * flt_inverse_alpha
+                    / (flt_a / (flt_us * flt_us) + flt_b)) \
+                <= -flt_lambda + int_k * flt_log_lambda \
+                - fnc_log_factorial(int_k):
+            return int_k
+
+######################################################
+######################################################
+
+def fnc_poisson_array(obj_random,int_count,flt_lambda):
+    ##  NumPy int64 array of "int_count" Poisson counts.
+
+    if np is None:
+        raise ImportError("fnc_poisson_array() needs NumPy")
+    fnc_check_poisson(flt_lambda)
+
+    arr_out = np.zeros(int_count,dtype=np.int64)
+    if flt_lambda == 0.0 or int_count == 0:
+        return arr_out
+
+    if flt_lambda < flt_POISSON_INVERSION_LIMIT:
+        ##  All values walk up the cumulative sum together
+        arr_u = obj_random.random_array(int_count)
+        flt_p = math.exp(-flt_lambda)
+        flt_sum = flt_p
+        arr_pending = np.flatnonzero(arr_u >= flt_sum)
+        int_k = 0
+        while len(arr_pending) and flt_p > 0.0:
+            int_k += 1
+            arr_out[arr_pending] = int_k
+            flt_p *= flt_lambda / int_k
+            flt_sum += flt_p
+            arr_pending = arr_pending[arr_u[arr_pending] >= flt_sum]
+        return arr_out
+
+    flt_log_lambda,flt_b,flt_a,flt_inverse_alpha,flt_vr = \
+        fnc_ptrs_constants(flt_lambda)
+    arr_pending = np.arange(int_count)
+    while len(arr_pending):
+        int_pending = len(arr_pending)
+        arr_u = obj_random.random_array(int_pending) - 0.5
+        arr_v = 1.0 - obj_random.random_array(int_pending)
+        arr_us = 0.5 - np.abs(arr_u)
+        arr_k = np.floor((2.0 * flt_a / arr_us + flt_b) * arr_u
+                         + flt_lambda + 0.43)
+        arr_done = (arr_us >= 0.07) & (arr_v <= flt_vr)
+        arr_check = np.flatnonzero(~arr_done & (arr_k >= 0)
+                                   & ((arr_us >= 0.013) | (arr_v <= arr_us)))
+        if len(arr_check):
+            arr_kc = arr_k[arr_check]
+            arr_usc = arr_us[arr_check]
+            arr_done[arr_check] = \
+                np.log(arr_v[arr_check] * flt_inverse_alpha
+                       / (flt_a / (arr_usc * arr_usc) + flt_b)) \
+                <= -flt_lambda + arr_kc * flt_log_lambda \
+                - fnc_log_factorial_array(arr_kc)
+        arr_out[arr_pending[arr_done]] = arr_k[arr_done]
+        arr_pending = arr_pending[~arr_done]
+
+    return arr_out
+
+######################################################
+######################################################
+
+def fnc_check_binomial(int_n,flt_p):
+
+    if int_n < 0:
+        raise ValueError("binomial n must be 0 or more")
+    if not 0.0 <= flt_p <= 1.0:
+        raise ValueError("binomial p must be 0 through 1")
+
+######################################################
+######################################################
+
+def fnc_btrs_constants(int_n,flt_p):
+    ##  (b, a, c, v_r, alpha, log(p/q), m, h) for BTRS; p <= 1/2.
+
+    flt_q = 1.0 - flt_p
+    flt_spq = math.sqrt(int_n * flt_p * flt_q)
+    flt_b = 1.15 + 2.53 * flt_spq
+    int_m = math.floor((int_n + 1) * flt_p)
+
+    return (flt_b,-0.0873 + 0.0248 * flt_b + 0.01 * flt_p,
+            int_n * flt_p + 0.5,0.92 - 4.2 / flt_b,
+            (2.83 + 5.1 / flt_b) * flt_spq,math.log(flt_p / flt_q),int_m,
+            fnc_log_factorial(int_m) + fnc_log_factorial(int_n - int_m))
+
+######################################################
+######################################################
+
+def fnc_binomial(obj_random,int_n,flt_p):
+    ##  One binomial count: successes in int_n tries of chance
+    ##  flt_p each.
+
+    fnc_check_binomial(int_n,flt_p)
+    bool_flip = flt_p > 0.5               ##  Work with the rarer side
+    if bool_flip:
+        flt_p = 1.0 - flt_p
+    if int_n == 0 or flt_p == 0.0:
+        return int_n if bool_flip else 0
+
+    if int_n * flt_p < flt_BINOMIAL_INVERSION_LIMIT:
+        flt_q = 1.0 - flt_p
+        flt_s = flt_p / flt_q
+        flt_a = (int_n + 1) * flt_s
+        flt_r = flt_q ** int_n
+        flt_u = obj_random.random()
+        int_k = 0
+        while flt_u >= flt_r and int_k < int_n:
+            flt_u -= flt_r
+            int_k += 1
+            flt_r *= flt_a / int_k - flt_s
+    else:
+        flt_b,flt_a,flt_c,flt_vr,flt_alpha,flt_lpq,int_m,flt_h = \
+            fnc_btrs_constants(int_n,flt_p)
+        while True:
+            flt_u = obj_random.random() - 0.5
+            flt_v = fnc_open_uniform(obj_random)
+            flt_us = 0.5 - abs(flt_u)
+            int_k = math.floor((2.0 * flt_a / flt_us + flt_b) * flt_u
+                               + flt_c)
+            if int_k < 0 or int_k > int_n:
+                continue
+            if flt_us >= 0.07 and flt_v <= flt_vr:
+                break
+            if math.log(flt_v * flt_alpha / (flt_a / (flt_us * flt_us)
+                                             + flt_b)) \
+                    <= flt_h - fnc_log_factorial(int_k) \
+                    - fnc_log_factorial(int_n - int_k) \
+                    + (int_k - int_m) * flt_lpq:
+                break
+
+    return int_n - int_k if bool_flip else int_k
+
+######################################################
+######################################################
+
+def fnc_binomial_array(obj_random,int_count,int_n,flt_p):
+    ##  NumPy int64 array of "int_count" binomial counts.
+
+    if np is None:
+        raise ImportError("fnc_binomial_array() needs NumPy")
+    fnc_check_binomial(int_n,flt_p)
+    bool_flip = flt_p > 0.5
+    if bool_flip:
+        flt_p = 1.0 - flt_p
+
+    arr_out = np.zeros(int_count,dtype=np.int64)
+    if int_n == 0 or flt_p == 0.0 or int_count == 0:
+        pass
+    elif int_n * flt_p < flt_BINOMIAL_INVERSION_LIMIT:
+        flt_q = 1.0 - flt_p
+        flt_s = flt_p / flt_q
+        flt_a = (int_n + 1) * flt_s
+        flt_r = flt_q ** int_n
+        arr_u = obj_random.random_array(int_count)
+        arr_pending = np.flatnonzero(arr_u >= flt_r)
+        int_k = 0
+        while len(arr_pending) and int_k < int_n:
+            arr_u[arr_pending] -= flt_r
+            int_k += 1
+            arr_out[arr_pending] = int_k
+            flt_r *= flt_a / int_k - flt_s
+            arr_pending = arr_pending[arr_u[arr_pending] >= flt_r]
+    else:
+        flt_b,flt_a,flt_c,flt_vr,flt_alpha,flt_lpq,int_m,flt_h = \
+            fnc_btrs_constants(int_n,flt_p)
+        arr_pending = np.arange(int_count)
+        while len(arr_pending):
+            int_pending = len(arr_pending)
+            arr_u = obj_random.random_array(int_pending) - 0.5
+            arr_v = 1.0 - obj_random.random_array(int_pending)
+            arr_us = 0.5 - np.abs(arr_u)
+            arr_k = np.floor((2.0 * flt_a / arr_us + flt_b) * arr_u + flt_c)
+            arr_inside = (arr_k >= 0) & (arr_k <= int_n)
+            arr_done = arr_inside & (arr_us >= 0.07) & (arr_v <= flt_vr)
+            arr_check = np.flatnonzero(arr_inside & ~arr_done)
+            if len(arr_check):
+                arr_kc = arr_k[arr_check]
+                arr_usc = arr_us[arr_check]
+                arr_done[arr_check] = \
+                    np.log(arr_v[arr_check] * flt_alpha
+                           / (flt_a / (arr_usc * arr_usc) + flt_b)) \
+                    <= flt_h - fnc_log_factorial_array(arr_kc) \
+                    - fnc_log_factorial_array(int_n - arr_kc) \
+                    + (arr_kc - int_m) * flt_lpq
+            arr_out[arr_pending[arr_done]] = arr_k[arr_done]
+            arr_pending = arr_pending[~arr_done]
+
+    if bool_flip:
+        arr_out = int_n - arr_out
+
+    return arr_out
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  Mean and variance of a big batch of each, next to what they
+    ##  should be, and how fast they come.
+
+    obj_random = LfsrGenerator(61,None,2026)
+    int_count = 1000000
+
+    print("*******************************************************")
+    print("%-34s %10s %10s %10s %10s %12s" % ("", "mean", "expected",
+                                             "variance", "expected",
+                                             "values/s"))
+    lst_runs = [("normal(0,1)",0.0,1.0,
+                 lambda: fnc_normal(obj_random),
+                 lambda: fnc_normal_array(obj_random,int_count)),
+                ("exponential(1)",1.0,1.0,
+                 lambda: fnc_exponential(obj_random),
+                 lambda: fnc_exponential_array(obj_random,int_count)),
+                ("Poisson(3.5)",3.5,3.5,
+                 lambda: fnc_poisson(obj_random,3.5),
+                 lambda: fnc_poisson_array(obj_random,int_count,3.5)),
+                ("Poisson(1000)",1000.0,1000.0,
+                 lambda: fnc_poisson(obj_random,1000.0),
+                 lambda: fnc_poisson_array(obj_random,int_count,1000.0)),
+                ("binomial(20,0.3)",6.0,4.2,
+                 lambda: fnc_binomial(obj_random,20,0.3),
+                 lambda: fnc_binomial_array(obj_random,int_count,20,0.3)),
+                ("binomial(10000,0.6)",6000.0,2400.0,
+                 lambda: fnc_binomial(obj_random,10000,0.6),
+                 lambda: fnc_binomial_array(obj_random,int_count,
+                                            10000,0.6))]
+    for str_name,flt_mean,flt_variance,fnc_one,fnc_many in lst_runs:
+        if np is not None:
+            flt_start = time.perf_counter()
+            arr_values = fnc_many()
+            flt_rate = int_count / (time.perf_counter() - flt_start)
+            print("%-34s %10.4f %10.4f %10.4f %10.4f %12.0f"
+                  % (str_name + " array",arr_values.mean(),flt_mean,
+                     arr_values.var(),flt_variance,flt_rate))
+        flt_start = time.perf_counter()
+        lst_values = [fnc_one() for int_i in range(int_count // 10)]
+        flt_rate = len(lst_values) / (time.perf_counter() - flt_start)
+        flt_average = sum(lst_values) / len(lst_values)
+        flt_spread = sum((flt_value - flt_average) ** 2
+                         for flt_value in lst_values) / len(lst_values)
+        print("%-34s %10.4f %10.4f %10.4f %10.4f %12.0f"
+              % (str_name + " one at a time",flt_average,flt_mean,
+                 flt_spread,flt_variance,flt_rate))
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
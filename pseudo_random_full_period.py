@@ -0,0 +1,440 @@
+##  program name:
+##  "pseudo_random_full_period.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Brute-force check that a
+##  register really runs through
+##  every non-zero state once and
+##  only once.
+##
+##  "pseudo_random_primitive.py"
+##  settles this with algebra in a
+##  millisecond. This program does
+##  it the long way, by walking the
+##  whole sequence, so the two can
+##  be held up against each other.
+##
+##  Keeping 8.6 billion states of a
+##  33 bit register in a Python
+##  "set" is out of the question,
+##  so every state gets ONE BIT in a
+##  bitmap file instead:
+##
+##    2**33 bits = 1 GiB
+##
+##  The file is opened with "mmap"
+##  and a bit is set for every state
+##  the register passes through. A
+##  bit that is already set means a
+##  state came round twice. When the
+##  walk is over exactly (2**n)-1
+##  bits must be set and the
+##  register must be back on its
+##  seed.
+##
+##  The register is stepped by
+##  "LfsrEngine.generate()" (integer
+##  arithmetic, in blocks) and not
+##  by the string functions, which
+##  would take weeks at 33 bits.
+##
+##  Progress and throughput are
+##  printed as the walk goes. The
+##  position reached is saved to a
+##  small checkpoint file every few
+##  minutes, so an interrupted walk
+##  picks up where it left off the
+##  next time it is started.
+##
+##  The bitmap can run ahead of the
+##  checkpoint: every block marked
+##  since the last one is already in
+##  the file when a walk is stopped.
+##  So before each block is marked
+##  the checkpoint also notes how
+##  far the marks REACH, and a
+##  resumed walk only looks for
+##  early repeats past that point.
+##  Up to it the bits were set by
+##  the walk that was interrupted;
+##  the final count and the return
+##  to the seed still catch any real
+##  repeat there.
+####################################
+
+import mmap
+import os
+import time
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; without it every state
+    np = None        ##  is marked one at a time (much more slowly).
+
+from pseudo_random_lfsr_engine import LfsrEngine
+from pseudo_random_lfsr_engine import dict_SIMPLE_PROGRAM_TAPS
+from pseudo_random_lfsr_engine import fnc_compile_taps
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Widest register the bitmap is used for (2**33 bits = 1 GiB).
+int_MAX_BITMAP_BITS = 33
+
+##  States generated and marked per block.
+int_VERIFY_BLOCK = 1 << 22
+
+##  Seconds between progress lines and between checkpoints.
+int_REPORT_SECONDS = 10
+int_CHECKPOINT_SECONDS = 300
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_full_period_paths(int_bits,tpl_taps=None,str_directory="."):
+    ##  (bitmap file, checkpoint file) for this width and tap set.
+
+    tpl_taps = fnc_compile_taps(int_bits,tpl_taps)[0]
+    str_name = "pseudo_random_" + str(int_bits) + "_taps_" \
+        + "_".join(str(int_tap) for int_tap in tpl_taps)
+
+    return (os.path.join(str_directory,str_name + "_seen.bitmap"),
+            os.path.join(str_directory,str_name + "_seen.checkpoint"))
+
+######################################################
+######################################################
+
+def fnc_read_checkpoint(str_path):
+    ##  {"seed": ..., "steps": ..., "state": ..., "reach": ...} from
+    ##  a checkpoint file, or None if there is no checkpoint.
+
+    if not os.path.exists(str_path):
+        return None
+
+    dict_checkpoint = {}
+    with open(str_path) as obj_file:
+        for str_line in obj_file:
+            str_key,str_value = str_line.split("=")
+            dict_checkpoint[str_key.strip()] = int(str_value)
+
+    return dict_checkpoint
+
+######################################################
+######################################################
+
+def fnc_write_checkpoint(str_path,int_seed,int_steps,int_state,int_reach):
+    ##  Save the position reached (whose marks are flushed to the
+    ##  bitmap) and how far the marks may go past it. Written to a
+    ##  temporary file and renamed so a crash never leaves half a
+    ##  checkpoint behind.
+
+    with open(str_path + ".tmp","w") as obj_file:
+        obj_file.write("seed = " + str(int_seed) + "\n")
+        obj_file.write("steps = " + str(int_steps) + "\n")
+        obj_file.write("state = " + str(int_state) + "\n")
+        obj_file.write("reach = " + str(int_reach) + "\n")
+    os.replace(str_path + ".tmp",str_path)
+
+######################################################
+######################################################
+
+def fnc_count_set_bits(obj_map):
+    ##  Number of bits set in the whole bitmap, 64 MiB at a time.
+
+    int_count = 0
+    int_step = 1 << 26
+    if np is not None:
+        arr_table = np.array([bin(int_b).count("1") for int_b in range(256)],
+                             dtype=np.uint8)
+    for int_start in range(0,len(obj_map),int_step):
+        int_length = min(int_step,len(obj_map) - int_start)
+        if np is not None:
+            arr_bytes = np.frombuffer(obj_map,dtype=np.uint8,
+                                      count=int_length,offset=int_start)
+            int_count += int(arr_table[arr_bytes].sum(dtype=np.uint64))
+            del arr_bytes
+        else:
+            int_count += int.from_bytes(
+                obj_map[int_start:int_start + int_length],
+                "little").bit_count()
+
+    return int_count
+
+######################################################
+######################################################
+
+def fnc_mark_states(obj_map,lst_states,bool_check):
+    ##  Set the bit of every state in the list (or array). Returns
+    ##  the first state whose bit was ALREADY set before this block
+    ##  when "bool_check" is true, otherwise None.
+
+    if np is not None:
+        arr_bytes = np.frombuffer(obj_map,dtype=np.uint8)
+        arr_index = (lst_states >> np.uint64(3)).astype(np.intp)
+        arr_bits = np.left_shift(np.uint8(1),
+                                 (lst_states & np.uint64(7)).astype(np.uint8))
+        int_repeat = None
+        if bool_check:
+            arr_seen = np.flatnonzero(arr_bytes[arr_index] & arr_bits)
+            if len(arr_seen):
+                int_repeat = int(lst_states[arr_seen[0]])
+        np.bitwise_or.at(arr_bytes,arr_index,arr_bits)
+        del arr_bytes
+        return int_repeat
+
+    int_repeat = None
+    for int_state in lst_states:
+        int_byte = int_state >> 3
+        int_bit = 1 << (int_state & 7)
+        if bool_check and int_repeat is None and obj_map[int_byte] & int_bit:
+            int_repeat = int_state
+        obj_map[int_byte] |= int_bit
+
+    return int_repeat
+
+######################################################
+######################################################
+
+def fnc_remove_walk_files(str_bitmap_path,str_checkpoint_path):
+    ##  Remove the bitmap and checkpoint of a walk that is over.
+
+    for str_path in (str_bitmap_path,str_checkpoint_path):
+        if os.path.exists(str_path):
+            os.remove(str_path)
+
+######################################################
+######################################################
+
+def fnc_verify_full_period(int_bits,tpl_taps=None,seed=1,
+                           str_directory=".",bool_verbose=True):
+    ##  Walk the register from "seed" for (2**n)-1 steps, marking
+    ##  each state in the bitmap, and return
+    ##
+    ##    (True,  (2**n)-1)       every non-zero state seen once
+    ##    (False, cycle length)   some state came round early
+    ##
+    ##  Picks up from the checkpoint file if one is there for the
+    ##  same seed. Both files are removed once the walk is over, or
+    ##  once it fails with AssertionError (a register that repeats
+    ##  a state before its seed).
+
+    if int_bits > int_MAX_BITMAP_BITS:
+        raise ValueError("the bitmap check stops at "
+                         + str(int_MAX_BITMAP_BITS) + " bits; use "
+                         "pseudo_random_primitive.py for wider registers")
+
+    obj_engine = LfsrEngine(int_bits,tpl_taps,seed,False)
+    int_seed = obj_engine.int_state
+    int_period = obj_engine.int_mask
+    str_bitmap_path,str_checkpoint_path = \
+        fnc_full_period_paths(int_bits,tpl_taps,str_directory)
+
+    ##  Resume only if the checkpoint is for this seed and the
+    ##  bitmap it belongs to is still there.
+    dict_checkpoint = fnc_read_checkpoint(str_checkpoint_path)
+    if dict_checkpoint is not None and dict_checkpoint["seed"] == int_seed \
+            and os.path.exists(str_bitmap_path):
+        int_steps = dict_checkpoint["steps"]
+        obj_engine.int_state = dict_checkpoint["state"]
+        ##  A checkpoint from before "reach" was kept: the marks may
+        ##  go anywhere, so only the final checks are made.
+        int_reach = dict_checkpoint.get("reach",int_period)
+        if bool_verbose:
+            print("resuming %d bit walk at step %d of %d"
+                  % (int_bits,int_steps,int_period))
+    else:
+        with open(str_bitmap_path,"wb") as obj_file:
+            obj_file.truncate(max(1,(1 << int_bits) // 8))
+        int_steps = 0
+        int_reach = 0
+
+    try:
+        with open(str_bitmap_path,"r+b") as obj_file:
+            obj_map = mmap.mmap(obj_file.fileno(),0)
+            try:
+                if int_steps == 0:
+                    fnc_mark_states(obj_map,[int_seed] if np is None
+                                    else np.array([int_seed],
+                                                  dtype=np.uint64),False)
+                    int_steps = 1
+
+                int_saved_steps = int_steps
+                int_saved_state = obj_engine.int_state
+                int_cycle = None
+                arr_buffer = None
+                flt_start = time.perf_counter()
+                int_start_steps = int_steps
+                flt_next_report = flt_start + int_REPORT_SECONDS
+                flt_next_checkpoint = flt_start + int_CHECKPOINT_SECONDS
+
+                while int_steps < int_period and int_cycle is None:
+                    int_block = min(int_VERIFY_BLOCK,int_period - int_steps)
+                    if np is not None:
+                        if arr_buffer is None or len(arr_buffer) != int_block:
+                            arr_buffer = np.empty(int_block,dtype=np.uint64)
+                        lst_states = obj_engine.generate(int_block,
+                                                         arr_buffer)
+                        arr_back = np.flatnonzero(lst_states == int_seed)
+                        if len(arr_back):
+                            int_cycle = int_steps + int(arr_back[0])
+                    else:
+                        lst_states = obj_engine.next_n(int_block)
+                        if int_seed in lst_states:
+                            int_cycle = int_steps + lst_states.index(int_seed)
+
+                    ##  Up to "int_reach" the bits may already be set by
+                    ##  the walk that was interrupted. Past it, note the
+                    ##  new reach BEFORE marking, so a walk stopped in
+                    ##  the middle of this block leaves it behind.
+                    bool_check = int_steps >= int_reach
+                    if bool_check:
+                        int_reach = int_steps + int_block
+                        fnc_write_checkpoint(str_checkpoint_path,int_seed,
+                                             int_saved_steps,int_saved_state,
+                                             int_reach)
+                    int_repeat = fnc_mark_states(obj_map,lst_states,
+                                                 bool_check)
+                    if int_repeat is not None and int_cycle is None:
+                        ##  A state other than the seed came round twice;
+                        ##  cannot happen on an invertible register.
+                        raise AssertionError("state " + str(int_repeat)
+                                             + " repeated before the seed"
+                                             " did")
+                    int_steps += int_block
+
+                    flt_now = time.perf_counter()
+                    if bool_verbose and flt_now >= flt_next_report:
+                        flt_rate = (int_steps - int_start_steps) \
+                            / (flt_now - flt_start)
+                        print("%d bits: %d of %d states (%.1f%%)  %.0f/s"
+                              "  about %.0f s to go"
+                              % (int_bits,int_steps,int_period,
+                                 100.0 * int_steps / int_period,flt_rate,
+                                 (int_period - int_steps) / flt_rate))
+                        flt_next_report = flt_now + int_REPORT_SECONDS
+                    if flt_now >= flt_next_checkpoint:
+                        obj_map.flush()
+                        int_saved_steps = int_steps
+                        int_saved_state = obj_engine.int_state
+                        fnc_write_checkpoint(str_checkpoint_path,int_seed,
+                                             int_saved_steps,int_saved_state,
+                                             max(int_reach,int_steps))
+                        flt_next_checkpoint = flt_now \
+                            + int_CHECKPOINT_SECONDS
+
+                if int_cycle is None:
+                    if obj_engine.next() != int_seed:
+                        raise AssertionError("register did not come back "
+                                             "to its seed after the full "
+                                             "period")
+                    int_cycle = int_period
+                int_seen = fnc_count_set_bits(obj_map)
+            finally:
+                obj_map.close()
+    except AssertionError:
+        ##  A finished (failed) walk: nothing left to resume.
+        fnc_remove_walk_files(str_bitmap_path,str_checkpoint_path)
+        raise
+
+    fnc_remove_walk_files(str_bitmap_path,str_checkpoint_path)
+
+    bool_full = int_cycle == int_period and int_seen == int_period
+    if bool_verbose:
+        flt_seconds = time.perf_counter() - flt_start
+        print("%d bits, taps %s: cycle of %d states, %d different states"
+              " seen, %s (%.1f s)"
+              % (int_bits,str(obj_engine.tpl_taps),int_cycle,int_seen,
+                 "FULL PERIOD" if bool_full else "NOT FULL PERIOD",
+                 flt_seconds))
+
+    return (bool_full,int_cycle)
+
+def fnc_check_resume(int_bits=20,str_directory="."):
+    ##  Leave behind what an interrupted walk leaves -- a checkpoint
+    ##  at the start and half the period marked past it -- and check
+    ##  that the resumed walk still finds the full period and tidies
+    ##  up. Once with "reach" in the checkpoint and once without it,
+    ##  as older checkpoints were written. Raises AssertionError if
+    ##  either resume goes wrong.
+
+    obj_engine = LfsrEngine(int_bits,None,1,False)
+    int_seed = obj_engine.int_state
+    int_period = obj_engine.int_mask
+    int_marked = int_period // 2
+    lst_states = [int_seed] + obj_engine.next_n(int_marked - 1)
+    str_bitmap_path,str_checkpoint_path = \
+        fnc_full_period_paths(int_bits,None,str_directory)
+
+    for bool_reach in (True,False):
+        with open(str_bitmap_path,"wb") as obj_file:
+            obj_file.truncate(max(1,(1 << int_bits) // 8))
+        with open(str_bitmap_path,"r+b") as obj_file:
+            obj_map = mmap.mmap(obj_file.fileno(),0)
+            fnc_mark_states(obj_map,lst_states if np is None
+                            else np.array(lst_states,dtype=np.uint64),False)
+            obj_map.close()
+        fnc_write_checkpoint(str_checkpoint_path,int_seed,1,int_seed,
+                             int_marked)
+        if not bool_reach:
+            with open(str_checkpoint_path) as obj_file:
+                lst_lines = obj_file.readlines()
+            with open(str_checkpoint_path,"w") as obj_file:
+                obj_file.writelines(str_line for str_line in lst_lines
+                                    if not str_line.startswith("reach"))
+
+        tpl_result = fnc_verify_full_period(int_bits,None,1,str_directory,
+                                            False)
+        if tpl_result != (True,int_period) \
+                or os.path.exists(str_bitmap_path) \
+                or os.path.exists(str_checkpoint_path):
+            raise AssertionError("resumed %d bit walk went wrong: %s"
+                                 % (int_bits,str(tpl_result)))
+
+    print("%d bit walk resumed with %d states already marked: FULL PERIOD"
+          % (int_bits,int_marked))
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  Walk the registers of the 16 and 17 bit simple programs and
+    ##  a 24 bit table register, and check that an interrupted walk
+    ##  resumes. The 33 bit walk (1 GiB bitmap) is left to be asked
+    ##  for by hand:
+    ##
+    ##    fnc_verify_full_period(33)
+    ##    fnc_verify_full_period(33,dict_SIMPLE_PROGRAM_TAPS[33])
+
+    print("*******************************************************")
+    fnc_verify_full_period(16,dict_SIMPLE_PROGRAM_TAPS[16])
+    fnc_verify_full_period(16)
+    fnc_verify_full_period(17,dict_SIMPLE_PROGRAM_TAPS[17])
+    fnc_verify_full_period(24)
+    fnc_check_resume()
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
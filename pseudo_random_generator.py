@@ -0,0 +1,1352 @@
+##  program name:
+##  "pseudo_random_generator.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  A small generator object for
+##  programs that want random
+##  numbers rather than register
+##  states.
+##
+##  The example programs pass the
+##  seed STRING into every function
+##  and get a new one back with each
+##  draw:
+##
+##    int_index,str_seed = \
+##        fnc_pseudo_random_1_thru_n(
+##            int_n,str_seed)
+##
+##  which builds a tuple and a
+##  string or two for every number
+##  drawn.
+##
+##  "LfsrGenerator" keeps the
+##  register as an integer inside
+##  the object instead:
+##
+##    obj_random = LfsrGenerator(17)
+##    obj_random.randint(1,6)
+##
+##  It uses "__slots__", so it has
+##  no per-object dictionary: just
+##  ten references and the object
+##  header. Counting its own state
+##  integer an object takes about
+##  160 bytes, so a million of them
+##  fit in about 160 MB. A million
+##  "LfsrEngine" objects take about
+##  a third more.
+##
+##  Draws use the same rejection
+##  method as the examples, so
+##
+##    randint(1,n)
+##
+##  gives the same numbers as
+##  "fnc_pseudo_random_1_thru_n(n,
+##  str_seed)" from the same seed.
+##  (The one difference: when n
+##  divides (2**n)-1 exactly the
+##  example hands back 1 WITHOUT
+##  stepping the register. Here
+##  every draw steps at least once.)
+####################################
+##  FEWER DIVISIONS
+##
+##  "pseudo_random_1_thru_n()" uses
+##  Lemire's multiply-and-shift
+##  method instead. With x = state-1
+##  (0 through M-1, M = (2**n)-1)
+##  the draw is the top part of
+##  x * n and the bottom part says
+##  whether to throw it back:
+##
+##    j = (x * n) // M
+##    l = (x * n) %  M
+##    throw back if l < M % n
+##
+##  Because M is one less than a
+##  power of two, both parts come
+##  from a shift, a mask and an add
+##  (M = 2**n - 1 means 2**n is 1
+##  more than M), so a draw never
+##  divides. "M % n" is worked out
+##  once per n and cached.
+##
+##  No exact method can throw back
+##  fewer than M % n of every M
+##  states, and this one throws
+##  back exactly that many. When n
+##  is a little over M/2 that is
+##  still nearly half of them. The
+##  counters "int_draws" and
+##  "int_rejections" show how many
+##  states were actually thrown
+##  back.
+##
+##  Like the examples, every try
+##  takes ONE register step, so a
+##  17 bit generator gives 131,071
+##  tries before the sequence comes
+##  round again.
+##
+##  The draw is read from the TOP
+##  of the state, though, and one
+##  step only shifts the state left
+##  by one bit, so draws from
+##  neighbouring states nearly
+##  agree (a draw near the top of
+##  the range is likely to be
+##  followed by one near the top or
+##  the middle). Where that matters,
+##  "pseudo_random_1_thru_n_fresh()"
+##  steps the register n times for
+##  every try ("next_bits(n)"), so
+##  its state is made of n bits no
+##  earlier draw has seen. That uses
+##  up the sequence n times faster.
+##  The two-tap registers (17 and 31
+##  bits) still leave a pattern in
+##  the top bits of one fresh state
+##  to the next; for fresh Lemire
+##  draws a register with four or
+##  more taps is the better choice.
+##
+##  "pseudo_random_1_thru_n_array()"
+##  makes a whole NumPy array of
+##  draws from "generate()" blocks,
+##  keeping every state (every n-th
+##  with "bool_fresh"). It gives
+##  exactly the same numbers as
+##  calling the single draw over and
+##  over.
+####################################
+##  RANGES WIDER THAN THE REGISTER
+##
+##  A 17 bit register cannot give a
+##  number from 1 to 10**15 in one
+##  state, so "randbelow()" and
+##  "randint()" switch to
+##  "randbelow_wide()" for any range
+##  bigger than the register.
+##
+##  That one builds a wide word out
+##  of FRESH bits. Every step shifts
+##  exactly one new bit into the
+##  register, so n steps make a
+##  word of n new bits (gluing
+##  neighbouring STATES together
+##  would repeat nearly all of
+##  their bits).
+##  Lemire's method over 2**L then
+##  picks the draw exactly, with
+##  Python's big integers.
+##
+##  L must be at least the bit
+##  length of the range. A few extra
+##  bits cost a step each but make
+##  throwing back less likely, so
+##  for every range the L with the
+##  fewest EXPECTED steps per draw
+##  is worked out once and cached.
+##
+##  The draws are exact, but a
+##  register can only be in (2**n)-1
+##  states when a draw starts. So a
+##  17 bit generator can never give
+##  more than 131,071 different
+##  answers for one range. A space
+##  of 10**15 IDs wants a register
+##  like the 61 bit one.
+####################################
+##  SHUFFLING
+##
+##  "fnc_shuffle" in the examples
+##  rebuilds the deck with slices
+##  for every card (O(n**2)) and
+##  only knows 52 cards between two
+##  "dummy" bookends. "shuffle()"
+##  is the Fisher-Yates shuffle: for
+##  i = n-1 down to 1 swap item i
+##  with item j, j drawn from 0..i.
+##  It works in place on a list, a
+##  bytearray or a NumPy array.
+##
+##  All the j's are drawn first by
+##  "shuffle_indices()". Each i gets
+##  the next fresh state (n steps
+##  on, as for fresh Lemire draws
+##  above)
+##  and keeps it modulo i+1 unless
+##  it is over the largest multiple
+##  of i+1, the same rule as
+##  "randbelow()". (Lemire's method
+##  reads only the top bits, and
+##  with the two-tap 17 and 31 bit
+##  registers that gives visibly
+##  uneven shuffles even from fresh
+##  states. The modulo uses every
+##  bit of the state.) Any i whose
+##  state is thrown back gets
+##  another one in a second pass
+##  (and a third, ...).
+##  With NumPy every pass is one
+##  "generate()" call and a handful
+##  of array operations; without
+##  it the very same j's come out
+##  one at a time, so a seed gives
+##  the same shuffle either way.
+##  Only the swaps are a Python
+##  loop.
+##
+##  Lists longer than the register
+##  has states (more than 131,071
+##  items for the 17 bit one) fall
+##  back to one draw per item, each
+##  from fresh bits: a fresh state
+##  ("randbelow_fresh()") while i+1
+##  fits the register, a wide draw
+##  once it does not. That is far
+##  slower. Big arrays want a 24 to
+##  32 bit register.
+####################################
+##  SAMPLING
+##
+##  Dealing 5 cards should not need
+##  a shuffle of all 52, and calling
+##  BINGO numbers should not rebuild
+##  the list after every call.
+##  "sample(n,k)" gives k different
+##  numbers from 0..n-1 with a
+##  Fisher-Yates shuffle that stops
+##  after k swaps. Only the swapped
+##  places are remembered (in a
+##  dictionary), so it takes O(k)
+##  time and memory even for
+##  n = 10**12.
+##
+##  "sample_array(n,k,count)" gives
+##  "count" separate samples as the
+##  rows of one NumPy array:
+##
+##  - small n: every row is a
+##    partial Fisher-Yates shuffle
+##    of its own copy of 0..n-1,
+##    done for all rows at once;
+##  - big n: k numbers are drawn
+##    for every row and the rare
+##    rows with a repeat are drawn
+##    again.
+##
+##  Draws of 0..n-1 for a whole
+##  array, "fnc_below_array()", use
+##  fresh states as digits base
+##  M = (2**n)-1 (x = sum of
+##  (state-1) * M**i is exactly
+##  uniform on 0..M**r - 1) and
+##  throw back x above the largest
+##  multiple of n, so n can be far
+##  wider than the register.
+####################################
+##  BIT RESERVOIR
+##
+##  A coin toss needs ONE random
+##  bit, but "fnc_coin_toss" spends
+##  a whole draw (with its rejection
+##  loop) on it, and a die needs
+##  about 2.6 bits but gets a whole
+##  17 or 61 bit state.
+##
+##  "getbits(k)" hands out exactly
+##  k new bits from a reservoir.
+##  When the reservoir runs low it
+##  is topped up with whole words
+##  of n fresh bits ("next_bits(n)")
+##  and no bit is ever handed out
+##  twice, so a coin toss costs one
+##  register step (the register
+##  makes one new bit per step)
+##  plus a shift and a mask.
+##
+##  Small ranges are drawn from the
+##  reservoir with Lemire's method
+##  over just enough bits
+##  ("randbelow_bits()"), and
+##  several of them at once with a
+##  MIXED-RADIX number: a draw of
+##  0 .. (6*6*6*52)-1 splits into
+##  three dice and a card with
+##  "divmod()", and wastes far fewer
+##  bits than four separate draws
+##  ("randbelow_digits()").
+##  "randbelow_many(n,count)" packs
+##  as many draws of 0 .. n-1 into
+##  one number as pays off (17 dice
+##  per 44 bit draw, for example).
+####################################
+##  BYTES
+##
+##  "randbytes(n)" and
+##  "readinto(buffer)" hand out the
+##  register's bit stream packed 8
+##  bits to a byte, first bit
+##  highest, for test data and
+##  anything that reads like
+##  "os.urandom()". "readinto()"
+##  writes straight into any
+##  writable buffer (bytearray,
+##  memoryview, NumPy array, mmap).
+##
+##  The bit stream obeys
+##
+##    a[t+n*m] = XOR of a[t+p*m]
+##
+##  for the taps p and m = 2**j, so
+##  with m = 8, 16, 32, ... the
+##  BYTES obey the very same
+##  recurrence with m = 1, 2, 4, ...
+##  With NumPy the buffer is filled
+##  in place by one XOR per tap per
+##  block, blocks growing like those
+##  of "generate()". Without it the
+##  bytes come from "next_bits()"
+##  a few thousand at a time.
+####################################
+##  FLOATS
+##
+##  Dividing a draw by 131071 or
+##  (2**61)-1 gives floats with big
+##  gaps between them (a 17 bit
+##  register can only make 131,071
+##  different ones) and costs a
+##  rejection loop each time.
+##
+##  "random()" takes 53 fresh bits
+##  from "getbits()" (the mantissa
+##  of a double) and multiplies by
+##  2**-53: every value k * 2**-53
+##  in [0,1) is equally likely, and
+##  nothing is thrown back.
+##
+##  "random_array(count,dtype)"
+##  does the same for a whole NumPy
+##  array (53 bits per float64, 24
+##  per float32). The bit stream is
+##  made with "readinto()" and cut
+##  into 53 or 24 bit pieces with
+##  a few shifts; the bits come in
+##  exactly the same order as from
+##  "getbits()", reservoir first,
+##  so the array holds the same
+##  values as calling "random()"
+##  over and over.
+##
+##  On one core that comes to about
+##  40 to 45 million float64 and 60
+##  to 70 million float32 a second,
+##  NOT hundreds of millions. The
+##  bit stream itself would do over
+##  250 million floats a second; the
+##  time goes in cutting it into 53
+##  or 24 bit pieces that do not
+##  line up with bytes. Taking the
+##  top 53 bits of every word from
+##  "LfsrEngine.generate_words()"
+##  instead measures slower still
+##  (about 33 million a second) and
+##  would no longer match "random()".
+####################################
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; the array draws need it.
+    np = None
+
+from pseudo_random_lfsr_engine import LfsrEngine
+from pseudo_random_lfsr_engine import fnc_compile_taps
+from pseudo_random_lfsr_engine import fnc_convert_binary_string_to_integer
+from pseudo_random_lfsr_engine import fnc_step_table
+from pseudo_random_primitive import fnc_check_maximal_taps
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Lemire thresholds, (register mask, n) -> mask % n. Shared
+##  by every generator and emptied when it reaches the size limit.
+dict_LEMIRE_THRESHOLDS = {}
+int_THRESHOLD_CACHE_SIZE = 4096
+
+##  Wide draws, n -> (word bits L, Lemire threshold (2**L) % n).
+##  Same size limit as the thresholds.
+dict_WIDE_DRAW_PLANS = {}
+
+##  Extra bits beyond the bit length of n tried when planning a
+##  wide draw.
+int_WIDE_EXTRA_BITS = 16
+
+##  Fresh states made per "generate()" call by the array draws
+##  (each of them takes "int_bits" register states).
+int_FRESH_BLOCK = 1 << 16
+
+##  "sample_array()" copies 0..n-1 for every row when that takes
+##  no more than this many items in all.
+int_SAMPLE_TABLE_ITEMS = 1 << 24
+
+##  Bytes made per "next_bits()" call when filling a buffer
+##  without NumPy.
+int_BYTES_CHUNK = 4096
+
+##  Mantissa bits of a float64 / float32, and floats made per
+##  block by "random_array()".
+int_FLOAT64_BITS = 53
+int_FLOAT32_BITS = 24
+int_FLOAT_BLOCK = 1 << 20
+
+##  Most draws "randbelow_many()" packs into one mixed-radix number
+##  is kept to this many bits; best group size per n is cached.
+int_RADIX_WORD_BITS = 64
+dict_RADIX_GROUPS = {}
+
+##  The array draw multiplies states by n in 64 bit words, so it
+##  is used up to this register width (wider ones draw one by
+##  one).
+int_ARRAY_DRAW_BITS = 32
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_lemire_threshold(int_mask,int_n):
+    ##  (2**bits - 1) % n, cached.
+
+    tpl_key = (int_mask,int_n)
+    int_threshold = dict_LEMIRE_THRESHOLDS.get(tpl_key)
+    if int_threshold is None:
+        if len(dict_LEMIRE_THRESHOLDS) >= int_THRESHOLD_CACHE_SIZE:
+            dict_LEMIRE_THRESHOLDS.clear()
+        int_threshold = int_mask % int_n
+        dict_LEMIRE_THRESHOLDS[tpl_key] = int_threshold
+
+    return int_threshold
+
+######################################################
+######################################################
+
+def fnc_wide_draw_plan(int_n):
+    ##  (L, (2**L) % n) for a draw 0 through n-1 from an L bit
+    ##  word, with L chosen to keep the expected number of steps
+    ##
+    ##      L * 2**L / (2**L - threshold)
+    ##
+    ##  as small as possible. Cached.
+
+    tpl_plan = dict_WIDE_DRAW_PLANS.get(int_n)
+    if tpl_plan is None:
+        if len(dict_WIDE_DRAW_PLANS) >= int_THRESHOLD_CACHE_SIZE:
+            dict_WIDE_DRAW_PLANS.clear()
+        int_low_bits = (int_n - 1).bit_length()
+        flt_best = None
+        for int_word_bits in range(int_low_bits,
+                                   int_low_bits + int_WIDE_EXTRA_BITS + 1):
+            int_words = 1 << int_word_bits
+            int_threshold = int_words % int_n
+            flt_steps = int_word_bits * int_words / (int_words - int_threshold)
+            if flt_best is None or flt_steps < flt_best:
+                flt_best = flt_steps
+                tpl_plan = (int_word_bits,int_threshold)
+        dict_WIDE_DRAW_PLANS[int_n] = tpl_plan
+
+    return tpl_plan
+
+######################################################
+######################################################
+
+def fnc_radix_group(int_n):
+    ##  How many draws of 0 .. n-1 "randbelow_many()" takes from one
+    ##  mixed-radix number: the group size g (n**g within
+    ##  int_RADIX_WORD_BITS bits) with the fewest expected bits per
+    ##  draw. Cached.
+
+    if int_n < 2:
+        return 1                  ##  1**g never grows, so the loop
+                                  ##  below would never end
+
+    int_group = dict_RADIX_GROUPS.get(int_n)
+    if int_group is None:
+        if len(dict_RADIX_GROUPS) >= int_THRESHOLD_CACHE_SIZE:
+            dict_RADIX_GROUPS.clear()
+        int_group = 1
+        flt_best = None
+        int_g = 1
+        while int_g == 1 or (int_n ** int_g - 1).bit_length() \
+                <= int_RADIX_WORD_BITS:
+            int_word_bits,int_threshold = fnc_wide_draw_plan(int_n ** int_g)
+            flt_bits = int_word_bits * (1 << int_word_bits) \
+                / ((1 << int_word_bits) - int_threshold) / int_g
+            if flt_best is None or flt_bits < flt_best:
+                flt_best = flt_bits
+                int_group = int_g
+            int_g += 1
+        dict_RADIX_GROUPS[int_n] = int_group
+
+    return int_group
+
+######################################################
+######################################################
+
+def fnc_bit_fields(arr_bytes,int_first_bit,int_width,int_count):
+    ##  NumPy uint64 array of "int_count" fields of "int_width" bits
+    ##  (64 at most) back to back in the byte array, the first one
+    ##  starting "int_first_bit" bits in, first bit highest. The
+    ##  array must have 9 spare bytes after the last field.
+    ##
+    ##  Every "int_group" fields the fields line up with the bytes
+    ##  the same way again, so field j, j+group, j+2*group, ...
+    ##  all start the same number of bits into a byte and a fixed
+    ##  number of bytes apart: one strided big-endian view each.
+
+    int_group = 8 // math.gcd(int_width,8)
+    int_stride = int_width * int_group // 8
+    arr_fields = np.empty(int_count,dtype=np.uint64)
+    for int_j in range(min(int_group,int_count)):
+        int_bit = int_first_bit + int_j * int_width
+        int_byte = int_bit >> 3
+        int_shift = int_bit & 7
+        int_fields = len(range(int_j,int_count,int_group))
+        arr_words = np.ndarray((int_fields,),dtype=">u8",buffer=arr_bytes,
+                               offset=int_byte,strides=(int_stride,))
+        arr_field = arr_words.astype(np.uint64)
+        if int_shift:
+            ##  A field can reach 7 bits into a ninth byte
+            arr_next = np.ndarray((int_fields,),dtype=np.uint8,
+                                  buffer=arr_bytes,offset=int_byte + 8,
+                                  strides=(int_stride,))
+            arr_field <<= np.uint64(int_shift)
+            arr_field |= arr_next >> np.uint8(8 - int_shift)
+        arr_field >>= np.uint64(64 - int_width)
+        arr_fields[int_j::int_group] = arr_field
+
+    return arr_fields
+
+######################################################
+######################################################
+
+def fnc_fresh_state_array(obj_engine,int_count):
+    ##  NumPy array of the states an "LfsrEngine" reaches after
+    ##  int_bits, 2*int_bits, ... steps: states that do not share
+    ##  a single bit with each other. Leaves the engine on the last.
+
+    int_bits = obj_engine.int_bits
+    arr_fresh = np.empty(int_count,dtype=np.uint64)
+    arr_buffer = None
+    int_done = 0
+    while int_done < int_count:
+        int_block = min(int_FRESH_BLOCK,int_count - int_done)
+        if arr_buffer is None or len(arr_buffer) != int_block * int_bits:
+            arr_buffer = np.empty(int_block * int_bits,dtype=np.uint64)
+        obj_engine.generate(int_block * int_bits,arr_buffer)
+        arr_fresh[int_done:int_done + int_block] = \
+            arr_buffer[int_bits - 1::int_bits]
+        int_done += int_block
+
+    return arr_fresh
+
+######################################################
+######################################################
+
+def fnc_below_array(obj_engine,int_n,int_count):
+    ##  NumPy array of "int_count" draws 0 through int_n-1 from an
+    ##  "LfsrEngine", each built from fresh states as digits base
+    ##  M (see the notes at the top). int_n must be below 2**63.
+
+    int_mask = obj_engine.int_mask
+    int_digits = 1
+    while int_mask ** (int_digits + 1) < 1 << 64:
+        int_digits += 1
+    int_words = int_mask ** int_digits
+    if int_n > int_words or int_n >= 1 << 63:
+        raise ValueError("n is too big for 64 bit draws")
+    while int_digits > 1 and int_mask ** (int_digits - 1) >= 64 * int_n:
+        int_digits -= 1           ##  Fewer digits, still few thrown back
+        int_words = int_mask ** int_digits
+    int_limit = int_words - int_words % int_n
+
+    arr_result = np.empty(int_count,dtype=np.uint64)
+    arr_pending = np.arange(int_count)
+    while len(arr_pending):
+        arr_states = fnc_fresh_state_array(obj_engine,
+                                           len(arr_pending) * int_digits)
+        arr_states = arr_states.reshape(len(arr_pending),int_digits) \
+            - np.uint64(1)
+        arr_x = arr_states[:,0].copy()
+        int_place = 1
+        for int_d in range(1,int_digits):
+            int_place *= int_mask
+            arr_x += arr_states[:,int_d] * np.uint64(int_place)
+        arr_kept = arr_x < np.uint64(int_limit)
+        arr_result[arr_pending[arr_kept]] = arr_x[arr_kept] % np.uint64(int_n)
+        arr_pending = arr_pending[~arr_kept]
+
+    return arr_result
+
+######################################################
+######################################################
+##                                                  ##
+##                  C L A S S E S                   ##
+##                                                  ##
+######################################################
+######################################################
+
+class LfsrGenerator:
+    ##  A Fibonacci LFSR with integer state and nothing else.
+    ##
+    ##  int_bits, tpl_taps, seed, bool_maximal
+    ##      - exactly as for "LfsrEngine" (17 bits by default,
+    ##        like the example programs)
+    ##
+    ##  int_draws       - bounded draws handed out so far
+    ##  int_rejections  - states thrown back by those draws
+    ##  int_reservoir   - fresh bits not handed out yet by
+    ##                    "getbits()", int_reservoir_bits of them
+    ##  lst_word_table  - shared "fnc_step_table()" for moving
+    ##                    int_bits steps at once
+
+    __slots__ = ("int_bits","tpl_taps","int_mask","int_tap_mask",
+                 "int_state","int_draws","int_rejections",
+                 "int_reservoir","int_reservoir_bits","lst_word_table")
+
+    def __init__(self,int_bits=17,tpl_taps=None,seed=1,bool_maximal=True):
+
+        if bool_maximal and tpl_taps is not None:
+            fnc_check_maximal_taps(int_bits,tpl_taps)
+
+        tpl_compiled = fnc_compile_taps(int_bits,tpl_taps)
+        self.int_bits = int_bits
+        self.tpl_taps = tpl_compiled[0]
+        self.int_mask = tpl_compiled[1]
+        self.int_tap_mask = tpl_compiled[2]
+        self.lst_word_table = fnc_step_table(int_bits,self.tpl_taps)
+        self.int_state = 0
+        self.int_draws = 0
+        self.int_rejections = 0
+        self.int_reservoir = 0
+        self.int_reservoir_bits = 0
+        self.seed(seed)
+
+    ##################################################
+
+    def seed(self,seed):
+        ##  Load a new seed: a non-zero integer or a string of zeros
+        ##  and ones.
+
+        if isinstance(seed,str):
+            if len(seed) != self.int_bits:
+                raise ValueError("seed string must be "
+                                 + str(self.int_bits) + " characters long")
+            seed = fnc_convert_binary_string_to_integer(seed)
+        else:
+            seed = int(seed)
+
+        if seed <= 0 or seed > self.int_mask:
+            raise ValueError("seed must be 1 through " + str(self.int_mask)
+                             + " (NOTHING WILL HAPPEN IF THE SEED IS ZERO!)")
+
+        self.int_state = seed
+        self.int_reservoir = 0          ##  Bits of the old seed
+        self.int_reservoir_bits = 0
+
+    ##################################################
+
+    def next(self):
+        ##  Step once and return the new state (1 through (2**n)-1).
+
+        int_state = self.int_state
+        int_state = ((int_state << 1) & self.int_mask) \
+            | ((int_state & self.int_tap_mask).bit_count() & 1)
+        self.int_state = int_state
+
+        return int_state
+
+    ##################################################
+
+    def next_bits(self,int_count):
+        ##  Step "int_count" times and return the bits shifted in,
+        ##  the first one highest, as one integer. Whole words of
+        ##  int_bits steps are taken with the step table.
+
+        int_bits = self.int_bits
+        lst_word_table = self.lst_word_table
+        int_state = self.int_state
+        int_word = 0
+        while int_count >= int_bits:
+            ##  After int_bits steps every bit of the register is new
+            int_next = 0
+            for lst_table in lst_word_table:
+                int_next ^= lst_table[int_state & 255]
+                int_state >>= 8
+            int_state = int_next
+            int_word = (int_word << int_bits) | int_state
+            int_count -= int_bits
+
+        int_mask = self.int_mask
+        int_tap_mask = self.int_tap_mask
+        for int_i in range(int_count):
+            int_state = ((int_state << 1) & int_mask) \
+                | ((int_state & int_tap_mask).bit_count() & 1)
+        int_word = (int_word << int_count) \
+            | (int_state & ((1 << int_count) - 1))
+        self.int_state = int_state
+
+        return int_word
+
+    ##################################################
+
+    def getbits(self,int_k):
+        ##  Exactly "int_k" fresh bits as one integer, from the bit
+        ##  reservoir. The reservoir is topped up with whole words of
+        ##  int_bits new bits, oldest bits handed out first.
+
+        if int_k < 0:
+            raise ValueError("cannot take a negative number of bits")
+
+        int_have = self.int_reservoir_bits
+        int_reservoir = self.int_reservoir
+        if int_have < int_k:
+            int_bits = self.int_bits
+            int_refill = -(-(int_k - int_have) // int_bits) * int_bits
+            int_reservoir = (int_reservoir << int_refill) \
+                | self.next_bits(int_refill)
+            int_have += int_refill
+        int_have -= int_k
+        self.int_reservoir = int_reservoir & ((1 << int_have) - 1)
+        self.int_reservoir_bits = int_have
+
+        return int_reservoir >> int_have
+
+    ##################################################
+
+    def randbelow_bits(self,int_n):
+        ##  A random integer 0 through int_n-1 using as few reservoir
+        ##  bits as possible: Lemire's method over an L bit word
+        ##  from "getbits()", L picked by "fnc_wide_draw_plan()".
+
+        if int_n <= 0:
+            raise ValueError("n must be at least 1")
+        if int_n == 1:
+            return 0
+
+        int_word_bits,int_threshold = fnc_wide_draw_plan(int_n)
+        int_word_mask = (1 << int_word_bits) - 1
+        int_rejections = 0
+        while True:
+            int_product = self.getbits(int_word_bits) * int_n
+            if (int_product & int_word_mask) >= int_threshold:
+                break
+            int_rejections += 1
+        self.int_draws += 1
+        self.int_rejections += int_rejections
+
+        return int_product >> int_word_bits
+
+    ##################################################
+
+    def randbelow_digits(self,tpl_radices):
+        ##  One draw for each radix r in "tpl_radices" (0 through
+        ##  r-1 each), all taken from a single mixed-radix draw of
+        ##  0 .. (product of the radices)-1.
+
+        int_product = 1
+        for int_radix in tpl_radices:
+            if int_radix <= 0:
+                raise ValueError("every radix must be at least 1")
+            int_product *= int_radix
+
+        int_value = self.randbelow_bits(int_product)
+        lst_digits = []
+        for int_radix in tpl_radices:
+            int_value,int_digit = divmod(int_value,int_radix)
+            lst_digits.append(int_digit)
+
+        return lst_digits
+
+    ##################################################
+
+    def randbelow_many(self,int_n,int_count):
+        ##  List of "int_count" draws of 0 through int_n-1, taken
+        ##  "fnc_radix_group(int_n)" at a time from one mixed-radix
+        ##  draw each.
+
+        if int_n <= 0:
+            raise ValueError("n must be at least 1")
+
+        int_group = fnc_radix_group(int_n)
+        int_words = int_n ** int_group
+        lst_draws = []
+        while len(lst_draws) < int_count:
+            int_value = self.randbelow_bits(int_words)
+            for int_i in range(min(int_group,int_count - len(lst_draws))):
+                int_value,int_digit = divmod(int_value,int_n)
+                lst_draws.append(int_digit)
+
+        return lst_draws
+
+    ##################################################
+
+    def randbelow(self,int_n):
+        ##  A random integer 0 through int_n-1, every one equally
+        ##  likely: states above the largest multiple of int_n are
+        ##  thrown back, the rest are taken modulo int_n. Ranges
+        ##  bigger than the register go to "randbelow_wide()".
+
+        int_mask = self.int_mask
+        if int_n > int_mask:
+            return self.randbelow_wide(int_n)
+        if int_n <= 0:
+            raise ValueError("n must be at least 1")
+
+        int_tap_mask = self.int_tap_mask
+        int_max = int_mask - (int_mask % int_n)
+        int_state = self.int_state
+        int_rejections = 0
+        while True:
+            int_state = ((int_state << 1) & int_mask) \
+                | ((int_state & int_tap_mask).bit_count() & 1)
+            if int_state <= int_max:
+                break
+            int_rejections += 1
+        self.int_state = int_state
+        self.int_draws += 1
+        self.int_rejections += int_rejections
+
+        return int_state % int_n
+
+    ##################################################
+
+    def randint(self,int_a,int_b):
+        ##  A random integer int_a through int_b (both included).
+
+        if int_b < int_a:
+            raise ValueError("empty range " + str(int_a) + " through "
+                             + str(int_b))
+
+        return int_a + self.randbelow(int_b - int_a + 1)
+
+    ##################################################
+
+    def randbelow_wide(self,int_n):
+        ##  A random integer 0 through int_n-1 for ANY size of int_n,
+        ##  from words of fresh bits (see the notes at the top).
+
+        if int_n <= 0:
+            raise ValueError("n must be at least 1")
+        if int_n == 1:
+            return 0
+
+        int_word_bits,int_threshold = fnc_wide_draw_plan(int_n)
+        int_word_mask = (1 << int_word_bits) - 1
+        int_rejections = 0
+        while True:
+            int_product = self.next_bits(int_word_bits) * int_n
+            if (int_product & int_word_mask) >= int_threshold:
+                break
+            int_rejections += 1
+        self.int_draws += 1
+        self.int_rejections += int_rejections
+
+        return int_product >> int_word_bits
+
+    ##################################################
+
+    def randbelow_fresh(self,int_n):
+        ##  Like "randbelow()", but every draw comes from a fresh
+        ##  state (int_bits steps on), so draws in a row do not
+        ##  share bits. Ranges bigger than the register go to
+        ##  "randbelow_wide()", which already uses fresh bits.
+
+        int_mask = self.int_mask
+        if int_n > int_mask:
+            return self.randbelow_wide(int_n)
+        if int_n <= 0:
+            raise ValueError("n must be at least 1")
+
+        int_max = int_mask - (int_mask % int_n)
+        int_bits = self.int_bits
+        int_rejections = 0
+        while True:
+            int_state = self.next_bits(int_bits)
+            if int_state <= int_max:
+                break
+            int_rejections += 1
+        self.int_draws += 1
+        self.int_rejections += int_rejections
+
+        return int_state % int_n
+
+    ##################################################
+
+    def pseudo_random_1_thru_n(self,int_n):
+        ##  A random integer 1 through int_n by Lemire's method, one
+        ##  register step per try (see the notes at the top). Not the
+        ##  same numbers as "randint(1,n)", but every value is equally
+        ##  likely.
+
+        int_mask = self.int_mask
+        if int_n <= 0 or int_n > int_mask:
+            raise ValueError("n must be 1 through " + str(int_mask))
+
+        int_threshold = fnc_lemire_threshold(int_mask,int_n)
+        int_bits = self.int_bits
+        int_tap_mask = self.int_tap_mask
+        int_state = self.int_state
+        int_rejections = 0
+        while True:
+            int_state = ((int_state << 1) & int_mask) \
+                | ((int_state & int_tap_mask).bit_count() & 1)
+            int_product = (int_state - 1) * int_n
+            int_high = int_product >> int_bits
+            int_low = (int_product & int_mask) + int_high
+            if int_low >= int_mask:
+                int_high += 1
+                int_low -= int_mask
+            if int_low >= int_threshold:
+                break
+            int_rejections += 1
+        self.int_state = int_state
+        self.int_draws += 1
+        self.int_rejections += int_rejections
+
+        return int_high + 1
+
+    ##################################################
+
+    def pseudo_random_1_thru_n_fresh(self,int_n):
+        ##  Like "pseudo_random_1_thru_n()", but every try comes from
+        ##  a fresh state (int_bits steps on), so draws in a row do
+        ##  not share bits.
+
+        int_mask = self.int_mask
+        if int_n <= 0 or int_n > int_mask:
+            raise ValueError("n must be 1 through " + str(int_mask))
+
+        int_threshold = fnc_lemire_threshold(int_mask,int_n)
+        int_bits = self.int_bits
+        int_rejections = 0
+        while True:
+            int_product = (self.next_bits(int_bits) - 1) * int_n
+            int_high = int_product >> int_bits
+            int_low = (int_product & int_mask) + int_high
+            if int_low >= int_mask:
+                int_high += 1
+                int_low -= int_mask
+            if int_low >= int_threshold:
+                break
+            int_rejections += 1
+        self.int_draws += 1
+        self.int_rejections += int_rejections
+
+        return int_high + 1
+
+    ##################################################
+
+    def pseudo_random_1_thru_n_array(self,int_n,int_count,bool_fresh=False):
+        ##  NumPy array of "int_count" draws 1 through int_n, the same
+        ##  values "pseudo_random_1_thru_n()" would give one by one
+        ##  ("pseudo_random_1_thru_n_fresh()" with "bool_fresh").
+
+        if np is None:
+            raise ImportError("pseudo_random_1_thru_n_array() needs NumPy")
+
+        int_mask = self.int_mask
+        if int_n <= 0 or int_n > int_mask:
+            raise ValueError("n must be 1 through " + str(int_mask))
+        if self.int_bits > int_ARRAY_DRAW_BITS:
+            fnc_draw = self.pseudo_random_1_thru_n_fresh if bool_fresh \
+                else self.pseudo_random_1_thru_n
+            return np.fromiter((fnc_draw(int_n) for int_i in range(int_count)),
+                               dtype=np.uint64,count=int_count)
+
+        arr_result = np.empty(int_count,dtype=np.uint64)
+        int_threshold = fnc_lemire_threshold(int_mask,int_n)
+        obj_engine = LfsrEngine(self.int_bits,self.tpl_taps,self.int_state,
+                                False)
+        int_done = 0
+        while int_done < int_count:
+            ##  Enough states for what is left, allowing for the
+            ##  expected share to be thrown back.
+            int_need = int_count - int_done
+            int_block = int_need + int_need * int_threshold \
+                // (int_mask - int_threshold) + 64
+            if bool_fresh:
+                arr_states = fnc_fresh_state_array(obj_engine,int_block)
+            else:
+                arr_states = obj_engine.generate(int_block)
+
+            arr_product = (arr_states - np.uint64(1)) * np.uint64(int_n)
+            arr_high = arr_product >> np.uint64(self.int_bits)
+            arr_low = (arr_product & np.uint64(int_mask)) + arr_high
+            arr_carry = arr_low >= np.uint64(int_mask)
+            arr_high += arr_carry
+            arr_low -= arr_carry * np.uint64(int_mask)
+            arr_kept = np.flatnonzero(arr_low >= np.uint64(int_threshold))
+
+            int_take = min(len(arr_kept),int_need)
+            if int_take:
+                arr_result[int_done:int_done + int_take] = \
+                    arr_high[arr_kept[:int_take]] + np.uint64(1)
+            if int_take == int_need:
+                ##  Only the states up to the last one used count
+                int_used = int(arr_kept[int_take - 1]) + 1
+            else:
+                int_used = int_block
+            self.int_state = int(arr_states[int_used - 1])
+            obj_engine.int_state = self.int_state
+            self.int_rejections += int_used - int_take
+            int_done += int_take
+        self.int_draws += int_count
+
+        return arr_result
+
+    ##################################################
+
+    def shuffle_indices(self,int_n):
+        ##  Swap targets for a Fisher-Yates shuffle of int_n items:
+        ##  item k of the result is the j (0 through n-1-k) that
+        ##  item n-1-k is swapped with, drawn from fresh states in
+        ##  passes (see the notes at the top). A NumPy
+        ##  array when NumPy is installed and the register is 32
+        ##  bits or less, a list otherwise -- the same numbers
+        ##  either way. More items than the register has states:
+        ##  one "randbelow_fresh()" per item instead.
+
+        int_mask = self.int_mask
+        int_count = max(0,int_n - 1)
+        if int_n > int_mask:
+            lst_targets = [self.randbelow_fresh(int_i + 1)
+                           for int_i in range(int_n - 1,0,-1)]
+            return lst_targets
+
+        int_rejections = 0
+        if np is not None and self.int_bits <= int_ARRAY_DRAW_BITS:
+            arr_targets = np.zeros(int_count,dtype=np.uint64)
+            arr_bounds = np.arange(int_n,1,-1,dtype=np.uint64)
+            arr_limits = np.uint64(int_mask) \
+                - np.uint64(int_mask) % arr_bounds
+            arr_pending = np.arange(int_count)
+            obj_engine = LfsrEngine(self.int_bits,self.tpl_taps,
+                                    self.int_state,False)
+            while len(arr_pending):
+                arr_states = fnc_fresh_state_array(obj_engine,
+                                                   len(arr_pending))
+                arr_kept = arr_states <= arr_limits[arr_pending]
+                arr_targets[arr_pending[arr_kept]] = \
+                    arr_states[arr_kept] % arr_bounds[arr_pending[arr_kept]]
+                arr_pending = arr_pending[~arr_kept]
+                int_rejections += len(arr_pending)
+            self.int_state = obj_engine.int_state
+            self.int_draws += int_count
+            self.int_rejections += int_rejections
+            return arr_targets
+
+        int_bits = self.int_bits
+        lst_targets = [0] * int_count
+        lst_pending = list(range(int_count))
+        while lst_pending:
+            lst_rejected = []
+            for int_k in lst_pending:
+                int_bound = int_n - int_k
+                int_state = self.next_bits(int_bits)
+                if int_state <= int_mask - int_mask % int_bound:
+                    lst_targets[int_k] = int_state % int_bound
+                else:
+                    lst_rejected.append(int_k)
+            lst_pending = lst_rejected
+            int_rejections += len(lst_rejected)
+        self.int_draws += int_count
+        self.int_rejections += int_rejections
+
+        return lst_targets
+
+    ##################################################
+
+    def shuffle(self,seq):
+        ##  Shuffle a list, bytearray or NumPy array in place in O(n).
+        ##  NumPy arrays are shuffled along their first axis.
+
+        int_n = len(seq)
+        lst_targets = self.shuffle_indices(int_n)
+        if not isinstance(lst_targets,list):
+            lst_targets = lst_targets.tolist()
+
+        if np is not None and isinstance(seq,np.ndarray):
+            ##  Swapping single NumPy items is slow, so the swaps are
+            ##  done on a list of positions and applied in one go.
+            lst_order = list(range(int_n))
+            for int_i,int_j in zip(range(int_n - 1,0,-1),lst_targets):
+                lst_order[int_i],lst_order[int_j] = \
+                    lst_order[int_j],lst_order[int_i]
+            seq[...] = seq[np.array(lst_order,dtype=np.intp)]
+            return
+
+        for int_i,int_j in zip(range(int_n - 1,0,-1),lst_targets):
+            seq[int_i],seq[int_j] = seq[int_j],seq[int_i]
+
+    ##################################################
+
+    def sample(self,int_n,int_k):
+        ##  List of int_k different integers from 0..int_n-1, in
+        ##  random order. A Fisher-Yates shuffle of 0..n-1 stopped
+        ##  after k swaps; "dict_moved" holds only the places that
+        ##  no longer hold their own number.
+
+        if int_k < 0 or int_k > int_n:
+            raise ValueError("cannot take " + str(int_k)
+                             + " different numbers from " + str(int_n))
+
+        dict_moved = {}
+        lst_sample = []
+        for int_i in range(int_k):
+            int_j = int_i + self.randbelow_fresh(int_n - int_i)
+            lst_sample.append(dict_moved.get(int_j,int_j))
+            dict_moved[int_j] = dict_moved.get(int_i,int_i)
+            dict_moved.pop(int_i,None)      ##  Place i is never used again
+
+        return lst_sample
+
+    ##################################################
+
+    def sample_array(self,int_n,int_k,int_count):
+        ##  NumPy array of shape (int_count,int_k): each row is a
+        ##  separate sample of int_k different integers from
+        ##  0..int_n-1, in random order.
+
+        if np is None:
+            raise ImportError("sample_array() needs NumPy")
+        if int_k < 0 or int_k > int_n:
+            raise ValueError("cannot take " + str(int_k)
+                             + " different numbers from " + str(int_n))
+
+        obj_engine = LfsrEngine(self.int_bits,self.tpl_taps,self.int_state,
+                                False)
+        arr_rows = np.arange(int_count)
+        if int_n * int_count <= int_SAMPLE_TABLE_ITEMS:
+            ##  Every row shuffles its own copy of 0..n-1, k swaps
+            arr_table = np.tile(np.arange(int_n,dtype=np.uint64),
+                                (int_count,1))
+            for int_i in range(int_k):
+                arr_j = np.uint64(int_i) \
+                    + fnc_below_array(obj_engine,int_n - int_i,int_count)
+                arr_j = arr_j.astype(np.intp)
+                arr_swap = arr_table[arr_rows,arr_j]
+                arr_table[arr_rows,arr_j] = arr_table[:,int_i]
+                arr_table[:,int_i] = arr_swap
+            arr_samples = arr_table[:,:int_k].copy()
+        elif int_k * int_k <= int_n:
+            ##  Draw whole rows, then draw again any row with a repeat
+            ##  (at most about half of them the first time round)
+            arr_samples = np.empty((int_count,int_k),dtype=np.uint64)
+            arr_pending = arr_rows
+            while len(arr_pending):
+                arr_draws = fnc_below_array(obj_engine,int_n,
+                                            len(arr_pending) * int_k)
+                arr_draws = arr_draws.reshape(len(arr_pending),int_k)
+                arr_sorted = np.sort(arr_draws,axis=1)
+                arr_kept = ~(arr_sorted[:,1:] == arr_sorted[:,:-1]).any(axis=1)
+                arr_samples[arr_pending[arr_kept]] = arr_draws[arr_kept]
+                arr_pending = arr_pending[~arr_kept]
+        else:
+            ##  Neither trick pays off; one row at a time
+            self.int_state = obj_engine.int_state
+            return np.array([self.sample(int_n,int_k)
+                             for int_i in range(int_count)],
+                            dtype=np.uint64).reshape(int_count,int_k)
+
+        self.int_state = obj_engine.int_state
+        self.int_draws += int_count * int_k
+        return arr_samples
+
+    ##################################################
+
+    def readinto(self,buffer):
+        ##  Fill the writable "buffer" with random bytes, in place,
+        ##  and return how many were written. Bits still in the
+        ##  "getbits()" reservoir are left there.
+
+        obj_view = memoryview(buffer)
+        if obj_view.readonly:
+            raise TypeError("buffer is read-only")
+        obj_view = obj_view.cast("B")
+        int_count = len(obj_view)
+        int_bits = self.int_bits
+
+        if np is None or int_count < 4 * int_bits:
+            for int_start in range(0,int_count,int_BYTES_CHUNK):
+                int_chunk = min(int_BYTES_CHUNK,int_count - int_start)
+                obj_view[int_start:int_start + int_chunk] = \
+                    self.next_bits(8 * int_chunk).to_bytes(int_chunk,"big")
+            return int_count
+
+        arr_bytes = np.frombuffer(obj_view,dtype=np.uint8)
+        int_known = 4 * int_bits
+        arr_bytes[0:int_known] = np.frombuffer(
+            self.next_bits(8 * int_known).to_bytes(int_known,"big"),
+            dtype=np.uint8)
+
+        int_top_tap = self.tpl_taps[-1]
+        tpl_rest = self.tpl_taps[1:]      ##  Position 0 is always tapped
+        while int_known < int_count:
+            int_spread = 1
+            while int_bits * int_spread * 2 <= int_known:
+                int_spread *= 2
+            int_block = min((int_bits - int_top_tap) * int_spread,
+                            int_count - int_known)
+            int_base = int_known - int_bits * int_spread
+
+            arr_block = arr_bytes[int_known:int_known + int_block]
+            np.copyto(arr_block,arr_bytes[int_base:int_base + int_block])
+            for int_tap in tpl_rest:
+                int_from = int_base + int_tap * int_spread
+                np.bitwise_xor(arr_block,
+                               arr_bytes[int_from:int_from + int_block],
+                               out=arr_block)
+            int_known += int_block
+
+        ##  The register ends on the last int_bits bits written
+        int_tail = (int_bits + 7) // 8
+        self.int_state = int.from_bytes(obj_view[int_count - int_tail:],
+                                        "big") & self.int_mask
+        del arr_bytes
+
+        return int_count
+
+    ##################################################
+
+    def randbytes(self,int_n):
+        ##  "int_n" random bytes, like "random.randbytes()".
+
+        if int_n < 0:
+            raise ValueError("cannot make a negative number of bytes")
+
+        bytes_out = bytearray(int_n)
+        self.readinto(bytes_out)
+
+        return bytes(bytes_out)
+
+    ##################################################
+
+    def random(self):
+        ##  A float in [0,1) from 53 fresh bits.
+
+        return self.getbits(int_FLOAT64_BITS) * 2.0 ** -int_FLOAT64_BITS
+
+    ##################################################
+
+    def random_array(self,int_count,dtype=None):
+        ##  NumPy array of "int_count" floats in [0,1): float64 (the
+        ##  default) from 53 bits each, or float32 from 24 bits each.
+        ##  Same values as "random()" (or getbits(24) * 2**-24).
+        ##  About 40 to 45 million float64 a second on one core (see
+        ##  the notes at the top).
+
+        if np is None:
+            raise ImportError("random_array() needs NumPy")
+        obj_dtype = np.dtype(np.float64 if dtype is None else dtype)
+        if obj_dtype == np.float64:
+            int_width = int_FLOAT64_BITS
+        elif obj_dtype == np.float32:
+            int_width = int_FLOAT32_BITS
+        else:
+            raise ValueError("dtype must be float64 or float32")
+
+        arr_floats = np.empty(int_count,dtype=obj_dtype)
+        for int_start in range(0,int_count,int_FLOAT_BLOCK):
+            int_block = min(int_FLOAT_BLOCK,int_count - int_start)
+            arr_fields = self.getbits_array(int_width,int_block)
+            np.multiply(arr_fields,2.0 ** -int_width,
+                        out=arr_floats[int_start:int_start + int_block],
+                        casting="unsafe")
+
+        return arr_floats
+
+    ##################################################
+
+    def getbits_array(self,int_width,int_count):
+        ##  NumPy uint64 array of "int_count" getbits(int_width) in a
+        ##  row (int_width up to 64): the reservoir first, then the
+        ##  bit stream from "readinto()", and the reservoir left
+        ##  holding what "getbits()" would have left in it.
+
+        if np is None:
+            raise ImportError("getbits_array() needs NumPy")
+        if int_width < 0 or int_width > 64:
+            raise ValueError("fields must be 0 through 64 bits wide")
+
+        int_bits = self.int_bits
+        int_have = self.int_reservoir_bits
+        int_wanted = int_count * int_width - int_have
+        if int_wanted < 64 * int_bits:
+            return np.array([self.getbits(int_width)
+                             for int_i in range(int_count)],
+                            dtype=np.uint64)
+
+        ##  Whole words of int_bits, as the reservoir is refilled
+        int_total = -(-int_wanted // int_bits) * int_bits
+        int_bytes = (int_total + 7) // 8
+        arr_bytes = np.zeros(int_bytes + 9,dtype=np.uint8)
+        self.readinto(arr_bytes[:int_bytes])
+
+        ##  Fields that start in the reservoir
+        arr_fields = np.empty(int_count,dtype=np.uint64)
+        int_first = -(-int_have // int_width) if int_width else int_count
+        int_first = min(int_first,int_count)
+        int_head = (self.int_reservoir << 64) \
+            | int.from_bytes(arr_bytes[:8].tobytes(),"big")
+        for int_i in range(int_first):
+            int_shift = int_have + 64 - (int_i + 1) * int_width
+            arr_fields[int_i] = (int_head >> int_shift) \
+                & ((1 << int_width) - 1)
+        arr_fields[int_first:] = fnc_bit_fields(
+            arr_bytes,int_first * int_width - int_have,int_width,
+            int_count - int_first)
+
+        ##  Register on bit int_total, the rest back in the reservoir
+        int_used = int_count * int_width - int_have
+        int_tail = int.from_bytes(
+            arr_bytes[max(0,int_bytes - 64):int_bytes].tobytes(),"big")
+        int_tail >>= 8 * int_bytes - int_total
+        self.int_state = int_tail & self.int_mask
+        self.int_reservoir_bits = int_total - int_used
+        self.int_reservoir = int_tail & ((1 << self.int_reservoir_bits) - 1)
+
+        return arr_fields
+
+    ##################################################
+
+    def rejection_rate(self):
+        ##  Share of the states used by bounded draws that were
+        ##  thrown back (0.0 before any draw).
+
+        int_states = self.int_draws + self.int_rejections
+        if int_states == 0:
+            return 0.0
+
+        return self.int_rejections / int_states
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
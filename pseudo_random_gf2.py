@@ -0,0 +1,267 @@
+##  program name:
+##  "pseudo_random_gf2.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Binary polynomial arithmetic
+##  (arithmetic in GF(2)[x]) for the
+##  LFSR generators in this folder.
+##
+##  A polynomial is kept as an
+##  integer whose bit i is the
+##  coefficient of x**i. Adding two
+##  polynomials is XOR (1 + 1 = 0 in
+##  binary arithmetic) and
+##  multiplying is "shift and XOR"
+##  instead of "shift and add."
+##
+##  An n bit register with tap
+##  POSITIONS p (position 0 is the
+##  highest-order bit) produces a
+##  bit sequence with
+##
+##    a[t+n] = XOR of a[t+p]
+##
+##  and its FEEDBACK POLYNOMIAL is
+##
+##    P(x) = x**n + SUM of x**p
+##
+##  Stepping the register N times is
+##  the same as multiplying by x**N
+##  modulo P(x). Finding x**N by
+##  repeated squaring takes about
+##  log2(N) multiplications instead
+##  of N steps, which is how the
+##  engine jumps ahead.
+####################################
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Cache of x**(2**k) mod P(x), feedback polynomial -> list
+##  where item k is x**(2**k) mod P(x). Grows on demand.
+dict_POWER_OF_TWO_JUMPS = {}
+
+##  Squaring a binary polynomial just spreads its bits apart
+##  (every cross term appears twice and cancels), so squares are
+##  built a byte at a time from this table: byte -> 16 bit spread.
+lst_SPREAD_BYTE = [int("0".join(format(int_b,"08b")),2) for int_b in range(256)]
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_feedback_polynomial(int_bits,tpl_taps):
+    ##  P(x) = x**n + SUM of x**p for the tap POSITIONS p.
+
+    int_poly = 1 << int_bits
+    for int_tap in tpl_taps:
+        int_poly ^= 1 << int_tap
+
+    return int_poly
+
+######################################################
+######################################################
+
+def fnc_gf2_degree(int_poly):
+    ##  Degree of a polynomial (-1 for the zero polynomial).
+
+    return int_poly.bit_length() - 1
+
+######################################################
+######################################################
+
+def fnc_gf2_multiply(int_a,int_b):
+    ##  Carry-less product of two polynomials (no reduction).
+
+    int_result = 0
+    while int_b:
+        if int_b & 1:
+            int_result ^= int_a
+        int_a <<= 1
+        int_b >>= 1
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_gf2_square(int_a):
+    ##  int_a * int_a without reduction, by table lookup.
+
+    int_result = 0
+    int_shift = 0
+    while int_a:
+        int_result |= lst_SPREAD_BYTE[int_a & 255] << int_shift
+        int_a >>= 8
+        int_shift += 16
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_gf2_mod(int_a,int_poly):
+    ##  Remainder of int_a divided by int_poly.
+
+    int_degree = int_poly.bit_length() - 1
+    int_length = int_a.bit_length()
+    while int_length > int_degree:
+        int_a ^= int_poly << (int_length - 1 - int_degree)
+        int_length = int_a.bit_length()
+
+    return int_a
+
+######################################################
+######################################################
+
+def fnc_gf2_multiply_mod(int_a,int_b,int_poly):
+    ##  (int_a * int_b) mod int_poly for int_a, int_b already
+    ##  reduced. Reduces as it goes so nothing grows past the
+    ##  degree of int_poly.
+
+    int_degree = int_poly.bit_length() - 1
+    int_top = 1 << int_degree
+    int_result = 0
+    while int_b:
+        if int_b & 1:
+            int_result ^= int_a
+        int_b >>= 1
+        int_a <<= 1
+        if int_a & int_top:
+            int_a ^= int_poly
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_gf2_power_mod(int_a,int_e,int_poly):
+    ##  int_a ** int_e mod int_poly by repeated squaring.
+
+    int_result = fnc_gf2_mod(1,int_poly)
+    int_a = fnc_gf2_mod(int_a,int_poly)
+    while int_e > 0:
+        if int_e & 1:
+            int_result = fnc_gf2_multiply_mod(int_result,int_a,int_poly)
+        int_a = fnc_gf2_multiply_mod(int_a,int_a,int_poly)
+        int_e >>= 1
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_power_of_two_jumps(int_poly,int_count):
+    ##  Return the cached list [x**1, x**2, x**4, ... ] mod P(x)
+    ##  with at least "int_count" entries.
+
+    lst_jumps = dict_POWER_OF_TWO_JUMPS.get(int_poly)
+    if lst_jumps is None:
+        lst_jumps = [fnc_gf2_mod(2,int_poly)]
+        dict_POWER_OF_TWO_JUMPS[int_poly] = lst_jumps
+
+    while len(lst_jumps) < int_count:
+        int_last = lst_jumps[-1]
+        lst_jumps.append(fnc_gf2_multiply_mod(int_last,int_last,int_poly))
+
+    return lst_jumps
+
+######################################################
+######################################################
+
+def fnc_x_to_the_n_mod(int_n,int_poly):
+    ##  x**int_n mod P(x) built from the cached powers of two, so
+    ##  only one multiplication per set bit of int_n is needed.
+
+    if int_n < 0:
+        raise ValueError("cannot raise x to a negative power here")
+
+    lst_jumps = fnc_power_of_two_jumps(int_poly,int_n.bit_length())
+    int_result = fnc_gf2_mod(1,int_poly)
+    int_k = 0
+    while int_n:
+        if int_n & 1:
+            int_result = fnc_gf2_multiply_mod(int_result,lst_jumps[int_k],
+                                              int_poly)
+        int_n >>= 1
+        int_k += 1
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_gf2_apply_matrix(lst_columns,int_vector):
+    ##  Multiply a bit vector by a binary matrix given as a list of
+    ##  columns (column i is the image of bit i): XOR together the
+    ##  columns for every bit that is set.
+
+    int_result = 0
+    int_i = 0
+    while int_vector:
+        if int_vector & 1:
+            int_result ^= lst_columns[int_i]
+        int_vector >>= 1
+        int_i += 1
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_gf2_matrix_inverse(lst_columns):
+    ##  Inverse of a square binary matrix given as a list of
+    ##  columns, also returned as a list of columns. Plain
+    ##  Gauss-Jordan elimination with each row held in one integer.
+
+    int_size = len(lst_columns)
+
+    ##  Row r of the matrix, with the identity matrix alongside it
+    ##  in the bits above int_size.
+    lst_rows = []
+    for int_r in range(int_size):
+        int_row = 0
+        for int_c in range(int_size):
+            if (lst_columns[int_c] >> int_r) & 1:
+                int_row |= 1 << int_c
+        lst_rows.append(int_row | (1 << (int_size + int_r)))
+
+    for int_c in range(int_size):
+        int_pivot = int_c
+        while int_pivot < int_size and not (lst_rows[int_pivot] >> int_c) & 1:
+            int_pivot += 1
+        if int_pivot == int_size:
+            raise ValueError("binary matrix is not invertible")
+        lst_rows[int_c],lst_rows[int_pivot] = \
+            lst_rows[int_pivot],lst_rows[int_c]
+        for int_r in range(int_size):
+            if int_r != int_c and (lst_rows[int_r] >> int_c) & 1:
+                lst_rows[int_r] ^= lst_rows[int_c]
+
+    ##  The right half now holds the inverse, one row per integer.
+    lst_inverse = [0] * int_size
+    for int_r in range(int_size):
+        int_row = lst_rows[int_r] >> int_size
+        for int_c in range(int_size):
+            if (int_row >> int_c) & 1:
+                lst_inverse[int_c] |= 1 << int_r
+
+    return lst_inverse
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
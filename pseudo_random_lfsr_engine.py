@@ -0,0 +1,1184 @@
+##  program name:
+##  "pseudo_random_lfsr_engine.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Integer-state engine for the
+##  LINEAR FEEDBACK SHIFT REGISTER
+##  (LFSR) pseudo-random generators
+##  in this folder.
+##
+##  The "simple" programs keep the
+##  register as a string of "0" and
+##  "1" characters. Every step
+##  slices that string, compares
+##  characters, builds a new string
+##  and then "int(str, 2)" parses it
+##  all over again. That is fine for
+##  hitting <ENTER> once a second
+##  but it is ALL the work when a
+##  simulation wants millions of
+##  values.
+##
+##  Here the register is a plain
+##  integer instead. The string
+##  position numbering used in the
+##  tap table is kept exactly:
+##  POSITION 0 (the leftmost or
+##  highest-order character) is
+##  integer bit n-1 and POSITION n-1
+##  (the rightmost character) is
+##  integer bit 0. So the string
+##  "00000000000000001" and the
+##  integer 1 are the same seed and
+##  both walk through exactly the
+##  same sequence.
+##
+##  One step is then:
+##
+##    new bit = parity of
+##              (state AND tap mask)
+##    state   = ((state << 1)
+##               AND register mask)
+##              OR new bit
+##
+##  which is a shift, two masks and
+##  a bit count instead of a dozen
+##  string operations.
+####################################
+##  ONE CLASS FOR EVERY WIDTH
+##
+##  The "tap points" table in the
+##  program headers is copied into
+##  dict_LFSR_TAP_TABLE below, so a
+##  new width no longer means a new
+##  copy of a 300 line program:
+##
+##    LfsrEngine(23)
+##
+##  is a 23 bit register with taps
+##  0 and 5. The masks for a width
+##  are compiled once and cached.
+####################################
+##  JUMPING AHEAD
+##
+##  "jump(n)" lands on exactly the
+##  state "next()" would reach after
+##  n calls, but uses x**n modulo
+##  the feedback polynomial (see
+##  "pseudo_random_gf2.py") so that
+##  step 10**12 of the 61 bit
+##  register is a millisecond away
+##  instead of days.
+####################################
+##  GALOIS FORM
+##
+##  "GaloisLfsrEngine" steps the same
+##  polynomial with one shift and one
+##  conditional XOR of a constant
+##  however many taps there are.
+##  Its states are a fixed re-mapping
+##  of the Fibonacci ones, so old
+##  seeds convert onto the very same
+##  sequence and back.
+####################################
+##  THROUGHPUT TARGET
+##
+##  The integer path is meant to
+##  be at least 10 TIMES FASTER
+##  than the string path. Calling
+##  "next()" once per value is held
+##  back by the cost of a Python
+##  method call (about 3 to 4 times
+##  the string path), so bulk users
+##  should call "next_n()" which
+##  hands back a whole list of
+##  states at once.
+##
+##  With NumPy, "next_n()" asks
+##  "generate()" (below) for runs of
+##  int_NEXT_N_GENERATE_MIN states
+##  or more and turns the array into
+##  a list: 20 to 30 times the
+##  string path, well over the
+##  target. Without NumPy it reaches
+##  about 7 times, short of it: the
+##  new bits come a word at a time,
+##  but every state still has to be
+##  cut out of the word as its own
+##  Python integer.
+##
+##  Without NumPy "next_n()" does
+##  not even step
+##  one bit at a time. The feedback
+##  of the register only reaches
+##  back to the highest tap, so
+##  "n - highest tap" new bits can
+##  be found at once with a handful
+##  of shifts and XORs. Squaring
+##  the feedback polynomial spreads
+##  the taps out (x**2 + 1 becomes
+##  x**4 + 1 in binary arithmetic)
+##  so even registers like the 37
+##  bit one, whose highest tap is
+##  right next to the end, get a
+##  wide enough gap this way.
+##
+##  "generate()" goes one better
+##  with NumPy: whole blocks of
+##  states come from one XOR per
+##  tap over the states already
+##  found. The target there is
+##  over 50 million 61 bit values
+##  per second on one core.
+##
+##  Run this program directly to
+##  see both paths compared on the
+##  registers of the "simple"
+##  programs. The speedup printed
+##  at the end of each line is the
+##  one to hold against the target.
+####################################
+##  NON-OVERLAPPING WORDS
+##
+##  Two states in a row share n-1
+##  of their n bits: each step only
+##  shifts ONE new bit in. A program
+##  that wants words with nothing in
+##  common has to step n times per
+##  word, and pays n steps for it.
+##
+##  "next_word()" moves n steps in
+##  one go instead. Moving a fixed
+##  number of steps is a fixed
+##  XOR-mix of the state bits, so it
+##  is precomputed once as a lookup
+##  table per byte of the state
+##  ("fnc_step_table()"): a 61 bit
+##  word costs 8 lookups and 7 XORs
+##  instead of 61 steps.
+##  "next_words()" makes a list of
+##  them.
+##
+##  "generate_words()" does the
+##  same for a NumPy array. Word k
+##  is the state after k*n steps,
+##  and the spread recurrence of
+##  "generate()" still holds for
+##  these states; a state that
+##  falls BETWEEN two words is just
+##  the end of one word and the
+##  start of the next:
+##
+##    ((w[i] << r) | (w[i+1] >> (n-r)))
+##    AND register mask
+##
+##  so whole blocks of words come
+##  from one shift-and-XOR per tap,
+##  with no state in between ever
+##  being made.
+####################################
+
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; "generate()" falls back
+    np = None        ##  to array('Q') without it.
+
+from pseudo_random_gf2 import fnc_feedback_polynomial
+from pseudo_random_gf2 import fnc_gf2_apply_matrix
+from pseudo_random_gf2 import fnc_gf2_matrix_inverse
+from pseudo_random_gf2 import fnc_gf2_multiply_mod
+from pseudo_random_gf2 import fnc_x_to_the_n_mod
+from pseudo_random_primitive import fnc_check_maximal_taps
+from pseudo_random_primitive import fnc_verify_tap_table
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  The "tap points" table from the headers of the programs in
+##  this folder: register width -> tap POSITIONS (position 0 is
+##  the highest-order bit). Every width 2 through 65 can be built
+##  from this table by the one generic "LfsrEngine" class.
+##  Every entry is checked to be maximal-length on import.
+dict_LFSR_TAP_TABLE = {
+     2: ( 0,  1),
+     3: ( 0,  1),
+     4: ( 0,  1),
+     5: ( 0,  2),
+     6: ( 0,  1),
+     7: ( 0,  1),
+     8: ( 0,  2,  3,  4),
+     9: ( 0,  4),
+    10: ( 0,  3),
+    11: ( 0,  2),
+    12: ( 0,  1,  2,  8),
+    13: ( 0,  1,  2,  5),
+    14: ( 0,  1,  2, 12),
+    15: ( 0,  1),
+    16: ( 0,  1,  3, 12),      ##  The headers say 0, 1, 3, 8, which is
+                               ##  not maximal (see below)
+    17: ( 0,  3),
+    18: ( 0,  7),
+    19: ( 0,  1,  2,  5),
+    20: ( 0,  3),
+    21: ( 0,  2),
+    22: ( 0,  1),
+    23: ( 0,  5),
+    24: ( 0,  1,  2,  7),
+    25: ( 0,  3),
+    26: ( 0, 20, 24, 25),
+    27: ( 0, 22, 25, 26),
+    28: ( 0,  3),
+    29: ( 0,  2),
+    30: ( 0, 24, 26, 29),
+    31: ( 0,  3),
+    32: ( 0, 10, 30, 31),
+    33: ( 0, 13),
+    34: ( 0,  7, 32, 33),
+    35: ( 0,  2),
+    36: ( 0, 11),
+    37: ( 0, 32, 33, 34, 35, 36),
+    38: ( 0, 32, 33, 37),
+    39: ( 0,  4),
+    40: ( 0,  2, 19, 21),
+    41: ( 0,  3),
+    42: ( 0,  1, 22, 23),
+    43: ( 0,  1,  5,  6),
+    44: ( 0,  1, 26, 27),
+    45: ( 0,  1,  3,  4),
+    46: ( 0,  1, 20, 21),
+    47: ( 0,  5),
+    48: ( 0,  1, 27, 28),
+    49: ( 0,  9),
+    50: ( 0,  1, 26, 27),
+    51: ( 0,  1, 15, 16),
+    52: ( 0,  3),
+    53: ( 0,  1, 15, 16),
+    54: ( 0,  1, 36, 37),
+    55: ( 0, 24),
+    56: ( 0,  1, 21, 22),
+    57: ( 0,  7),
+    58: ( 0, 19),
+    59: ( 0,  1, 21, 22),
+    60: ( 0,  1),
+    61: ( 0,  1, 15, 16),
+    62: ( 0,  1, 56, 57),
+    63: ( 0,  1),
+    64: ( 0,  1,  3,  4),
+    65: ( 0, 18),
+}
+
+##  A tap table that is wrong somewhere would quietly break the
+##  "every value appears once" promise, so the whole table is
+##  run through the primitive polynomial check (a couple of
+##  milliseconds a width) as soon as this module is loaded.
+lst_NOT_MAXIMAL = fnc_verify_tap_table(dict_LFSR_TAP_TABLE)
+if lst_NOT_MAXIMAL:
+    raise AssertionError("tap table is not maximal-length for widths "
+                         + str(lst_NOT_MAXIMAL))
+
+##  Tap points used by the string functions in the "simple"
+##  programs and the example programs, so the engine can replay
+##  any seed recorded with them.
+##  NOTE: "pseudo_random_33_bit_simple.py" taps positions 0 and 3
+##  (NOT 0 and 13 like the table in its header says), and the 16
+##  bit program's taps 0, 1, 3, 8 only reach 8,001 states. Neither
+##  set is maximal-length, but the entries below copy what the
+##  programs actually do so that their sequences stay
+##  bit-identical.
+dict_SIMPLE_PROGRAM_TAPS = {
+    16: (0, 1, 3, 8),
+    17: (0, 3),
+    33: (0, 3),
+    37: (0, 32, 33, 34, 35, 36),
+    61: (0, 1, 15, 16),
+}
+
+##  Speedup of the integer path over the string path we aim for.
+int_TARGET_SPEEDUP = 10
+
+##  Batch target for "generate()": 61 bit outputs per second.
+int_TARGET_BATCH_RATE = 50000000
+
+##  When "next_n()" works on a whole word at a time it wants at
+##  least this many new bits out of every word.
+int_MINIMUM_WORD_STEP = 32
+
+##  From this many states on (and with NumPy) "next_n()" lets
+##  "generate()" find them and turns the array into a list.
+int_NEXT_N_GENERATE_MIN = 1024
+
+##  Compiled tap sets, (width, taps) -> see "fnc_compile_taps()".
+dict_COMPILED_TAPS = {}
+
+##  Lookup tables for moving a fixed number of steps at once,
+##  (width, taps, steps, Galois?) -> see "fnc_step_table()".
+dict_STEP_TABLES = {}
+
+##  Fibonacci <-> Galois state conversions, (width, taps) ->
+##  (columns Galois to Fibonacci, columns Fibonacci to Galois).
+dict_GALOIS_CONVERSIONS = {}
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_convert_binary_string_to_integer(str_binary):
+
+    int_result = int(str_binary,2) ## convert binary string image to integer
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_convert_integer_to_binary_string(int_n,int_bits):
+    ##  Convert an integer into a string of "int_bits" zeros and
+    ##  ones. Unlike the loop in the example programs this lets
+    ##  Python do the work.
+
+    return format(int_n & ((1 << int_bits) - 1),"0" + str(int_bits) + "b")
+
+######################################################
+######################################################
+
+def fnc_next_random_binary_string(str_seed,tpl_taps):
+    ##  The string LFSR step from the "simple" programs for ANY
+    ##  register width and ANY tap points. This is the reference
+    ##  the integer engine is checked and timed against.
+
+    str_x = "0"
+    for int_tap in tpl_taps:           ##  Parity of all tapped positions
+        if str_seed[int_tap] != str_x:
+            str_x = "1"
+        else:
+            str_x = "0"
+
+    return str_seed[1:] + str_x  ##  Shift parity bit into the right side
+
+######################################################
+######################################################
+
+def fnc_tap_mask(int_bits,tpl_taps):
+    ##  Turn string tap POSITIONS into an integer mask.
+    ##  Position 0 is the highest-order bit (bit int_bits-1).
+
+    int_mask = 0
+    for int_tap in tpl_taps:
+        if int_tap < 0 or int_tap >= int_bits:
+            raise ValueError("tap " + str(int_tap) + " is outside a "
+                             + str(int_bits) + " bit register")
+        int_mask |= 1 << (int_bits - 1 - int_tap)
+
+    return int_mask
+
+######################################################
+######################################################
+
+def fnc_word_step_parameters(int_bits,tpl_taps):
+    ##  Work out how "next_n()" steps a whole word at a time.
+    ##
+    ##  The bit sequence a[t] of the register obeys
+    ##      a[t+n] = XOR of a[t+p] for every tap p
+    ##  and squaring the feedback polynomial j times gives
+    ##      a[t+n*m] = XOR of a[t+p*m]       (m = 2**j)
+    ##  Bits a[t+n*m] ... a[t+n*m+g-1] only depend on bits that are
+    ##  already known as long as g <= (n - highest tap) * m.
+    ##
+    ##  Returns (m, g) with g at least int_MINIMUM_WORD_STEP.
+
+    int_spread = 1
+    int_gap = int_bits - max(tpl_taps)
+    while int_gap * int_spread < int_MINIMUM_WORD_STEP:
+        int_spread *= 2
+
+    return int_spread,int_gap * int_spread
+
+######################################################
+######################################################
+
+def fnc_compile_taps(int_bits,tpl_taps=None):
+    ##  Everything the stepping code needs for one tap set, worked
+    ##  out once and shared by every engine of that width and taps:
+    ##
+    ##  (taps, register mask, tap mask,
+    ##   spread, gap, history bits, history shifts,
+    ##   feedback polynomial)
+    ##
+    ##  "tpl_taps" of None means the taps from dict_LFSR_TAP_TABLE.
+
+    if tpl_taps is None:
+        if int_bits not in dict_LFSR_TAP_TABLE:
+            raise ValueError("no tap points listed for a "
+                             + str(int_bits) + " bit register")
+        tpl_taps = dict_LFSR_TAP_TABLE[int_bits]
+
+    tpl_taps = tuple(sorted(tpl_taps))
+    tpl_key = (int_bits,tpl_taps)
+    if tpl_key in dict_COMPILED_TAPS:
+        return dict_COMPILED_TAPS[tpl_key]
+
+    if int_bits < 2:
+        raise ValueError("an LFSR needs at least 2 bits")
+    if 0 not in tpl_taps:
+        raise ValueError("position 0 must be tapped or the leftmost "
+                         "bit is simply thrown away")
+
+    int_tap_mask = fnc_tap_mask(int_bits,tpl_taps)
+    int_spread,int_gap = fnc_word_step_parameters(int_bits,tpl_taps)
+    int_history_bits = int_bits * int_spread
+    tpl_shifts = tuple(int_history_bits - int_tap * int_spread - int_gap
+                       for int_tap in tpl_taps)
+
+    tpl_compiled = (tpl_taps,(1 << int_bits) - 1,int_tap_mask,
+                    int_spread,int_gap,int_history_bits,tpl_shifts,
+                    fnc_feedback_polynomial(int_bits,tpl_taps))
+    dict_COMPILED_TAPS[tpl_key] = tpl_compiled
+
+    return tpl_compiled
+
+######################################################
+######################################################
+
+def fnc_apply_jump_polynomial(int_state,int_jump,int_mask,int_tap_mask):
+    ##  Given r(x) = x**N mod P(x) = SUM of c[i] * x**i, the state
+    ##  N steps ahead is the XOR of the states i steps ahead for
+    ##  every c[i] that is 1. Those are at most n plain steps away.
+
+    int_result = 0
+    while int_jump:
+        if int_jump & 1:
+            int_result ^= int_state
+        int_state = ((int_state << 1) & int_mask) \
+            | ((int_state & int_tap_mask).bit_count() & 1)
+        int_jump >>= 1
+
+    return int_result
+
+######################################################
+######################################################
+
+def fnc_step_table(int_bits,tpl_taps=None,int_steps=None,bool_galois=False):
+    ##  Lookup table for moving a state "int_steps" steps on in one
+    ##  go (default: int_bits steps, a whole word of fresh bits):
+    ##
+    ##    table[k][b] = state int_steps steps after the state
+    ##                  (b << 8*k)
+    ##
+    ##  Stepping is linear (XOR) in the state bits, so the state
+    ##  int_steps on is the XOR of table[k][byte k of the state].
+    ##  Cached; "bool_galois" builds it for Galois-form states.
+
+    tpl_taps = fnc_compile_taps(int_bits,tpl_taps)[0]
+    if int_steps is None:
+        int_steps = int_bits
+    tpl_key = (int_bits,tpl_taps,int_steps,bool_galois)
+    if tpl_key in dict_STEP_TABLES:
+        return dict_STEP_TABLES[tpl_key]
+
+    ##  Where each single bit of the state ends up
+    cls_engine = GaloisLfsrEngine if bool_galois else LfsrEngine
+    lst_columns = [cls_engine(int_bits,tpl_taps,1 << int_i,False)
+                   .jump(int_steps) for int_i in range(int_bits)]
+
+    lst_step_table = []
+    for int_k in range((int_bits + 7) // 8):
+        lst_table = [0] * 256
+        for int_b in range(1,256):
+            int_low = (int_b & -int_b).bit_length() - 1
+            lst_table[int_b] = lst_table[int_b & (int_b - 1)]
+            if 8 * int_k + int_low < int_bits:
+                lst_table[int_b] ^= lst_columns[8 * int_k + int_low]
+        lst_step_table.append(lst_table)
+    dict_STEP_TABLES[tpl_key] = lst_step_table
+
+    return lst_step_table
+
+######################################################
+######################################################
+
+def fnc_table_step(int_state,lst_step_table):
+    ##  Move "int_state" on with a table from "fnc_step_table()".
+
+    int_result = 0
+    for lst_table in lst_step_table:
+        int_result ^= lst_table[int_state & 255]
+        int_state >>= 8
+
+    return int_result
+
+######################################################
+######################################################
+##                                                  ##
+##                  C L A S S E S                   ##
+##                                                  ##
+######################################################
+######################################################
+
+class LfsrEngine:
+    ##  An LFSR whose register is a plain integer.
+    ##
+    ##  int_bits  - register width n (2 through 65 from the table,
+    ##              any width with explicit taps)
+    ##  tpl_taps  - tap POSITIONS as listed in the header tables
+    ##              (position 0 is the highest-order bit), None to
+    ##              look them up in dict_LFSR_TAP_TABLE
+    ##  seed      - a non-zero integer or a string of n zeros
+    ##              and ones like the "simple" programs use
+    ##  bool_maximal - reject taps given in "tpl_taps" that are
+    ##              not maximal-length (pass False to replay the
+    ##              16 and 33 bit "simple" programs on purpose)
+    ##
+    ##  All the masks are compiled when the engine is built so
+    ##  the width makes no difference to the cost of a step.
+
+    bool_galois = False
+
+    def __init__(self,int_bits,tpl_taps=None,seed=1,bool_maximal=True):
+
+        if bool_maximal and tpl_taps is not None:
+            fnc_check_maximal_taps(int_bits,tpl_taps)
+
+        self.int_bits = int_bits
+        (self.tpl_taps,self.int_mask,self.int_tap_mask,
+         self.int_spread,self.int_gap,self.int_history_bits,
+         self.tpl_history_shifts,
+         self.int_feedback_poly) = fnc_compile_taps(int_bits,tpl_taps)
+        self.lst_word_table = None        ##  Built on first "next_word()"
+        self.int_state = 0
+        self.seed(seed)
+
+    ##################################################
+
+    def seed(self,seed):
+        ##  Load a new seed. Strings are read exactly like the
+        ##  "simple" programs read them.
+
+        if isinstance(seed,str):
+            if len(seed) != self.int_bits:
+                raise ValueError("seed string must be "
+                                 + str(self.int_bits) + " characters long")
+            int_seed = fnc_convert_binary_string_to_integer(seed)
+        else:
+            int_seed = int(seed)
+
+        if int_seed <= 0 or int_seed > self.int_mask:
+            raise ValueError("seed must be 1 through " + str(self.int_mask)
+                             + " (NOTHING WILL HAPPEN IF THE SEED IS ZERO!)")
+
+        self.int_state = int_seed
+
+    ##################################################
+
+    def next(self):
+        ##  Step once and return the new state as an integer.
+
+        int_state = self.int_state
+        int_state = ((int_state << 1) & self.int_mask) \
+            | ((int_state & self.int_tap_mask).bit_count() & 1)
+        self.int_state = int_state
+
+        return int_state
+
+    ##################################################
+
+    def next_binary_string(self):
+        ##  Step once and return the new state the way the string
+        ##  functions of the "simple" programs would.
+
+        return fnc_convert_integer_to_binary_string(self.next(),self.int_bits)
+
+    ##################################################
+
+    def next_n(self,int_count):
+        ##  Step "int_count" times and return the list of states.
+        ##  Same values as calling "next()" that many times.
+
+        if np is not None and int_count >= int_NEXT_N_GENERATE_MIN \
+                and self.int_bits <= 64:
+            return self.generate(int_count).tolist()
+
+        lst_states = []
+        int_state = self.int_state
+        int_mask = self.int_mask
+        int_tap_mask = self.int_tap_mask
+        int_n = self.int_bits
+        int_gap = self.int_gap
+        int_history_bits = self.int_history_bits
+
+        ##  Step one bit at a time until "int_history" holds the last
+        ##  int_history_bits bits of the sequence (or we are done).
+        int_history = int_state
+        int_i = 0
+        int_warm_up = min(int_count,int_history_bits - int_n)
+        while int_i < int_warm_up:
+            int_bit = (int_state & int_tap_mask).bit_count() & 1
+            int_state = ((int_state << 1) & int_mask) | int_bit
+            int_history = (int_history << 1) | int_bit
+            lst_states.append(int_state)
+            int_i += 1
+
+        ##  Whole words: "int_gap" new bits from the spread taps.
+        int_history_mask = (1 << int_history_bits) - 1
+        int_gap_mask = (1 << int_gap) - 1
+        tpl_shifts = self.tpl_history_shifts
+        rng_window = range(int_gap - 1,-1,-1)
+
+        while int_count - int_i >= int_gap:
+            int_new = 0
+            for int_shift in tpl_shifts:
+                int_new ^= int_history >> int_shift
+            int_new &= int_gap_mask
+
+            ##  The last n bits plus the new ones hold every state
+            ##  the register passes through during this word.
+            int_window = ((int_state << int_gap) | int_new)
+            lst_states += [(int_window >> int_j) & int_mask
+                           for int_j in rng_window]
+            int_state = int_window & int_mask
+            int_history = ((int_history << int_gap) | int_new) \
+                & int_history_mask
+            int_i += int_gap
+
+        ##  Whatever is left over, one bit at a time.
+        while int_i < int_count:
+            int_state = ((int_state << 1) & int_mask) \
+                | ((int_state & int_tap_mask).bit_count() & 1)
+            lst_states.append(int_state)
+            int_i += 1
+
+        self.int_state = int_state
+        return lst_states
+
+    ##################################################
+
+    def generate(self,int_count,out=None):
+        ##  The next "int_count" states in one call, as a NumPy uint64
+        ##  array (or an array('Q') when NumPy is not installed).
+        ##  If "out" is given (a uint64 ndarray or an array('Q') at
+        ##  least int_count long) it is filled in place and returned.
+        ##
+        ##  Every state sequence of the register obeys the same
+        ##  recurrence as its bits, and so does every "spread" copy
+        ##  of it (m = 2**j):
+        ##
+        ##      s[t+n*m] = XOR of s[t+p*m]       for the taps p
+        ##
+        ##  Once L states are known, the next (n - highest tap) * m
+        ##  of them only depend on known ones, so they are found with
+        ##  one vectorized XOR per tap. Blocks grow with L, so a
+        ##  million states take a few hundred NumPy calls at most.
+
+        if self.int_bits > 64:
+            raise ValueError("generate() fills 64 bit words; a "
+                             + str(self.int_bits) + " bit state does not fit")
+
+        if out is None:
+            if np is not None:
+                out = np.empty(int_count,dtype=np.uint64)
+            else:
+                out = array("Q",bytes(8 * int_count))
+        elif len(out) < int_count:
+            raise ValueError("output buffer holds fewer than "
+                             + str(int_count) + " values")
+
+        if int_count <= 0:
+            return out
+
+        if np is None:
+            out[0:int_count] = array("Q",self.next_n(int_count))
+            return out
+
+        if isinstance(out,np.ndarray):
+            if out.dtype != np.uint64:
+                raise TypeError("output array must have dtype uint64")
+            arr_states = out
+        else:
+            arr_states = np.frombuffer(out,dtype=np.uint64)
+
+        int_n = self.int_bits
+        int_known = min(int_count,2 * int_n)
+        arr_states[0:int_known] = self.next_n(int_known)
+
+        int_top_tap = self.tpl_taps[-1]
+        tpl_rest = self.tpl_taps[1:]      ##  Position 0 is always tapped
+        while int_known < int_count:
+            int_spread = 1
+            while int_n * int_spread * 2 <= int_known:
+                int_spread *= 2
+            int_block = min((int_n - int_top_tap) * int_spread,
+                            int_count - int_known)
+            int_base = int_known - int_n * int_spread
+
+            arr_block = arr_states[int_known:int_known + int_block]
+            np.copyto(arr_block,arr_states[int_base:int_base + int_block])
+            for int_tap in tpl_rest:
+                int_from = int_base + int_tap * int_spread
+                np.bitwise_xor(arr_block,
+                               arr_states[int_from:int_from + int_block],
+                               out=arr_block)
+            int_known += int_block
+
+        self.int_state = int(arr_states[int_count - 1])
+        return out
+
+    ##################################################
+
+    def jump(self,int_n):
+        ##  Advance the register by "int_n" steps in about log2(int_n)
+        ##  polynomial multiplications and return the new state.
+        ##  Exactly the same state as calling "next()" int_n times.
+
+        if int_n < 0:
+            raise ValueError("can only jump forward")
+
+        if int_n <= self.int_bits:  ##  Short hops are cheaper to walk
+            int_state = self.int_state
+            int_i = 0
+            while int_i < int_n:
+                int_state = ((int_state << 1) & self.int_mask) \
+                    | ((int_state & self.int_tap_mask).bit_count() & 1)
+                int_i += 1
+        else:
+            int_jump = fnc_x_to_the_n_mod(int_n,self.int_feedback_poly)
+            int_state = fnc_apply_jump_polynomial(self.int_state,int_jump,
+                                                  self.int_mask,
+                                                  self.int_tap_mask)
+
+        self.int_state = int_state
+        return int_state
+
+    ##################################################
+
+    def next_word(self):
+        ##  Move int_bits steps on in one table lookup per byte and
+        ##  return the new state: a word that shares no bit with the
+        ##  state before it. Same as "jump(int_bits)".
+
+        if self.lst_word_table is None:
+            self.lst_word_table = fnc_step_table(self.int_bits,self.tpl_taps,
+                                                 None,self.bool_galois)
+        self.int_state = fnc_table_step(self.int_state,self.lst_word_table)
+
+        return self.int_state
+
+    ##################################################
+
+    def next_words(self,int_count):
+        ##  List of the next "int_count" words from "next_word()".
+
+        if self.lst_word_table is None:
+            self.lst_word_table = fnc_step_table(self.int_bits,self.tpl_taps,
+                                                 None,self.bool_galois)
+        lst_step_table = self.lst_word_table
+        lst_words = [0] * int_count
+        int_state = self.int_state
+        for int_i in range(int_count):
+            int_result = 0
+            for lst_table in lst_step_table:
+                int_result ^= lst_table[int_state & 255]
+                int_state >>= 8
+            int_state = int_result
+            lst_words[int_i] = int_state
+        self.int_state = int_state
+
+        return lst_words
+
+    ##################################################
+
+    def generate_words(self,int_count,out=None):
+        ##  The next "int_count" words (states int_bits, 2*int_bits,
+        ##  ... steps on) in one call, as a NumPy uint64 array or an
+        ##  array('Q'), filled into "out" if it is given. Same values
+        ##  as "next_words()".
+        ##
+        ##  With w[k] the state after k*n steps, the recurrence of
+        ##  "generate()" for m = 2**j and the taps p is
+        ##
+        ##      w[k+m] = XOR of (state k*n + p*m steps on)
+        ##
+        ##  and with p*m = q*n + r that state is the last n-r bits
+        ##  of w[k+q] followed by the first r bits of w[k+q+1].
+
+        if self.int_bits > 64:
+            raise ValueError("generate_words() fills 64 bit words; a "
+                             + str(self.int_bits) + " bit state does not fit")
+
+        if out is None:
+            if np is not None:
+                out = np.empty(int_count,dtype=np.uint64)
+            else:
+                out = array("Q",bytes(8 * int_count))
+        elif len(out) < int_count:
+            raise ValueError("output buffer holds fewer than "
+                             + str(int_count) + " values")
+
+        if int_count <= 0:
+            return out
+
+        if np is None or self.bool_galois:
+            out[0:int_count] = array("Q",self.next_words(int_count))
+            return out
+
+        if isinstance(out,np.ndarray):
+            if out.dtype != np.uint64:
+                raise TypeError("output array must have dtype uint64")
+            arr_words = out
+        else:
+            arr_words = np.frombuffer(out,dtype=np.uint64)
+
+        int_n = self.int_bits
+        int_known = min(int_count,4 * int_n)
+        arr_words[0:int_known] = self.next_words(int_known)
+
+        obj_mask = np.uint64(self.int_mask)
+        int_top_tap = self.tpl_taps[-1]
+        tpl_rest = self.tpl_taps[1:]      ##  Position 0 is always tapped
+        while int_known < int_count:
+            int_spread = 1
+            while int_spread * 2 <= int_known:
+                int_spread *= 2
+            ##  Newest word read is k + q + 1 for the highest tap,
+            ##  and it has to be known already.
+            int_block = min(int_spread - int_top_tap * int_spread // int_n - 1,
+                            int_count - int_known)
+            int_base = int_known - int_spread
+
+            arr_block = arr_words[int_known:int_known + int_block]
+            np.copyto(arr_block,arr_words[int_base:int_base + int_block])
+            for int_tap in tpl_rest:
+                int_q,int_r = divmod(int_tap * int_spread,int_n)
+                int_from = int_base + int_q
+                arr_high = arr_words[int_from:int_from + int_block]
+                if int_r == 0:
+                    np.bitwise_xor(arr_block,arr_high,out=arr_block)
+                    continue
+                arr_low = arr_words[int_from + 1:int_from + 1 + int_block]
+                arr_block ^= ((arr_high << np.uint64(int_r)) & obj_mask) \
+                    | (arr_low >> np.uint64(int_n - int_r))
+            int_known += int_block
+
+        self.int_state = int(arr_words[int_count - 1])
+        return out
+
+    ##################################################
+
+    def to_galois(self):
+        ##  A Galois-form engine sitting on the very same point of
+        ##  this engine's sequence.
+
+        obj_galois = GaloisLfsrEngine(self.int_bits,self.tpl_taps,1,False)
+        obj_galois.int_state = fnc_fibonacci_to_galois(self.int_state,
+                                                        self.int_bits,
+                                                        self.tpl_taps)
+        return obj_galois
+
+    ##################################################
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+######################################################
+######################################################
+
+class GaloisLfsrEngine(LfsrEngine):
+    ##  The Galois form of the same register. Its state is the
+    ##  polynomial x**t * g modulo the feedback polynomial P(x), so
+    ##  a step is ONE shift and ONE conditional XOR with P(x) no
+    ##  matter how many taps there are -- no parity to find.
+    ##
+    ##  The state values differ from the Fibonacci ("simple"
+    ##  program) form, but they are the same sequence seen through
+    ##  a fixed one-to-one mapping: use "fnc_galois_engine_for_seed()"
+    ##  to start on a Fibonacci seed and "fibonacci_state()" to read
+    ##  the Fibonacci state back at any time.
+    ##
+    ##  "next_n()", "generate()" and "jump()" all keep working
+    ##  because the Galois states obey the same recurrence.
+    ##  "next_word()" uses a table built for Galois states, and
+    ##  "generate_words()" falls back to "next_words()" (a Galois
+    ##  state is not simply its last n output bits).
+
+    bool_galois = True
+
+    def next(self):
+        ##  Step once: multiply the state by x modulo P(x).
+
+        int_state = self.int_state << 1
+        if int_state > self.int_mask:
+            int_state ^= self.int_feedback_poly
+        self.int_state = int_state
+
+        return int_state
+
+    ##################################################
+
+    def next_n(self,int_count):
+        ##  Step "int_count" times and return the list of states.
+
+        lst_states = [0] * int_count
+        int_state = self.int_state
+        int_mask = self.int_mask
+        int_poly = self.int_feedback_poly
+        int_i = 0
+        while int_i < int_count:
+            int_state <<= 1
+            if int_state > int_mask:
+                int_state ^= int_poly
+            lst_states[int_i] = int_state
+            int_i += 1
+
+        self.int_state = int_state
+        return lst_states
+
+    ##################################################
+
+    def jump(self,int_n):
+        ##  In Galois form jumping ahead is a single multiplication
+        ##  by x**int_n modulo P(x).
+
+        if int_n < 0:
+            raise ValueError("can only jump forward")
+
+        self.int_state = fnc_gf2_multiply_mod(
+            self.int_state,
+            fnc_x_to_the_n_mod(int_n,self.int_feedback_poly),
+            self.int_feedback_poly)
+
+        return self.int_state
+
+    ##################################################
+
+    def fibonacci_state(self):
+        ##  The state the Fibonacci form would be in right now.
+
+        return fnc_galois_to_fibonacci(self.int_state,self.int_bits,
+                                       self.tpl_taps)
+
+    ##################################################
+
+    def to_fibonacci(self):
+        ##  A Fibonacci-form engine on the same point of the sequence.
+
+        return LfsrEngine(self.int_bits,self.tpl_taps,
+                          self.fibonacci_state(),False)
+
+    ##################################################
+
+    def to_galois(self):
+        return GaloisLfsrEngine(self.int_bits,self.tpl_taps,self.int_state,
+                                False)
+
+######################################################
+######################################################
+
+def fnc_galois_conversions(int_bits,tpl_taps=None):
+    ##  Build (once per tap set) the two binary matrices that turn
+    ##  Galois states into Fibonacci states and back.
+    ##
+    ##  The Fibonacci form of Galois state g is the window of the
+    ##  next n top bits of g, x*g, x*x*g, ... -- reading off the
+    ##  top bit is how the Galois register "outputs" its sequence.
+    ##  That map is linear and always one-to-one (its matrix has
+    ##  ones down the anti-diagonal and zeros above it), so it
+    ##  can be inverted once and cached.
+
+    tpl_taps = fnc_compile_taps(int_bits,tpl_taps)[0]
+    tpl_key = (int_bits,tpl_taps)
+    if tpl_key in dict_GALOIS_CONVERSIONS:
+        return dict_GALOIS_CONVERSIONS[tpl_key]
+
+    obj_galois = GaloisLfsrEngine(int_bits,tpl_taps,1,False)
+    lst_to_fibonacci = []
+    for int_i in range(int_bits):
+        obj_galois.int_state = 1 << int_i
+        int_window = 0
+        for int_j in range(int_bits):
+            int_window = (int_window << 1) \
+                | (obj_galois.int_state >> (int_bits - 1))
+            obj_galois.next()
+        lst_to_fibonacci.append(int_window)
+
+    tpl_conversions = (lst_to_fibonacci,
+                       fnc_gf2_matrix_inverse(lst_to_fibonacci))
+    dict_GALOIS_CONVERSIONS[tpl_key] = tpl_conversions
+
+    return tpl_conversions
+
+######################################################
+######################################################
+
+def fnc_galois_to_fibonacci(int_state,int_bits,tpl_taps=None):
+    ##  Fibonacci state on the same point of the sequence.
+
+    return fnc_gf2_apply_matrix(fnc_galois_conversions(int_bits,tpl_taps)[0],
+                                int_state)
+
+######################################################
+######################################################
+
+def fnc_fibonacci_to_galois(int_state,int_bits,tpl_taps=None):
+    ##  Galois state on the same point of the sequence.
+
+    return fnc_gf2_apply_matrix(fnc_galois_conversions(int_bits,tpl_taps)[1],
+                                int_state)
+
+######################################################
+######################################################
+
+def fnc_galois_engine_for_seed(int_bits,seed=1,tpl_taps=None):
+    ##  A Galois-form engine that walks the same sequence as a
+    ##  Fibonacci engine (or "simple" program) started on "seed".
+
+    return LfsrEngine(int_bits,tpl_taps,seed).to_galois()
+
+######################################################
+######################################################
+
+def fnc_simple_program_engine(int_bits,seed=1):
+    ##  An engine stepping exactly like the string function of the
+    ##  "simple" program for this width (16, 17, 33, 37 or 61).
+
+    return LfsrEngine(int_bits,dict_SIMPLE_PROGRAM_TAPS[int_bits],seed,
+                      False)
+
+######################################################
+######################################################
+
+def fnc_benchmark_string_vs_integer(int_bits,int_steps):
+    ##  Time "int_steps" steps of the string path (step + int(s,2))
+    ##  against the integer engine, check that both produce the
+    ##  same values and return the speedup of "next_n()".
+
+    tpl_taps = dict_SIMPLE_PROGRAM_TAPS[int_bits]
+    str_seed = fnc_convert_integer_to_binary_string(1,int_bits)
+
+    flt_start = time.perf_counter()
+    lst_string_path = [0] * int_steps
+    int_i = 0
+    while int_i < int_steps:
+        str_seed = fnc_next_random_binary_string(str_seed,tpl_taps)
+        lst_string_path[int_i] = fnc_convert_binary_string_to_integer(str_seed)
+        int_i += 1
+    flt_string_seconds = time.perf_counter() - flt_start
+
+    obj_engine = fnc_simple_program_engine(int_bits)
+    flt_start = time.perf_counter()
+    lst_next_path = [obj_engine.next() for int_i in range(int_steps)]
+    flt_next_seconds = time.perf_counter() - flt_start
+
+    obj_engine = fnc_simple_program_engine(int_bits)
+    flt_start = time.perf_counter()
+    lst_block_path = obj_engine.next_n(int_steps)
+    flt_block_seconds = time.perf_counter() - flt_start
+
+    if lst_next_path != lst_string_path or lst_block_path != lst_string_path:
+        raise AssertionError(str(int_bits) + " bit engine does not match "
+                             "the string function")
+
+    print("%2d bits: string %8.0f/s   next() %9.0f/s   next_n() %10.0f/s"
+          "   x%.1f (target x%d)" % (int_bits,
+                        int_steps / flt_string_seconds,
+                        int_steps / flt_next_seconds,
+                        int_steps / flt_block_seconds,
+                        flt_string_seconds / flt_block_seconds,
+                        int_TARGET_SPEEDUP))
+
+    return flt_string_seconds / flt_block_seconds
+
+def fnc_benchmark_fibonacci_vs_galois(int_bits,int_steps):
+    ##  Time "int_steps" calls of "next()" in both forms on the
+    ##  same sequence and return the speedup of the Galois form.
+
+    obj_fibonacci = LfsrEngine(int_bits)
+    obj_galois = obj_fibonacci.to_galois()
+
+    flt_start = time.perf_counter()
+    for int_i in range(int_steps):
+        obj_fibonacci.next()
+    flt_fibonacci_seconds = time.perf_counter() - flt_start
+
+    flt_start = time.perf_counter()
+    for int_i in range(int_steps):
+        obj_galois.next()
+    flt_galois_seconds = time.perf_counter() - flt_start
+
+    if obj_galois.fibonacci_state() != obj_fibonacci.int_state:
+        raise AssertionError("Galois form left the Fibonacci sequence")
+
+    print("%2d bits, %d taps: Fibonacci %9.0f/s   Galois %9.0f/s   x%.2f"
+          % (int_bits,len(obj_fibonacci.tpl_taps),
+             int_steps / flt_fibonacci_seconds,
+             int_steps / flt_galois_seconds,
+             flt_fibonacci_seconds / flt_galois_seconds))
+
+    return flt_fibonacci_seconds / flt_galois_seconds
+
+######################################################
+######################################################
+
+def fnc_benchmark_generate(int_bits,int_count):
+    ##  Time one "generate()" call refilling the same buffer and
+    ##  return the outputs per second.
+
+    obj_engine = LfsrEngine(int_bits)
+    arr_out = obj_engine.generate(int_count)  ##  Warm up / allocate
+
+    flt_start = time.perf_counter()
+    obj_engine.generate(int_count,arr_out)
+    flt_rate = int_count / (time.perf_counter() - flt_start)
+
+    print("%2d bits: generate() %12.0f/s   (target %d/s)"
+          % (int_bits,flt_rate,int_TARGET_BATCH_RATE))
+
+    return flt_rate
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    print("*******************************************************")
+    print("String path versus integer engine (values per second)")
+    print("*******************************************************")
+    for int_bits in sorted(dict_SIMPLE_PROGRAM_TAPS):
+        fnc_benchmark_string_vs_integer(int_bits,200000)
+
+    print("*******************************************************")
+    fnc_benchmark_fibonacci_vs_galois(61,500000)  ##  4 taps
+    fnc_benchmark_fibonacci_vs_galois(37,500000)  ##  6 taps
+
+    print("*******************************************************")
+    if np is None:
+        print("NumPy is not installed; generate() uses array('Q')")
+    for int_bits in sorted(dict_SIMPLE_PROGRAM_TAPS):
+        fnc_benchmark_generate(int_bits,10000000)
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
@@ -0,0 +1,453 @@
+##  program name:
+##  "pseudo_random_permutation.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  A random order for 0 .. N-1
+##  without ever holding the list.
+##
+##  A maximal n bit LFSR visits
+##  every value 1 .. (2**n)-1 once
+##  and only once, so it already IS
+##  a shuffle of those values, and
+##  all it needs to remember is the
+##  seed. For N values:
+##
+##  - the width is the smallest n
+##    with (2**n)-1 >= N (so at most
+##    half the register's values
+##    are too big);
+##  - "place" p of the order holds
+##    value S(p*d)-1, where S(k) is
+##    the state k steps after the
+##    seed and the stride d is the
+##    first number from n up that
+##    shares no factor with (2**n)-1
+##    (so the places still reach
+##    every state, and neighbouring
+##    places share no bits the way
+##    neighbouring states do);
+##  - a value N or bigger is not
+##    wanted, so it is used as a
+##    place instead and the register
+##    is asked again ("cycle
+##    walking"), until a value below
+##    N turns up.
+##
+##  Because p -> S(p*d)-1 never gives
+##  the same value twice, this hands
+##  out every value 0 .. N-1 exactly
+##  once for the places 0 .. N-1.
+##  Different seeds give different
+##  orders.
+##
+##    value(i)   the value at place
+##               i, by jumping
+##               straight to S(i*d)
+##    index(v)   the place of value
+##               v, by finding how
+##               far v+1 is from the
+##               seed (the discrete
+##               log in
+##               "pseudo_random_
+##               discrete_log.py")
+##               and walking back
+##
+##  Going through the places in
+##  order only needs "generate()"
+##  (keeping every d-th state).
+##  The jumps for the values that
+##  are too big (about 30% of them
+##  for N = 3,000,000,000) use
+##  "jump tables": jumping 2**j
+##  steps is a fixed XOR-mix of the
+##  state bits, so it is done with
+##  one lookup per byte of the
+##  state, for a whole array of
+##  states at once. The tables take
+##  n * 256 * (n/8) numbers, and
+##  nothing at all grows with N.
+####################################
+
+import math
+import time
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; without it values come out
+    np = None        ##  one at a time (much more slowly).
+
+from pseudo_random_discrete_log import fnc_lfsr_distance
+from pseudo_random_lfsr_engine import LfsrEngine
+from pseudo_random_lfsr_engine import fnc_compile_taps
+from pseudo_random_lfsr_engine import fnc_table_step
+from pseudo_random_substreams import fnc_normalize_master_seed
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Widest register used; NumPy keeps states in 64 bit words.
+int_MAX_PERMUTATION_BITS = 64
+
+##  Places worked out per block by "blocks()" (d times as many
+##  states are generated for them).
+int_PERMUTATION_BLOCK = 1 << 16
+
+##  Jump tables already built, by (width, taps).
+dict_JUMP_TABLES = {}
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_permutation_bits(int_n):
+    ##  Smallest register width (at least 2) whose (2**n)-1 states
+    ##  cover the values 0 .. int_n-1.
+
+    if int_n < 1:
+        raise ValueError("need at least one value to put in order")
+
+    int_bits = max(2,int_n.bit_length())
+    if (1 << int_bits) - 1 < int_n:
+        int_bits += 1
+    if int_bits > int_MAX_PERMUTATION_BITS:
+        raise ValueError("at most " + str((1 << int_MAX_PERMUTATION_BITS) - 1)
+                         + " values")
+
+    return int_bits
+
+######################################################
+######################################################
+
+def fnc_permutation_stride(int_bits):
+    ##  Steps between neighbouring places: the first number from
+    ##  int_bits up with no factor in common with (2**n)-1.
+
+    int_period = (1 << int_bits) - 1
+    int_stride = int_bits
+    while math.gcd(int_stride,int_period) != 1:
+        int_stride += 1
+
+    return int_stride
+
+######################################################
+######################################################
+
+def fnc_jump_tables(int_bits,tpl_taps=None):
+    ##  Tables for jumping 2**j steps, j = 0 .. n-1:
+    ##
+    ##    table[j][k][b] = state 2**j steps after the state
+    ##                     (b << 8*k)
+    ##
+    ##  A jump is linear (XOR) in the state bits, so jumping a
+    ##  state 2**j steps is the XOR of table[j][k][byte k of it].
+
+    tpl_taps = fnc_compile_taps(int_bits,tpl_taps)[0]
+    tpl_key = (int_bits,tpl_taps)
+    if tpl_key in dict_JUMP_TABLES:
+        return dict_JUMP_TABLES[tpl_key]
+
+    int_slots = (int_bits + 7) // 8
+    obj_engine = LfsrEngine(int_bits,tpl_taps,1,False)
+
+    ##  Column i: where the single bit 1 << i ends up after 2**j
+    ##  steps. Start with j = 0 (one step) and square from there.
+    lst_columns = []
+    for int_i in range(int_bits):
+        obj_engine.int_state = 1 << int_i
+        lst_columns.append(obj_engine.jump(1))
+
+    lst_tables = []
+    for int_j in range(int_bits):
+        lst_slots = []
+        for int_k in range(int_slots):
+            lst_table = [0] * 256
+            for int_b in range(1,256):
+                int_low = (int_b & -int_b).bit_length() - 1
+                if 8 * int_k + int_low < int_bits:
+                    lst_table[int_b] = lst_table[int_b & (int_b - 1)] \
+                        ^ lst_columns[8 * int_k + int_low]
+                else:
+                    lst_table[int_b] = lst_table[int_b & (int_b - 1)]
+            lst_slots.append(lst_table)
+        lst_tables.append(lst_slots)
+        lst_columns = [fnc_table_step(int_column,lst_slots)
+                       for int_column in lst_columns]
+
+    if np is not None:
+        obj_tables = (lst_tables,np.array(lst_tables,dtype=np.uint64))
+    else:
+        obj_tables = (lst_tables,None)
+    dict_JUMP_TABLES[tpl_key] = obj_tables
+
+    return obj_tables
+
+
+######################################################
+######################################################
+
+def fnc_table_jump(int_state,int_steps,lst_tables):
+    ##  State "int_steps" steps after "int_state" (int_steps below
+    ##  2**n), one table jump per bit set in int_steps.
+
+    int_j = 0
+    while int_steps:
+        if int_steps & 1:
+            int_state = fnc_table_step(int_state,lst_tables[int_j])
+        int_steps >>= 1
+        int_j += 1
+
+    return int_state
+
+######################################################
+######################################################
+
+def fnc_table_jump_array(int_state,arr_steps,arr_tables):
+    ##  NumPy array: the state arr_steps[i] steps after "int_state",
+    ##  for every i at once.
+
+    arr_states = np.full(len(arr_steps),int_state,dtype=np.uint64)
+    for int_j in range(len(arr_tables)):
+        arr_pick = np.flatnonzero((arr_steps >> np.uint64(int_j))
+                                  & np.uint64(1))
+        if len(arr_pick) == 0:
+            continue
+        arr_old = arr_states[arr_pick]
+        arr_new = arr_tables[int_j,0][(arr_old & np.uint64(255))
+                                      .astype(np.intp)]
+        for int_k in range(1,arr_tables.shape[1]):
+            arr_new ^= arr_tables[int_j,int_k][
+                ((arr_old >> np.uint64(8 * int_k)) & np.uint64(255))
+                .astype(np.intp)]
+        arr_states[arr_pick] = arr_new
+
+    return arr_states
+
+######################################################
+######################################################
+
+def fnc_permutation_iter(int_n,seed=1,tpl_taps=None,int_start=0):
+    ##  Iterator over the values 0 .. int_n-1 in the random order of
+    ##  "LfsrPermutation(int_n,seed)", from place "int_start" on.
+
+    return LfsrPermutation(int_n,seed,tpl_taps).values(int_start)
+
+######################################################
+######################################################
+##                                                  ##
+##                  C L A S S E S                   ##
+##                                                  ##
+######################################################
+######################################################
+
+class LfsrPermutation:
+    ##  The values 0 .. int_n-1 in a random order fixed by the seed.
+    ##  Nothing but the seed and the jump tables is kept.
+    ##
+    ##  int_n     - how many values
+    ##  int_bits  - register width (see "fnc_permutation_bits()")
+    ##  int_seed  - state at place 0; any integer is brought into
+    ##              range the way "fnc_select_seed" does it
+    ##  int_stride - steps between places (int_stride_inverse
+    ##              undoes it, modulo the period)
+
+    def __init__(self,int_n,seed=1,tpl_taps=None):
+
+        self.int_n = int_n
+        self.int_bits = fnc_permutation_bits(int_n)
+        if not isinstance(seed,str):
+            seed = fnc_normalize_master_seed(seed,self.int_bits)
+        self.obj_engine = LfsrEngine(self.int_bits,tpl_taps,seed)
+        self.tpl_taps = self.obj_engine.tpl_taps
+        self.int_seed = self.obj_engine.int_state
+        self.int_period = self.obj_engine.int_mask
+        self.int_stride = fnc_permutation_stride(self.int_bits)
+        self.int_stride_inverse = pow(self.int_stride,-1,self.int_period)
+        self.lst_tables,self.arr_tables = \
+            fnc_jump_tables(self.int_bits,self.tpl_taps)
+
+    ##################################################
+
+    def __len__(self):
+        return self.int_n
+
+    ##################################################
+
+    def value(self,int_index):
+        ##  The value at place "int_index" (0 through int_n-1).
+
+        if int_index < 0 or int_index >= self.int_n:
+            raise ValueError("place must be 0 through " + str(self.int_n - 1))
+
+        int_value = int_index
+        while True:
+            int_value = self.state_at(int_value) - 1
+            if int_value < self.int_n:
+                return int_value
+
+    ##################################################
+
+    def index(self,int_value):
+        ##  The place of "int_value": value(index(v)) == v.
+
+        if int_value < 0 or int_value >= self.int_n:
+            raise ValueError("value must be 0 through " + str(self.int_n - 1))
+
+        int_index = int_value
+        while True:
+            int_index = fnc_lfsr_distance(self.int_seed,int_index + 1,
+                                          self.int_bits,self.tpl_taps) \
+                * self.int_stride_inverse % self.int_period
+            if int_index < self.int_n:
+                return int_index
+
+    ##################################################
+
+    def state_at(self,int_place):
+        ##  State at place "int_place": S(place * stride).
+
+        return fnc_table_jump(self.int_seed,
+                              int_place * self.int_stride % self.int_period,
+                              self.lst_tables)
+
+    ##################################################
+
+    def state_at_array(self,arr_places):
+        ##  "state_at()" for a whole array of places. Products
+        ##  that might not fit in 64 bits are done as Python integers.
+
+        if self.int_bits + self.int_stride.bit_length() <= 64:
+            arr_steps = arr_places * np.uint64(self.int_stride) \
+                % np.uint64(self.int_period)
+        else:
+            arr_steps = np.array([int_place * self.int_stride
+                                  % self.int_period
+                                  for int_place in arr_places.tolist()],
+                                 dtype=np.uint64)
+
+        return fnc_table_jump_array(self.int_seed,arr_steps,self.arr_tables)
+
+    ##################################################
+
+    def blocks(self,int_start=0):
+        ##  The values from place "int_start" on, as NumPy uint64
+        ##  arrays of up to int_PERMUTATION_BLOCK values each.
+
+        if np is None:
+            raise ImportError("blocks() needs NumPy")
+
+        int_n = self.int_n
+        int_stride = self.int_stride
+        obj_engine = LfsrEngine(self.int_bits,self.tpl_taps,
+                                self.state_at(int_start),False)
+        arr_buffer = None
+        int_position = int_start
+        while int_position < int_n:
+            int_block = min(int_PERMUTATION_BLOCK,int_n - int_position)
+            arr_values = np.empty(int_block,dtype=np.uint64)
+            arr_values[0] = obj_engine.int_state
+            if int_block > 1:
+                int_steps = (int_block - 1) * int_stride
+                if arr_buffer is None or len(arr_buffer) != int_steps:
+                    arr_buffer = np.empty(int_steps,dtype=np.uint64)
+                obj_engine.generate(int_steps,arr_buffer)
+                arr_values[1:] = arr_buffer[int_stride - 1::int_stride]
+            obj_engine.jump(int_stride)
+            arr_values -= np.uint64(1)
+
+            ##  Values that are too big walk on until they fit
+            arr_walking = np.flatnonzero(arr_values >= np.uint64(int_n))
+            while len(arr_walking):
+                arr_next = self.state_at_array(arr_values[arr_walking]) \
+                    - np.uint64(1)
+                arr_values[arr_walking] = arr_next
+                arr_walking = arr_walking[arr_next >= np.uint64(int_n)]
+
+            yield arr_values
+            int_position += int_block
+
+    ##################################################
+
+    def values(self,int_start=0):
+        ##  The values from place "int_start" on, one at a time.
+
+        if np is not None:
+            for arr_values in self.blocks(int_start):
+                yield from arr_values.tolist()
+            return
+
+        int_n = self.int_n
+        obj_engine = LfsrEngine(self.int_bits,self.tpl_taps,
+                                self.state_at(int_start),False)
+        for int_position in range(int_start,int_n):
+            int_value = obj_engine.int_state - 1
+            while int_value >= int_n:
+                int_value = self.state_at(int_value) - 1
+            yield int_value
+            obj_engine.jump(self.int_stride)
+
+    ##################################################
+
+    def __iter__(self):
+        return self.values()
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  A shuffled deck without a deck, and a look at how fast a
+    ##  3 billion value order comes out.
+
+    print("*******************************************************")
+    obj_order = LfsrPermutation(52,12345)
+    lst_cards = list(obj_order)
+    print("52 values:",lst_cards)
+    print("all there:",sorted(lst_cards) == list(range(52)))
+    print("place 10 holds",obj_order.value(10),
+          " value",lst_cards[10],"is at place",obj_order.index(lst_cards[10]))
+
+    int_n = 3000000000
+    obj_order = LfsrPermutation(int_n,2026)
+    print("*******************************************************")
+    print("%d values on a %d bit register" % (int_n,obj_order.int_bits))
+    int_count = 0
+    flt_start = time.perf_counter()
+    if np is not None:
+        for arr_values in obj_order.blocks():
+            int_count += len(arr_values)
+            if int_count >= 10 * int_PERMUTATION_BLOCK:
+                break
+    else:
+        for int_value in obj_order.values():
+            int_count += 1
+            if int_count >= 100000:
+                break
+    flt_seconds = time.perf_counter() - flt_start
+    print("first %d values: %.0f values/s" % (int_count,
+                                             int_count / flt_seconds))
+    print("place 2,999,999,999 holds",obj_order.value(int_n - 1))
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
@@ -0,0 +1,417 @@
+##  program name:
+##  "pseudo_random_poker.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  How often does each poker hand
+##  come up? Deal hundreds of
+##  millions of 5 card hands and
+##  count.
+##
+##  "fnc_deal_poker_hands" in the
+##  examples shows five cards at a
+##  time. This program shuffles
+##  whole batches of decks at once
+##  ("fnc_shuffled_shoes_array()"
+##  in "pseudo_random_cards.py"),
+##  deals ten hands from each deck
+##  the way that menu option does
+##  before it reshuffles, ranks
+##  every hand with table lookups
+##  and counts the categories.
+####################################
+##  RANKING A HAND
+##
+##  Every 5 card hand falls in one
+##  of 7462 classes, from 7-5-4-3-2
+##  (value 0) up to the royal flush
+##  (value 7461). The value only
+##  depends on
+##
+##  - the ranks, as the PRODUCT of
+##    one prime per rank (2 for
+##    deuces .. 41 for aces): equal
+##    products mean equal ranks,
+##    whatever the order; and
+##  - whether all five suits match,
+##    in which case the five ranks
+##    are all different and are
+##    looked up by their 13 bit
+##    mask instead.
+##
+##  Both tables are built the first
+##  time they are needed, by sorting
+##  every possible set of ranks (and
+##  kept in dict_POKER_TABLES). A
+##  batch of hands then takes a few
+##  array operations: multiply the
+##  primes, OR the rank bits, compare
+##  the suits, and one sorted-table
+##  search.
+####################################
+##  MANY PROCESSES
+##
+##  The hands are split into
+##  batches, and batch i draws from
+##  substream i of the master seed
+##  ("pseudo_random_substreams.py"),
+##  so no two batches can ever use
+##  the same stretch of the LFSR
+##  sequence, and the totals are
+##  the same for any number of
+##  worker processes.
+####################################
+
+import os
+import time
+from itertools import combinations
+from itertools import combinations_with_replacement
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; without it hands are dealt
+    np = None        ##  and ranked one at a time (much more slowly).
+
+from pseudo_random_cards import fnc_card_names
+from pseudo_random_cards import fnc_shuffled_shoe
+from pseudo_random_cards import fnc_shuffled_shoes_array
+from pseudo_random_cards import int_CARDS_PER_DECK
+from pseudo_random_cards import int_CARDS_PER_SUIT
+from pseudo_random_generator import LfsrGenerator
+from pseudo_random_substreams import fnc_substream_state
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+tpl_CATEGORY_NAMES = ("High card","One pair","Two pair","Three of a kind",
+                      "Straight","Flush","Full house","Four of a kind",
+                      "Straight flush","Royal flush")
+
+##  How many of the 2,598,960 possible hands fall in each
+##  category.
+tpl_CATEGORY_HANDS = (1302540,1098240,123552,54912,10200,5108,3744,624,
+                      36,4)
+int_ALL_HANDS = 2598960
+
+##  One prime per rank, deuce (rank 0) up to ace (rank 12).
+tpl_RANK_PRIMES = (2,3,5,7,11,13,17,19,23,29,31,37,41)
+
+##  Hands dealt from each shuffled deck before the next one.
+int_HANDS_PER_DECK = 10
+
+##  Decks shuffled per batch (and per substream).
+int_POKER_BATCH_DECKS = 1 << 14
+
+##  Ranking tables, built on first use.
+dict_POKER_TABLES = {}
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_card_rank(int_card):
+    ##  Poker rank of a card: 0 (deuce) through 12 (ace).
+
+    return (int_card % int_CARDS_PER_SUIT - 1) % int_CARDS_PER_SUIT
+
+######################################################
+######################################################
+
+def fnc_rank_class(lst_ranks,bool_flush):
+    ##  (category, tie-break) for five ranks; sorting these puts the
+    ##  hands in order of strength.
+
+    lst_counts = [0] * 13
+    for int_rank in lst_ranks:
+        lst_counts[int_rank] += 1
+    tpl_order = tuple(sorted(lst_ranks,key=lambda int_rank:
+                             (lst_counts[int_rank],int_rank),reverse=True))
+    tpl_shape = tuple(sorted((int_count for int_count in lst_counts
+                              if int_count),reverse=True))
+
+    int_top = None                          ##  Highest card of a straight
+    if tpl_shape == (1,1,1,1,1):
+        if tpl_order[0] - tpl_order[4] == 4:
+            int_top = tpl_order[0]
+        elif tpl_order == (12,3,2,1,0):     ##  A-2-3-4-5, the "wheel"
+            int_top = 3
+
+    if int_top is not None:
+        if bool_flush:
+            return (9 if int_top == 12 else 8,(int_top,))
+        return (4,(int_top,))
+    if bool_flush:
+        return (5,tpl_order)
+
+    return ({(1,1,1,1,1): 0,(2,1,1,1): 1,(2,2,1): 2,(3,1,1): 3,
+             (3,2): 6,(4,1): 7}[tpl_shape],tpl_order)
+
+######################################################
+######################################################
+
+def fnc_poker_tables():
+    ##  The ranking tables:
+    ##
+    ##    "product"     prime product -> value (no flush)
+    ##    "flush"       13 bit rank mask -> value (flush)
+    ##    "category"    value -> category, one per value
+    ##
+    ##  plus with NumPy "arr_products" (sorted) and
+    ##  "arr_product_values" for "searchsorted()", "arr_flush"
+    ##  (8192 values, -1 where five bits are not set) and
+    ##  "arr_category".
+
+    if dict_POKER_TABLES:
+        return dict_POKER_TABLES
+
+    lst_classes = []
+    for tpl_ranks in combinations_with_replacement(range(13),5):
+        if any(tpl_ranks.count(int_rank) == 5 for int_rank in tpl_ranks):
+            continue
+        lst_classes.append((fnc_rank_class(tpl_ranks,False),tpl_ranks,False))
+        if len(set(tpl_ranks)) == 5:
+            lst_classes.append((fnc_rank_class(tpl_ranks,True),tpl_ranks,
+                                True))
+    lst_classes.sort()
+
+    dict_product = {}
+    dict_flush = {}
+    lst_category = []
+    for int_value,(tpl_class,tpl_ranks,bool_flush) in enumerate(lst_classes):
+        lst_category.append(tpl_class[0])
+        if bool_flush:
+            dict_flush[sum(1 << int_rank for int_rank in tpl_ranks)] = \
+                int_value
+        else:
+            int_product = 1
+            for int_rank in tpl_ranks:
+                int_product *= tpl_RANK_PRIMES[int_rank]
+            dict_product[int_product] = int_value
+
+    dict_POKER_TABLES["product"] = dict_product
+    dict_POKER_TABLES["flush"] = dict_flush
+    dict_POKER_TABLES["category"] = lst_category
+    if np is not None:
+        arr_products = np.array(sorted(dict_product),dtype=np.int64)
+        dict_POKER_TABLES["arr_products"] = arr_products
+        dict_POKER_TABLES["arr_product_values"] = np.array(
+            [dict_product[int_product]
+             for int_product in arr_products.tolist()],dtype=np.int16)
+        arr_flush = np.full(1 << 13,-1,dtype=np.int16)
+        arr_flush[list(dict_flush)] = list(dict_flush.values())
+        dict_POKER_TABLES["arr_flush"] = arr_flush
+        dict_POKER_TABLES["arr_category"] = np.array(lst_category,
+                                                     dtype=np.uint8)
+
+    return dict_POKER_TABLES
+
+######################################################
+######################################################
+
+def fnc_hand_value(cards):
+    ##  Strength of five cards (0 through 51): 0 for 7-5-4-3-2 up to
+    ##  7461 for a royal flush.
+
+    dict_tables = fnc_poker_tables()
+    int_product = 1
+    int_mask = 0
+    set_suits = set()
+    for int_card in cards:
+        int_rank = fnc_card_rank(int_card)
+        int_product *= tpl_RANK_PRIMES[int_rank]
+        int_mask |= 1 << int_rank
+        set_suits.add(int_card // int_CARDS_PER_SUIT)
+
+    if len(set_suits) == 1:
+        return dict_tables["flush"][int_mask]
+
+    return dict_tables["product"][int_product]
+
+######################################################
+######################################################
+
+def fnc_hand_category(cards):
+    ##  Category of five cards: an index into tpl_CATEGORY_NAMES.
+
+    return fnc_poker_tables()["category"][fnc_hand_value(cards)]
+
+######################################################
+######################################################
+
+def fnc_hand_values_array(arr_hands):
+    ##  NumPy int16 array of hand values for an array of shape
+    ##  (hands, 5) of cards.
+
+    if np is None:
+        raise ImportError("fnc_hand_values_array() needs NumPy")
+
+    dict_tables = fnc_poker_tables()
+    arr_hands = np.asarray(arr_hands)
+    arr_ranks = (arr_hands % int_CARDS_PER_SUIT).astype(np.int64)
+    arr_ranks = (arr_ranks + (int_CARDS_PER_SUIT - 1)) % int_CARDS_PER_SUIT
+    arr_suits = arr_hands // int_CARDS_PER_SUIT
+
+    arr_product = np.array(tpl_RANK_PRIMES,dtype=np.int64)[arr_ranks] \
+        .prod(axis=1)
+    arr_flush = (arr_suits == arr_suits[:,:1]).all(axis=1)
+    arr_values = dict_tables["arr_product_values"][
+        np.searchsorted(dict_tables["arr_products"],arr_product)
+        .clip(0,len(dict_tables["arr_products"]) - 1)]
+    arr_flush_hands = np.flatnonzero(arr_flush)
+    if len(arr_flush_hands):
+        arr_mask = np.bitwise_or.reduce(
+            np.left_shift(1,arr_ranks[arr_flush_hands]),axis=1)
+        arr_values[arr_flush_hands] = dict_tables["arr_flush"][arr_mask]
+
+    return arr_values
+
+######################################################
+######################################################
+
+def fnc_hand_categories_array(arr_hands):
+    ##  NumPy uint8 array of categories for an array of shape
+    ##  (hands, 5) of cards.
+
+    return fnc_poker_tables()["arr_category"][fnc_hand_values_array(arr_hands)]
+
+######################################################
+######################################################
+
+def fnc_deal_hands_array(obj_random,int_decks):
+    ##  NumPy uint8 array of shape (int_decks * 10, 5): ten hands
+    ##  off the top of each of "int_decks" shuffled decks.
+
+    arr_decks = fnc_shuffled_shoes_array(obj_random,int_decks)
+    int_dealt = int_HANDS_PER_DECK * 5
+
+    return arr_decks[:,:int_dealt].reshape(int_decks * int_HANDS_PER_DECK,5)
+
+######################################################
+######################################################
+
+def fnc_simulate_batch(int_master_seed,int_batches,int_index,int_decks):
+    ##  Worker: deal and rank the hands of batch "int_index" from
+    ##  its own substream, and return (index, category counts).
+
+    obj_random = LfsrGenerator(61,None,fnc_substream_state(int_master_seed,
+                                                           int_batches,
+                                                           int_index))
+    lst_counts = [0] * len(tpl_CATEGORY_NAMES)
+    if np is not None:
+        arr_categories = fnc_hand_categories_array(
+            fnc_deal_hands_array(obj_random,int_decks))
+        lst_counts = np.bincount(arr_categories,
+                                 minlength=len(tpl_CATEGORY_NAMES)).tolist()
+    else:
+        for int_deck in range(int_decks):
+            arr_deck = fnc_shuffled_shoe(obj_random)
+            for int_hand in range(int_HANDS_PER_DECK):
+                lst_counts[fnc_hand_category(
+                    arr_deck[5 * int_hand:5 * int_hand + 5])] += 1
+
+    return (int_index,lst_counts)
+
+######################################################
+######################################################
+
+def fnc_simulate_poker(int_hands,int_master_seed=2026,int_workers=None,
+                       int_batch_decks=int_POKER_BATCH_DECKS,
+                       bool_verbose=True):
+    ##  Deal about "int_hands" hands (rounded up to whole batches)
+    ##  on "int_workers" processes (default: every core) and return
+    ##
+    ##    (category counts, hands dealt, hands per second)
+    ##
+    ##  The counts only depend on the master seed, the number of
+    ##  hands and the batch size.
+
+    if int_workers is None:
+        int_workers = os.cpu_count() or 1
+    int_batch_hands = int_batch_decks * int_HANDS_PER_DECK
+    int_batches = max(1,-(-int_hands // int_batch_hands))
+
+    lst_counts = [0] * len(tpl_CATEGORY_NAMES)
+    int_done = 0
+    flt_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=int_workers) as obj_pool:
+        lst_futures = [obj_pool.submit(fnc_simulate_batch,int_master_seed,
+                                       int_batches,int_index,int_batch_decks)
+                       for int_index in range(int_batches)]
+        for obj_future in as_completed(lst_futures):
+            int_index,lst_batch = obj_future.result()
+            lst_counts = [int_a + int_b
+                          for int_a,int_b in zip(lst_counts,lst_batch)]
+            int_done += 1
+            if bool_verbose:
+                flt_seconds = time.perf_counter() - flt_start
+                print("batch %d done, %d of %d  %.0f hands/s"
+                      % (int_index,int_done,int_batches,
+                         int_done * int_batch_hands / flt_seconds))
+    flt_seconds = time.perf_counter() - flt_start
+    int_dealt = int_batches * int_batch_hands
+
+    return (lst_counts,int_dealt,int_dealt / flt_seconds)
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  Check the ranking against all 2,598,960 hands, then deal a
+    ##  few million and compare the counts with the exact odds.
+
+    print("*******************************************************")
+    obj_random = LfsrGenerator(61,None,2026)
+    arr_deck = fnc_shuffled_shoe(obj_random)
+    print("One hand:",", ".join(str_name.strip() for str_name
+                                in fnc_card_names(arr_deck[:5])),
+          " ->",tpl_CATEGORY_NAMES[fnc_hand_category(arr_deck[:5])])
+
+    if np is not None:
+        flt_start = time.perf_counter()
+        arr_all = np.array(list(combinations(range(int_CARDS_PER_DECK),5)),
+                           dtype=np.uint8)
+        lst_exact = np.bincount(fnc_hand_categories_array(arr_all),
+                                minlength=len(tpl_CATEGORY_NAMES)).tolist()
+        print("all %d hands ranked in %.1f s: %s"
+              % (len(arr_all),time.perf_counter() - flt_start,
+                 "counts match" if tuple(lst_exact) == tpl_CATEGORY_HANDS
+                 else "COUNTS DO NOT MATCH"))
+
+    print("*******************************************************")
+    int_hands = 4000000 if np is not None else 20000
+    lst_counts,int_dealt,flt_rate = fnc_simulate_poker(
+        int_hands,int_batch_decks=int_POKER_BATCH_DECKS if np is not None
+        else 200,bool_verbose=False)
+    print("%d hands dealt, %.0f hands/s" % (int_dealt,flt_rate))
+    print("%-16s %12s %12s %12s" % ("","dealt","share","exact"))
+    for int_i,str_name in enumerate(tpl_CATEGORY_NAMES):
+        print("%-16s %12d %12.6f %12.6f"
+              % (str_name,lst_counts[int_i],lst_counts[int_i] / int_dealt,
+                 tpl_CATEGORY_HANDS[int_i] / int_ALL_HANDS))
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
@@ -0,0 +1,274 @@
+##  program name:
+##  "pseudo_random_primitive.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Checks that a tap set really
+##  gives a MAXIMAL-LENGTH register.
+##
+##  The greeting of every "simple"
+##  program promises that each value
+##  1 through (2**n)-1 turns up once
+##  and only once. That is true
+##  exactly when the feedback
+##  polynomial P(x) is PRIMITIVE,
+##  which is the same as x having
+##  order (2**n)-1 modulo P(x):
+##
+##    x**((2**n)-1)     == 1
+##    x**(((2**n)-1)/q) != 1
+##
+##  for every prime factor q of
+##  (2**n)-1. That takes a handful
+##  of modular powers (see
+##  "pseudo_random_gf2.py") and one
+##  factorization, which is cached,
+##  so a tap set is checked in a few
+##  milliseconds instead of by
+##  walking all (2**n)-1 states.
+##
+##  "pseudo_random_lfsr_engine.py"
+##  runs this on every width of its
+##  tap table when it is imported
+##  and on any taps a user supplies.
+##
+##  Checking the table this way
+##  turned up one bad entry: the 16
+##  bit line "0, 1, 3, 8" only gives
+##  a cycle of 8,001 states from
+##  seed 1. "0, 1, 3, 12" is the
+##  maximal tap set it was meant to
+##  be.
+####################################
+
+import math
+import time
+
+from pseudo_random_gf2 import fnc_feedback_polynomial
+from pseudo_random_gf2 import fnc_x_to_the_n_mod
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Miller-Rabin with these bases is exact for every number
+##  below 3.3 * 10**24, far beyond (2**65)-1.
+tpl_PRIME_TEST_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+##  (2**n)-1 -> {prime: exponent}
+dict_FACTORIZATIONS = {}
+
+##  (width, sorted taps) -> True if the register is maximal-length
+dict_MAXIMAL_TAPS = {}
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_is_prime(int_n):
+    ##  Miller-Rabin test, exact for the sizes used here.
+
+    if int_n < 2:
+        return False
+    for int_p in tpl_PRIME_TEST_BASES:
+        if int_n % int_p == 0:
+            return int_n == int_p
+
+    int_d = int_n - 1
+    int_s = 0
+    while int_d % 2 == 0:
+        int_d //= 2
+        int_s += 1
+
+    for int_a in tpl_PRIME_TEST_BASES:
+        int_x = pow(int_a,int_d,int_n)
+        if int_x == 1 or int_x == int_n - 1:
+            continue
+        for int_i in range(int_s - 1):
+            int_x = int_x * int_x % int_n
+            if int_x == int_n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+######################################################
+######################################################
+
+def fnc_pollard_rho(int_n):
+    ##  Find a non-trivial factor of the composite "int_n" with
+    ##  Pollard's rho method (Brent's cycle finding).
+
+    if int_n % 2 == 0:
+        return 2
+
+    int_c = 1
+    while True:
+        int_y = 2
+        int_r = 1
+        int_q = 1
+        int_g = 1
+        while int_g == 1:
+            int_x = int_y
+            for int_i in range(int_r):
+                int_y = (int_y * int_y + int_c) % int_n
+            int_k = 0
+            while int_k < int_r and int_g == 1:
+                int_ys = int_y
+                for int_i in range(min(128,int_r - int_k)):
+                    int_y = (int_y * int_y + int_c) % int_n
+                    int_q = int_q * abs(int_x - int_y) % int_n
+                int_g = math.gcd(int_q,int_n)
+                int_k += 128
+            int_r *= 2
+
+        if int_g == int_n:  ##  Overshot; back up one step at a time
+            int_g = 1
+            while int_g == 1:
+                int_ys = (int_ys * int_ys + int_c) % int_n
+                int_g = math.gcd(abs(int_x - int_ys),int_n)
+
+        if int_g != int_n:
+            return int_g
+        int_c += 1          ##  Unlucky constant, try the next one
+
+######################################################
+######################################################
+
+def fnc_factorize(int_n):
+    ##  Prime factorization as {prime: exponent}.
+
+    dict_factors = {}
+    lst_work = [int_n]
+    while lst_work:
+        int_m = lst_work.pop()
+        if int_m == 1:
+            continue
+        if fnc_is_prime(int_m):
+            dict_factors[int_m] = dict_factors.get(int_m,0) + 1
+            continue
+        int_f = fnc_pollard_rho(int_m)
+        lst_work += [int_f,int_m // int_f]
+
+    return dict(sorted(dict_factors.items()))
+
+######################################################
+######################################################
+
+def fnc_period_factorization(int_bits):
+    ##  Cached factorization of (2**n)-1, the period of a maximal
+    ##  n bit register.
+
+    int_period = (1 << int_bits) - 1
+    if int_period not in dict_FACTORIZATIONS:
+        dict_FACTORIZATIONS[int_period] = fnc_factorize(int_period)
+
+    return dict_FACTORIZATIONS[int_period]
+
+######################################################
+######################################################
+
+def fnc_x_is_generator(int_poly):
+    ##  True when x has the full order (2**n)-1 modulo P(x), i.e.
+    ##  P(x) is primitive and the register is maximal-length:
+    ##  x**((2**n)-1) must be 1 but x**(((2**n)-1)/q) must not be
+    ##  for any prime factor q.
+
+    int_bits = int_poly.bit_length() - 1
+    int_period = (1 << int_bits) - 1
+    if fnc_x_to_the_n_mod(int_period,int_poly) != 1:
+        return False
+    for int_q in fnc_period_factorization(int_bits):
+        if fnc_x_to_the_n_mod(int_period // int_q,int_poly) == 1:
+            return False
+
+    return True
+
+######################################################
+######################################################
+
+def fnc_taps_are_maximal(int_bits,tpl_taps):
+    ##  True when an n bit register with these tap POSITIONS runs
+    ##  through all (2**n)-1 non-zero states. Cached per tap set.
+
+    tpl_key = (int_bits,tuple(sorted(tpl_taps)))
+    if tpl_key not in dict_MAXIMAL_TAPS:
+        if int_bits < 2 or 0 not in tpl_key[1] \
+                or max(tpl_key[1]) >= int_bits:
+            dict_MAXIMAL_TAPS[tpl_key] = False
+        else:
+            dict_MAXIMAL_TAPS[tpl_key] = fnc_x_is_generator(
+                fnc_feedback_polynomial(int_bits,tpl_key[1]))
+
+    return dict_MAXIMAL_TAPS[tpl_key]
+
+######################################################
+######################################################
+
+def fnc_check_maximal_taps(int_bits,tpl_taps):
+    ##  Raise ValueError unless the tap set is maximal-length.
+
+    if not fnc_taps_are_maximal(int_bits,tpl_taps):
+        raise ValueError("taps " + str(tuple(sorted(tpl_taps)))
+                         + " do not give a maximal-length "
+                         + str(int_bits) + " bit register (not every value"
+                         " 1 through " + str((1 << int_bits) - 1)
+                         + " would appear)")
+
+######################################################
+######################################################
+
+def fnc_verify_tap_table(dict_table):
+    ##  Widths in a {width: taps} table whose taps are NOT
+    ##  maximal-length (an empty list when the table is sound).
+
+    return [int_bits for int_bits,tpl_taps in sorted(dict_table.items())
+            if not fnc_taps_are_maximal(int_bits,tpl_taps)]
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  Check the engine's table and the simple programs' taps
+    ##  and show how long each check took.
+
+    from pseudo_random_lfsr_engine import dict_LFSR_TAP_TABLE
+    from pseudo_random_lfsr_engine import dict_SIMPLE_PROGRAM_TAPS
+
+    print("*******************************************************")
+    for str_name,dict_table in (("tap table",dict_LFSR_TAP_TABLE),
+                                ("simple programs",dict_SIMPLE_PROGRAM_TAPS)):
+        for int_bits,tpl_taps in sorted(dict_table.items()):
+            dict_MAXIMAL_TAPS.pop((int_bits,tuple(sorted(tpl_taps))),None)
+            flt_start = time.perf_counter()
+            bool_maximal = fnc_taps_are_maximal(int_bits,tpl_taps)
+            flt_seconds = time.perf_counter() - flt_start
+            print("%-15s %2d bits %-24s %-11s %7.3f ms"
+                  % (str_name,int_bits,str(tpl_taps),
+                     "maximal" if bool_maximal else "NOT MAXIMAL",
+                     1000 * flt_seconds))
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
@@ -0,0 +1,333 @@
+##  program name:
+##  "pseudo_random_segmented_period.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Full-period walk for the wide
+##  registers (37 bits and up),
+##  spread over every core.
+##
+##  A bitmap of 2**37 states would
+##  be 16 GiB, and one core would
+##  need days to walk that far. But
+##  no bitmap is needed at all:
+##  stepping a register (with
+##  position 0 tapped) can always
+##  be undone, so the sequence from
+##  the seed is one closed loop and
+##  the first state to come round
+##  again is the seed itself. So
+##
+##    the seed does not come back
+##    in steps 1 .. (2**n)-2
+##  AND
+##    it is back at step (2**n)-1
+##
+##  means the loop holds every one
+##  of the (2**n)-1 non-zero states.
+##
+##  The walk is cut into segments.
+##  The start of every segment is
+##  found with "jump()" and each one
+##  is walked by its own worker
+##  process (ProcessPoolExecutor),
+##  watching for the seed. Segments
+##  are independent, so the walk
+##  speeds up in step with the
+##  number of cores.
+##
+##  The state a segment ENDS on was
+##  found by walking; the state the
+##  next segment STARTS on was found
+##  by jumping. The two must agree,
+##  which checks the walk and the
+##  jump against each other at every
+##  seam (and the last segment must
+##  end on the seed).
+##
+##  Every finished segment is
+##  written to a checkpoint file
+##  straight away, so after an
+##  interruption only the unfinished
+##  segments are walked again. The
+##  checkpoint keeps the number of
+##  segments too, and a resumed run
+##  cuts the walk the same way even
+##  on a machine with a different
+##  number of cores.
+####################################
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+try:
+    import numpy as np
+except ImportError:  ##  NumPy is optional; without it segments are
+    np = None        ##  walked with "next_n()" (much more slowly).
+
+from pseudo_random_lfsr_engine import LfsrEngine
+from pseudo_random_lfsr_engine import dict_SIMPLE_PROGRAM_TAPS
+from pseudo_random_lfsr_engine import fnc_compile_taps
+
+######################################################
+######################################################
+##                                                  ##
+##                C O N S T A N T S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+##  Longest segment handed to one worker in one go. Smaller
+##  segments mean less work lost when a run is interrupted.
+int_MAX_SEGMENT_STATES = 1 << 30
+
+##  At least this many segments per worker, so that a slow
+##  worker does not hold up the end of the run.
+int_SEGMENTS_PER_WORKER = 4
+
+##  States generated per block inside a segment.
+int_SEGMENT_BLOCK = 1 << 22
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_segment_checkpoint_path(int_bits,tpl_taps=None,str_directory="."):
+    ##  Checkpoint file for this width and tap set.
+
+    tpl_taps = fnc_compile_taps(int_bits,tpl_taps)[0]
+    return os.path.join(str_directory,"pseudo_random_" + str(int_bits)
+                        + "_taps_"
+                        + "_".join(str(int_tap) for int_tap in tpl_taps)
+                        + "_segments.checkpoint")
+
+######################################################
+######################################################
+
+def fnc_segment_bounds(int_period,int_segments):
+    ##  Positions where the segments start, plus the period at the
+    ##  end: segment i covers positions bounds[i]+1 .. bounds[i+1].
+
+    return [int_i * int_period // int_segments
+            for int_i in range(int_segments + 1)]
+
+######################################################
+######################################################
+
+def fnc_walk_segment(int_bits,tpl_taps,int_seed,int_index,
+                     int_start_position,int_end_position):
+    ##  Worker: jump to the start of the segment, walk it, and
+    ##  return
+    ##
+    ##    (index, start state, end state, first seed position)
+    ##
+    ##  where the seed position is None if the seed did not turn up
+    ##  (other than at the very end of the whole period, which is
+    ##  where it belongs). The segment is walked to its end either
+    ##  way so its end state can still be checked against the next.
+
+    obj_engine = LfsrEngine(int_bits,tpl_taps,int_seed,False)
+    int_start_state = obj_engine.jump(int_start_position)
+    int_period = obj_engine.int_mask
+
+    int_position = int_start_position
+    int_seed_position = None
+    arr_buffer = None
+    while int_position < int_end_position:
+        int_block = min(int_SEGMENT_BLOCK,int_end_position - int_position)
+        if np is not None:
+            if arr_buffer is None or len(arr_buffer) != int_block:
+                arr_buffer = np.empty(int_block,dtype=np.uint64)
+            obj_engine.generate(int_block,arr_buffer)
+            arr_back = np.flatnonzero(arr_buffer == int_seed)
+            if len(arr_back) and int_seed_position is None:
+                int_seed_position = int_position + 1 + int(arr_back[0])
+        else:
+            lst_states = obj_engine.next_n(int_block)
+            if int_seed in lst_states and int_seed_position is None:
+                int_seed_position = int_position + 1 \
+                    + lst_states.index(int_seed)
+        int_position += int_block
+
+    if int_seed_position == int_period:
+        int_seed_position = None
+
+    return (int_index,int_start_state,obj_engine.int_state,int_seed_position)
+
+######################################################
+######################################################
+
+def fnc_read_segment_checkpoint(str_path,str_run):
+    ##  (segment count, {index: (start state, end state, seed
+    ##  position)} for the segments already walked), or (None, {})
+    ##  if the checkpoint is missing or belongs to a different run.
+
+    dict_done = {}
+    if not os.path.exists(str_path):
+        return (None,dict_done)
+
+    with open(str_path) as obj_file:
+        str_run_read,str_sep,str_segments = \
+            obj_file.readline().rstrip("\n").partition(" segments ")
+        if str_run_read != str_run or not str_segments.isdigit():
+            return (None,dict_done)
+        for str_line in obj_file:
+            lst_fields = str_line.split()
+            if len(lst_fields) != 4:
+                continue              ##  Half-written last line
+            int_seed_position = None if lst_fields[3] == "-" \
+                else int(lst_fields[3])
+            dict_done[int(lst_fields[0])] = (int(lst_fields[1]),
+                                             int(lst_fields[2]),
+                                             int_seed_position)
+
+    return (int(str_segments),dict_done)
+
+######################################################
+######################################################
+
+def fnc_verify_period_segmented(int_bits,tpl_taps=None,seed=1,
+                                int_workers=None,int_segments=None,
+                                str_directory=".",bool_verbose=True):
+    ##  Walk the full period of the register on "int_workers"
+    ##  processes (default: every core) and return
+    ##
+    ##    (True,  (2**n)-1)          full period
+    ##    (False, cycle length)      the seed came back early
+    ##
+    ##  Raises AssertionError if a walked segment end does not meet
+    ##  the jumped start of the next segment. Picks up from the
+    ##  checkpoint file left by an interrupted run with the same
+    ##  seed, with that run's segment count unless "int_segments"
+    ##  asks for a different one; the file is removed at the end.
+
+    obj_engine = LfsrEngine(int_bits,tpl_taps,seed,False)
+    tpl_taps = obj_engine.tpl_taps
+    int_seed = obj_engine.int_state
+    int_period = obj_engine.int_mask
+
+    str_path = fnc_segment_checkpoint_path(int_bits,tpl_taps,str_directory)
+    str_run = "bits %d taps %s seed %d" \
+        % (int_bits,",".join(str(int_tap) for int_tap in tpl_taps),int_seed)
+    int_saved_segments,dict_done = fnc_read_segment_checkpoint(str_path,
+                                                               str_run)
+
+    if int_workers is None:
+        int_workers = os.cpu_count() or 1
+    if int_segments is None:
+        ##  The default depends on the core count, so a resumed run
+        ##  keeps the count it was started with.
+        int_segments = int_saved_segments or \
+            max(int_workers * int_SEGMENTS_PER_WORKER,
+                -(-int_period // int_MAX_SEGMENT_STATES))
+    int_segments = min(int_segments,int_period)
+    lst_bounds = fnc_segment_bounds(int_period,int_segments)
+
+    if int_segments != int_saved_segments:
+        dict_done = {}
+    if bool_verbose and dict_done:
+        print("resuming: %d of %d segments already walked"
+              % (len(dict_done),int_segments))
+    if not dict_done:
+        with open(str_path,"w") as obj_file:
+            obj_file.write(str_run + " segments %d\n" % int_segments)
+
+    flt_start = time.perf_counter()
+    int_walked = 0
+    int_to_walk = sum(lst_bounds[int_i + 1] - lst_bounds[int_i]
+                      for int_i in range(int_segments)
+                      if int_i not in dict_done)
+    with open(str_path,"a") as obj_checkpoint, \
+         ProcessPoolExecutor(max_workers=int_workers) as obj_pool:
+        lst_futures = [obj_pool.submit(fnc_walk_segment,int_bits,tpl_taps,
+                                       int_seed,int_i,lst_bounds[int_i],
+                                       lst_bounds[int_i + 1])
+                       for int_i in range(int_segments)
+                       if int_i not in dict_done]
+        for obj_future in as_completed(lst_futures):
+            int_i,int_start_state,int_end_state,int_seed_position = \
+                obj_future.result()
+            dict_done[int_i] = (int_start_state,int_end_state,
+                                int_seed_position)
+            obj_checkpoint.write("%d %d %d %s\n"
+                                 % (int_i,int_start_state,int_end_state,
+                                    "-" if int_seed_position is None
+                                    else str(int_seed_position)))
+            obj_checkpoint.flush()
+            os.fsync(obj_checkpoint.fileno())
+
+            int_walked += lst_bounds[int_i + 1] - lst_bounds[int_i]
+            if bool_verbose:
+                flt_seconds = time.perf_counter() - flt_start
+                print("%d bits: segment %d done, %d of %d segments"
+                      "  %.0f states/s  about %.0f s to go"
+                      % (int_bits,int_i,len(dict_done),int_segments,
+                         int_walked / flt_seconds,
+                         flt_seconds * (int_to_walk - int_walked)
+                         / int_walked))
+
+    ##  Seams: walked end of segment i == jumped start of i+1 and,
+    ##  unless the seed came back early, the walk ends on the seed.
+    lst_returns = [dict_done[int_i][2] for int_i in range(int_segments)
+                   if dict_done[int_i][2] is not None]
+    int_cycle = min(lst_returns) if lst_returns else int_period
+    for int_i in range(int_segments):
+        int_end_state = dict_done[int_i][1]
+        if int_i + 1 < int_segments:
+            int_next_start = dict_done[int_i + 1][0]
+        elif lst_returns:
+            break
+        else:
+            int_next_start = int_seed
+        if int_end_state != int_next_start:
+            raise AssertionError("segment " + str(int_i) + " ends on "
+                                 + str(int_end_state)
+                                 + " but the next one starts on "
+                                 + str(int_next_start))
+
+    os.remove(str_path)
+
+    bool_full = int_cycle == int_period
+    if bool_verbose:
+        print("%d bits, taps %s: cycle of %d states, %s (%.1f s on %d"
+              " workers)" % (int_bits,str(tpl_taps),int_cycle,
+                             "FULL PERIOD" if bool_full
+                             else "NOT FULL PERIOD",
+                             time.perf_counter() - flt_start,int_workers))
+
+    return (bool_full,int_cycle)
+
+######################################################
+######################################################
+##                                                  ##
+##             M A I N   P R O G R A M              ##
+##                                                  ##
+######################################################
+######################################################
+
+def main():
+    ##  A quick 28 bit run to show it working. The 37 bit walk of
+    ##  the simple program is left to be asked for by hand:
+    ##
+    ##    fnc_verify_period_segmented(37,dict_SIMPLE_PROGRAM_TAPS[37])
+
+    print("*******************************************************")
+    fnc_verify_period_segmented(28)
+    fnc_verify_period_segmented(16,dict_SIMPLE_PROGRAM_TAPS[16])
+
+if __name__ == "__main__":
+    main()
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################
@@ -0,0 +1,129 @@
+##  program name:
+##  "pseudo_random_substreams.py"
+##  language: Python 3
+##  2026-10-16
+###################################
+##  Non-overlapping substreams for
+##  running one LFSR sequence on
+##  many worker processes.
+##
+##  Seeding every worker from the
+##  clock (like "fnc_select_seed"
+##  does) gives no promise at all
+##  that two workers will not walk
+##  over the same part of the
+##  sequence.
+##
+##  Instead, ONE master seed and a
+##  stream count k split the full
+##  cycle of (2**n)-1 states into k
+##  equal stretches:
+##
+##    stream i starts at the state
+##    i * (period // k) steps after
+##    the master seed
+##
+##  and each start is found with
+##  "jump()" in about log2(period)
+##  steps. As long as no worker
+##  draws more than period // k
+##  values the streams can never
+##  overlap.
+##
+##  Stream i only depends on the
+##  master seed, k and i -- never on
+##  how many workers are running or
+##  in which order they ask -- so a
+##  worker can compute its own
+##  start with
+##  "fnc_substream_state()" and
+##  results can be reproduced later
+##  with any number of workers.
+####################################
+
+from pseudo_random_lfsr_engine import LfsrEngine
+
+######################################################
+######################################################
+##                                                  ##
+##                F U N C T I O N S                 ##
+##                                                  ##
+######################################################
+######################################################
+
+def fnc_normalize_master_seed(int_master_seed,int_bits):
+    ##  Force any integer into the range 1 through (2**n)-1 the same
+    ##  way "fnc_select_seed" does with what the user typed in:
+    ##  subtract 1, find modulo (2**n)-1, then add 1.
+
+    int_period = (1 << int_bits) - 1
+    return 1 + ((int_master_seed - 1) % int_period)
+
+######################################################
+######################################################
+
+def fnc_substream_spacing(int_streams,int_bits=61):
+    ##  Number of states between the starts of neighbouring
+    ##  streams. Each stream may safely draw this many values.
+
+    if int_streams < 1:
+        raise ValueError("need at least one stream")
+
+    int_period = (1 << int_bits) - 1
+    if int_streams > int_period:
+        raise ValueError("more streams than states in a "
+                         + str(int_bits) + " bit register")
+
+    return int_period // int_streams
+
+######################################################
+######################################################
+
+def fnc_substream_state(int_master_seed,int_streams,int_index,
+                        int_bits=61,tpl_taps=None):
+    ##  Starting state of stream "int_index" (0 through k-1) out of
+    ##  "int_streams" streams, computed on its own in O(log period).
+
+    if int_index < 0 or int_index >= int_streams:
+        raise ValueError("stream index must be 0 through "
+                         + str(int_streams - 1))
+
+    int_spacing = fnc_substream_spacing(int_streams,int_bits)
+    obj_engine = LfsrEngine(int_bits,tpl_taps,
+                            fnc_normalize_master_seed(int_master_seed,
+                                                      int_bits))
+
+    return obj_engine.jump(int_index * int_spacing)
+
+######################################################
+######################################################
+
+def fnc_substream_states(int_master_seed,int_streams,
+                         int_bits=61,tpl_taps=None):
+    ##  Starting states of all "int_streams" streams, in order.
+    ##  Item i is the same value "fnc_substream_state()" gives for
+    ##  stream i.
+
+    return [fnc_substream_state(int_master_seed,int_streams,int_index,
+                                int_bits,tpl_taps)
+            for int_index in range(int_streams)]
+
+######################################################
+######################################################
+
+def fnc_substream_engines(int_master_seed,int_streams,
+                          int_bits=61,tpl_taps=None):
+    ##  Ready-to-use engines, one per stream.
+
+    return [LfsrEngine(int_bits,tpl_taps,int_state)
+            for int_state in fnc_substream_states(int_master_seed,
+                                                  int_streams,
+                                                  int_bits,tpl_taps)]
+
+######################################################
+######################################################
+##                                                  ##
+##      T H A T ' S   A L L ,   F O L K S !         ##
+##                                                  ##
+######################################################
+######################################################